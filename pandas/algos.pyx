@@ -2103,6 +2103,62 @@ def groupsort_indexer(ndarray[int64_t] index, Py_ssize_t ngroups):
 
     return result, counts
 
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_shift_indexer(ndarray[int64_t] labels, Py_ssize_t ngroups,
+                        int periods):
+    '''
+    Indexer such that result[i] is the position of the row `periods` rows
+    earlier within the same group as row i, or -1 if there is none (or if
+    row i is not in any group). A negative `periods` looks forward.
+    '''
+    cdef:
+        Py_ssize_t N, i, j, ii, offset, lab, idxer_slot
+        int64_t sign
+        ndarray[int64_t] out, label_seen
+        ndarray[int64_t, ndim=2] label_indexer
+
+    N = len(labels)
+    out = np.empty(N, dtype=np.int64)
+
+    if periods == 0:
+        for i from 0 <= i < N:
+            out[i] = i if labels[i] >= 0 else -1
+        return out
+
+    if periods < 0:
+        periods = -periods
+        offset = N - 1
+        sign = -1
+    else:
+        offset = 0
+        sign = 1
+
+    # ring buffer of the last `periods` positions seen for each group
+    label_seen = np.zeros(ngroups, dtype=np.int64)
+    label_indexer = np.zeros((ngroups, periods), dtype=np.int64)
+
+    for i from 0 <= i < N:
+        ii = offset + sign * i
+        lab = labels[ii]
+
+        if lab < 0:
+            out[ii] = -1
+            continue
+
+        label_seen[lab] += 1
+        idxer_slot = label_seen[lab] % periods
+
+        if label_seen[lab] > periods:
+            out[ii] = label_indexer[lab, idxer_slot]
+        else:
+            out[ii] = -1
+
+        label_indexer[lab, idxer_slot] = ii
+
+    return out
+
 # TODO: aggregate multiple columns in single pass
 #----------------------------------------------------------------------
 # first, nth, last
@@ -2362,5 +2418,201 @@ cdef inline float64_t _median_linear(float64_t* a, int n):
 
     return result
 
+#----------------------------------------------------------------------
+# quantile and rank
+
+cdef _group_value_sorter(ndarray values, ndarray labels, Py_ssize_t ngroups):
+    '''
+    Indexer ordering the rows by group, and by value within the groups
+    (nans last, ties in order of position), with the group sizes
+    '''
+    cdef ndarray sorter, indexer, counts
+
+    # the counting sort by group keeps the order of the values
+    sorter = values.argsort(kind='mergesort').astype(np.int64)
+    indexer, counts = groupsort_indexer(labels.take(sorter), ngroups)
+    return sorter.take(indexer), counts
+
+
+cdef inline Py_ssize_t _walk_pos(Py_ssize_t start, Py_ssize_t size,
+                                 Py_ssize_t i, bint ascending):
+    # position of the i-th value of a group walked in sort order
+    if ascending:
+        return start + i
+    return start + size - 1 - i
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_quantile(ndarray[float64_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[float64_t, ndim=2] values,
+                   ndarray[int64_t] labels,
+                   ndarray[float64_t] qs,
+                   object interpolation='fraction'):
+    '''
+    Quantiles qs of the non-nan values of each group, computed as
+    pandas.core.algorithms.quantile does. out has a column for each
+    column of values and q, the qs of a column of values being adjacent.
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, k, N, K, nq, ngroups, start, size, nobs, lo
+        int interp
+        float64_t idx, frac, val
+        ndarray[int64_t] sorter, _counts
+        ndarray[float64_t] sorted_values
+
+    if interpolation == 'fraction':
+        interp = 0
+    elif interpolation == 'lower':
+        interp = 1
+    elif interpolation == 'higher':
+        interp = 2
+    else:
+        raise ValueError("interpolation_method can only be 'fraction' "
+                         ", 'lower' or 'higher'")
+
+    if ((qs < 0) | (qs > 1)).any():
+        raise ValueError("quantiles must be between 0 and 1")
+
+    ngroups = len(counts)
+    N, K = (<object> values).shape
+    nq = len(qs)
+
+    for i in range(K):
+        sorter, _counts = _group_value_sorter(values[:, i], labels, ngroups)
+        sorted_values = values[:, i].take(sorter)
+        counts[:] = _counts[1:]
+
+        # exclude NA group
+        start = _counts[0]
+        for j in range(ngroups):
+            size = _counts[j + 1]
+
+            # the nans are sorted last
+            nobs = size
+            while nobs > 0:
+                val = sorted_values[start + nobs - 1]
+                if val == val:
+                    break
+                nobs -= 1
+
+            for k in range(nq):
+                if nobs == 0:
+                    out[j, i * nq + k] = NaN
+                    continue
+
+                idx = qs[k] * (nobs - 1)
+                lo = <Py_ssize_t> idx
+                frac = idx - lo
+                if frac == 0:
+                    val = sorted_values[start + lo]
+                elif interp == 0:
+                    val = sorted_values[start + lo]
+                    val = val + (sorted_values[start + lo + 1] - val) * frac
+                elif interp == 1:
+                    val = sorted_values[start + lo]
+                else:
+                    val = sorted_values[start + lo + 1]
+                out[j, i * nq + k] = val
+
+            start += size
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_rank_float64(ndarray[float64_t] out,
+                       ndarray[float64_t] values,
+                       ndarray[int64_t] labels,
+                       Py_ssize_t ngroups,
+                       ties_method='average', ascending=True,
+                       na_option='keep', pct=False):
+    '''
+    Ranks of the values within each group, as rank_1d_float64 computes
+    them for the values of a single group. The rows with a negative label
+    are left as is
+    '''
+    cdef:
+        Py_ssize_t i, j, k, ii, start, size, dups, total_tie_count
+        ndarray[int64_t] argsorted, _counts
+        ndarray[float64_t] sorted_data
+        float64_t val, nan_value, sum_ranks, count
+        int tiebreak
+        bint keep_na, asc = ascending
+
+    tiebreak = tiebreakers[ties_method]
+    keep_na = na_option == 'keep'
+
+    if ascending ^ (na_option == 'top'):
+        nan_value = np.inf
+    else:
+        nan_value = -np.inf
+    values = values.copy()
+    np.putmask(values, np.isnan(values), nan_value)
+
+    if tiebreak == TIEBREAK_FIRST and not asc:
+        tiebreak = TIEBREAK_FIRST_DESCENDING
+
+    # ascending within each group, and ties in order of position; a
+    # descending group is walked backwards, as rank_1d_float64 reverses
+    # its stable sort
+    argsorted, _counts = _group_value_sorter(values, labels, ngroups)
+    sorted_data = values.take(argsorted)
+
+    # exclude NA group
+    start = _counts[0]
+    for k in range(ngroups):
+        size = _counts[k + 1]
+
+        dups = total_tie_count = 0
+        sum_ranks = count = 0
+        for i in range(size):
+            ii = _walk_pos(start, size, i, asc)
+            sum_ranks += i + 1
+            dups += 1
+            val = sorted_data[ii]
+            if (val == nan_value) and keep_na:
+                out[argsorted[ii]] = nan
+                continue
+            count += 1.0
+            if (i == size - 1 or
+                    float64_are_diff(
+                        sorted_data[_walk_pos(start, size, i + 1, asc)],
+                        val)):
+                if tiebreak == TIEBREAK_AVERAGE:
+                    for j in range(i - dups + 1, i + 1):
+                        out[argsorted[_walk_pos(start, size, j, asc)]] = \
+                            sum_ranks / dups
+                elif tiebreak == TIEBREAK_MIN:
+                    for j in range(i - dups + 1, i + 1):
+                        out[argsorted[_walk_pos(start, size, j, asc)]] = \
+                            i - dups + 2
+                elif tiebreak == TIEBREAK_MAX:
+                    for j in range(i - dups + 1, i + 1):
+                        out[argsorted[_walk_pos(start, size, j, asc)]] = \
+                            i + 1
+                elif tiebreak == TIEBREAK_FIRST:
+                    for j in range(i - dups + 1, i + 1):
+                        out[argsorted[_walk_pos(start, size, j, asc)]] = \
+                            j + 1
+                elif tiebreak == TIEBREAK_FIRST_DESCENDING:
+                    for j in range(i - dups + 1, i + 1):
+                        out[argsorted[_walk_pos(start, size, j, asc)]] = \
+                            2 * i - j - dups + 2
+                elif tiebreak == TIEBREAK_DENSE:
+                    total_tie_count += 1
+                    for j in range(i - dups + 1, i + 1):
+                        out[argsorted[_walk_pos(start, size, j, asc)]] = \
+                            total_tie_count
+                sum_ranks = dups = 0
+
+        if pct and count > 0:
+            for i in range(start, start + size):
+                out[argsorted[i]] = out[argsorted[i]] / count
+
+        start += size
+
+
 include "join.pyx"
 include "generated.pyx"
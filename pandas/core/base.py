@@ -328,6 +328,38 @@ class IndexOpsMixin(object):
         """ return the number of bytes in the underlying data """
         return self.values.nbytes
 
+    def memory_usage(self, deep=False):
+        """
+        Memory usage of my values
+
+        Parameters
+        ----------
+        deep : bool, default False
+            Introspect the data deeply: include the size of the Python
+            objects held by an ``object`` dtype
+
+        Returns
+        -------
+        bytes used
+
+        Notes
+        -----
+        With deep=False, the memory consumed by the elements of an ``object``
+        dtype that are not components of the array is not included
+
+        See Also
+        --------
+        numpy.ndarray.nbytes
+        """
+        values = self.values
+        if hasattr(values, 'memory_usage'):
+            return values.memory_usage(deep=deep)
+
+        v = values.nbytes
+        if deep and com.is_object_dtype(values):
+            v += lib.memory_usage_of_objects(values.ravel())
+        return v
+
     @property
     def strides(self):
         """ return the strides of the underlying data """
@@ -726,6 +726,26 @@ class Categorical(PandasObject):
     def nbytes(self):
         return self._codes.nbytes + self._categories.values.nbytes
 
+    def memory_usage(self, deep=False):
+        """
+        Memory usage of my codes and categories
+
+        Parameters
+        ----------
+        deep : bool, default False
+            Introspect the data deeply: include the size of the Python
+            objects held by ``object`` categories
+
+        Returns
+        -------
+        bytes used
+
+        See Also
+        --------
+        numpy.ndarray.nbytes
+        """
+        return self._codes.nbytes + self._categories.memory_usage(deep=deep)
+
     def searchsorted(self, v, side='left', sorter=None):
         raise NotImplementedError("See https://github.com/pydata/pandas/issues/8420")
 
@@ -2054,11 +2054,8 @@ def _is_bool_indexer(key):
 
 
 def _default_index(n):
-    from pandas.core.index import Int64Index
-    values = np.arange(n, dtype=np.int64)
-    result = Int64Index(values,name=None)
-    result.is_unique = True
-    return result
+    from pandas.core.index import RangeIndex
+    return RangeIndex(0, n, name=None)
 
 
 def ensure_float(arr):
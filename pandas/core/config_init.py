@@ -189,6 +189,13 @@ pc_max_info_rows_doc = """
     limit this null check only to frames with smaller dimensions then specified.
 """
 
+pc_memory_usage_doc = """
+: bool or 'deep'
+    This specifies if the memory usage of a DataFrame should be displayed when
+    df.info() is called. 'deep' includes the size of the objects held by
+    object columns, which is slower to compute.
+"""
+
 pc_large_repr_doc = """
 : 'truncate'/'info'
     For DataFrames exceeding max_rows/max_cols, the repr (and HTML repr) can
@@ -245,6 +252,9 @@ with cf.config_prefix('display'):
                        validator=is_one_of_factory(['truncate', 'info']))
     cf.register_option('max_info_columns', 100, pc_max_info_cols_doc,
                        validator=is_int)
+    cf.register_option('memory_usage', True, pc_memory_usage_doc,
+                       validator=is_one_of_factory([None, True, False,
+                                                    'deep']))
     cf.register_option('colheader_justify', 'right', colheader_justify_doc,
                        validator=is_text)
     cf.register_option('notebook_repr_html', True, pc_nb_repr_h_doc,
@@ -310,6 +320,44 @@ with cf.config_prefix('mode'):
                        cb=use_inf_as_null_cb)
 
 
+compute_nthreads_doc = """
+: int
+    The number of threads used to run the element-wise operations of a
+    DataFrame (e.g. fillna, astype, shift, interpolate) on its blocks: blocks
+    of different dtypes are processed in parallel, and very large blocks are
+    split between the threads. Default is 1 (no threading)
+"""
+
+
+def compute_nthreads_cb(key):
+    from pandas.core.internals import _set_apply_nthreads
+    _set_apply_nthreads(key)
+
+with cf.config_prefix('compute'):
+    cf.register_option('nthreads', 1, compute_nthreads_doc,
+                       validator=is_int, cb=compute_nthreads_cb)
+
+
+compute_hashtable_limit_doc = """
+: int or None
+    The maximum total size in bytes of the hash tables built to look up the
+    labels of the indexes. Beyond it, the tables of the least recently used
+    indexes are released, and rebuilt if they are needed again. None (the
+    default) means no limit
+"""
+
+
+def compute_hashtable_limit_cb(key):
+    import pandas.index as _index
+    _index.set_hashtable_limit(cf.get_option(key))
+
+with cf.config_prefix('compute'):
+    cf.register_option('hashtable_limit', None,
+                       compute_hashtable_limit_doc,
+                       validator=is_instance_factory([type(None), int]),
+                       cb=compute_hashtable_limit_cb)
+
+
 # user warnings
 chained_assignment = """
 : string
@@ -322,6 +370,26 @@ with cf.config_prefix('mode'):
                        validator=is_one_of_factory([None, 'warn', 'raise']))
 
 
+copy_on_write_doc = """
+: boolean
+    Experimental. If True, copies of the data (e.g. from ``copy()``,
+    ``reindex`` with identical axes or ``astype`` to the same dtype) share
+    their blocks with the original object, and the data is only copied when
+    either object is first modified in-place. Arrays obtained through
+    ``.values`` are not tracked, and modifying them in-place also modifies
+    the copies. Defaults to False
+"""
+
+
+def copy_on_write_cb(key):
+    from pandas.core.internals import _use_copy_on_write
+    _use_copy_on_write(key)
+
+with cf.config_prefix('mode'):
+    cf.register_option('copy_on_write', False, copy_on_write_doc,
+                       validator=is_bool, cb=copy_on_write_cb)
+
+
 # Set up the io.excel specific configuration.
 writer_engine_doc = """
 : string
@@ -1735,17 +1735,17 @@ class ExcelFormatter(object):
             if isinstance(self.df.index, PeriodIndex):
                 index_values = self.df.index.to_timestamp()
 
-            coloffset = 1
-            for idx, idxval in enumerate(index_values):
-                yield ExcelCell(self.rowcounter + idx, 0, idxval, header_style)
+            index_values = iter(index_values)
 
-        # Get a frame that will account for any duplicates in the column names.
-        col_mapped_frame = self.df.loc[:, self.columns]
+            coloffset = 1
 
-        # Write the body of the frame data series by series.
-        for colidx in range(len(self.columns)):
-            series = col_mapped_frame.iloc[:, colidx]
-            for i, val in enumerate(series):
+        # Write the index and body of the frame row by row, so that writers
+        # can stream the cells to disk in order.
+        for i, row in enumerate(self._iter_body_rows()):
+            if self.index:
+                yield ExcelCell(self.rowcounter + i, 0, next(index_values),
+                                header_style)
+            for colidx, val in enumerate(row):
                 yield ExcelCell(self.rowcounter + i, colidx + coloffset, val)
 
     def _format_hierarchical_rows(self):
@@ -1776,49 +1776,59 @@ class ExcelFormatter(object):
                                     header_style)
                 self.rowcounter += 1
 
+            nlevels = self.df.index.nlevels
             if self.merge_cells:
                 # Format hierarchical rows as merged cells.
                 level_strs = self.df.index.format(sparsify=True, adjoin=False,
                                                   names=False)
                 level_lengths = _get_level_lengths(level_strs)
+                level_values = [levels.take(labels) for levels, labels
+                                in zip(self.df.index.levels,
+                                       self.df.index.labels)]
+            else:
+                index_values = iter(self.df.index)
+            gcolidx = nlevels
 
-                for spans, levels, labels in zip(level_lengths,
-                                                 self.df.index.levels,
-                                                 self.df.index.labels):
-                    values = levels.take(labels)
-                    for i in spans:
+        # Write the index and body of the frame row by row, so that writers
+        # can stream the cells to disk in order.
+        for i, row in enumerate(self._iter_body_rows()):
+            if self.index:
+                if self.merge_cells:
+                    for lnum in range(nlevels):
+                        spans = level_lengths[lnum]
+                        if i not in spans:
+                            continue
                         if spans[i] > 1:
                             yield ExcelCell(self.rowcounter + i,
-                                            gcolidx,
-                                            values[i],
+                                            lnum,
+                                            level_values[lnum][i],
                                             header_style,
                                             self.rowcounter + i + spans[i] - 1,
-                                            gcolidx)
+                                            lnum)
                         else:
                             yield ExcelCell(self.rowcounter + i,
-                                            gcolidx,
-                                            values[i],
+                                            lnum,
+                                            level_values[lnum][i],
                                             header_style)
-                    gcolidx += 1
-
-            else:
-                # Format hierarchical rows with non-merged values.
-                for indexcolvals in zip(*self.df.index):
-                    for idx, indexcolval in enumerate(indexcolvals):
-                        yield ExcelCell(self.rowcounter + idx,
-                                        gcolidx,
+                else:
+                    # Format hierarchical rows with non-merged values.
+                    for lnum, indexcolval in enumerate(next(index_values)):
+                        yield ExcelCell(self.rowcounter + i,
+                                        lnum,
                                         indexcolval,
                                         header_style)
-                    gcolidx += 1
+            for colidx, val in enumerate(row):
+                yield ExcelCell(self.rowcounter + i, gcolidx + colidx, val)
 
+    def _iter_body_rows(self):
         # Get a frame that will account for any duplicates in the column names.
         col_mapped_frame = self.df.loc[:, self.columns]
 
-        # Write the body of the frame data series by series.
-        for colidx in range(len(self.columns)):
-            series = col_mapped_frame.iloc[:, colidx]
-            for i, val in enumerate(series):
-                yield ExcelCell(self.rowcounter + i, gcolidx + colidx, val)
+        # Iterate the columns as (boxed) series values, one row at a time.
+        columns = [iter(col_mapped_frame.iloc[:, colidx])
+                   for colidx in range(len(self.columns))]
+        for _ in range(len(col_mapped_frame)):
+            yield [next(col) for col in columns]
 
     def get_formatted_cells(self):
         for cell in itertools.chain(self._format_header(),
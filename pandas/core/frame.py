@@ -609,7 +609,7 @@ class DataFrame(NDFrame):
     # IO methods (to / from other formats)
 
     @classmethod
-    def from_dict(cls, data, orient='columns', dtype=None):
+    def from_dict(cls, data, orient='columns', dtype=None, copy=True):
         """
         Construct DataFrame from dict of array-like or dicts
 
@@ -621,6 +621,14 @@ class DataFrame(NDFrame):
             The "orientation" of the data. If the keys of the passed dict
             should be the columns of the resulting DataFrame, pass 'columns'
             (default). Otherwise if the keys should be rows, pass 'index'.
+        dtype : dtype, default None
+            Data type to force, otherwise infer
+        copy : boolean, default True
+            If False, each array (or Series) becomes a column of the result
+            without being copied into a consolidated block, when its dtype
+            and index allow it; modifying the arrays then modifies the
+            DataFrame. The columns are consolidated by later operations if
+            needed. Only supported with orient='columns'.
 
         Returns
         -------
@@ -628,6 +636,17 @@ class DataFrame(NDFrame):
         """
         index, columns = None, None
         orient = orient.lower()
+        if not copy:
+            if orient != 'columns':
+                raise ValueError("copy=False is only supported with "
+                                 "orient='columns'")
+            keys = list(data.keys())
+            if not isinstance(data, OrderedDict):
+                keys = _try_sort(keys)
+            mgr = _arrays_to_mgr([data[k] for k in keys], keys, None, keys,
+                                 dtype=dtype, consolidate=False)
+            return cls(mgr)
+
         if orient == 'index':
             if len(data) > 0:
                 # TODO speed up Series case
@@ -1187,7 +1206,9 @@ class DataFrame(NDFrame):
             ``io.excel.xlsx.writer``, ``io.excel.xls.writer``, and
             ``io.excel.xlsm.writer``.
         merge_cells : boolean, default True
-            Write MultiIndex and Hierarchical Rows as merged cells.
+            Write MultiIndex and Hierarchical Rows as merged cells. Ignored
+            by writers that stream rows, e.g. xlsxwriter in constant memory
+            mode.
         encoding: string, default None
             encoding of the resulting excel file. Only necessary for xlwt,
             other writers support unicode natively.
@@ -1217,6 +1238,11 @@ class DataFrame(NDFrame):
             excel_writer = ExcelWriter(excel_writer, engine=engine)
             need_save = True
 
+        # a merged range writes into rows after its first one, which a
+        # writer streaming rows to disk has already flushed
+        if not getattr(excel_writer, 'supports_merged_cells', True):
+            merge_cells = False
+
         formatter = fmt.ExcelFormatter(self,
                                        na_rep=na_rep,
                                        cols=columns,
@@ -1393,7 +1419,7 @@ class DataFrame(NDFrame):
         if buf is None:
             return formatter.buf.getvalue()
 
-    def info(self, verbose=None, buf=None, max_cols=None):
+    def info(self, verbose=None, buf=None, max_cols=None, memory_usage=None):
         """
         Concise summary of a DataFrame.
 
@@ -1407,6 +1433,10 @@ class DataFrame(NDFrame):
         max_cols : int, default None
             Determines whether full summary or short summary is printed.
             None follows the `display.max_info_columns` setting.
+        memory_usage : {None, True, False, 'deep'}, optional
+            Whether to display the total memory usage of the DataFrame
+            (including the index); 'deep' also measures the objects held by
+            object columns. None follows the `display.memory_usage` setting.
         """
         from pandas.core.format import _put_lines
 
@@ -1477,9 +1507,117 @@ class DataFrame(NDFrame):
 
         counts = self.get_dtype_counts()
         dtypes = ['%s(%d)' % k for k in sorted(compat.iteritems(counts))]
-        lines.append('dtypes: %s\n' % ', '.join(dtypes))
+        lines.append('dtypes: %s' % ', '.join(dtypes))
+
+        if memory_usage is None:
+            memory_usage = get_option('display.memory_usage')
+        if memory_usage:
+            deep = memory_usage == 'deep'
+            # the size of the objects referenced by object columns (or an
+            # object index) is only included if deep
+            size_qualifier = ''
+            if not deep and ('object' in counts or
+                             com.is_object_dtype(self.index)):
+                size_qualifier = '+'
+            mem_usage = self.memory_usage(index=True, deep=deep).sum()
+            lines.append("memory usage: %s" %
+                         _sizeof_fmt(mem_usage, size_qualifier))
+        lines[-1] += '\n'
         _put_lines(buf, lines)
 
+    def memory_usage(self, index=True, deep=False):
+        """
+        Memory usage of the DataFrame columns
+
+        Parameters
+        ----------
+        index : bool, default True
+            Include the memory usage of the index (and of its hash table,
+            if it has been built) as the first item of the result, labelled
+            ``'Index'``
+        deep : bool, default False
+            Introspect the data deeply: include the size of the Python
+            objects held by ``object`` columns and categories
+
+        Returns
+        -------
+        sizes : Series
+            The bytes used by each column
+
+        See Also
+        --------
+        numpy.ndarray.nbytes
+        Series.memory_usage
+        """
+        # walk the blocks rather than the columns, without creating a Series
+        # for each column
+        result = np.zeros(len(self.columns), dtype=np.int64)
+        for blk in self._data.blocks:
+            result[blk.mgr_locs.indexer] = blk.memory_usage(deep=deep)
+        result = Series(result, index=self.columns)
+
+        if index:
+            result = Series(self.index.memory_usage(deep=deep),
+                            index=['Index']).append(result)
+        return result
+
+    def downcast(self, integer='smallest', float='float32',
+                 category_ratio=None, copy=True, report=False):
+        """
+        Shrink the columns to the smallest dtypes that hold their values
+
+        Each block is scanned once: integer columns are cast to the smallest
+        integer dtype holding their minimum and maximum, float columns to
+        ``float`` and object columns with few distinct values to
+        Categorical.
+
+        Parameters
+        ----------
+        integer : {'smallest', 'unsigned', None}, default 'smallest'
+            'smallest' casts integer columns to the smallest signed integer
+            dtype holding their values, 'unsigned' to the smallest unsigned
+            dtype for columns without negative values; None leaves them as is
+        float : dtype, default 'float32'
+            Dtype to cast float columns to (with a possible loss of
+            precision); columns with finite values out of its range are kept.
+            None leaves float columns as is
+        category_ratio : float, default None
+            Convert the object columns whose number of distinct values is
+            below ``category_ratio`` times their length to Categorical
+        copy : boolean, default True
+            Copy the columns that are left unchanged; if False they share
+            their data with this DataFrame
+        report : boolean, default False
+            Also return a DataFrame describing, per column, the original and
+            new dtypes and the number of bytes saved
+
+        Returns
+        -------
+        downcasted : DataFrame
+        report : DataFrame, only if report is True
+        """
+        if integer not in ['smallest', 'unsigned', None]:
+            raise ValueError("integer must be one of 'smallest', 'unsigned' "
+                             "or None, got %r" % (integer,))
+        if float is not None and not com.is_float_dtype(np.dtype(float)):
+            raise ValueError("float must be a float dtype, got %r" % (float,))
+
+        new_data = self._data.apply('downcast_smallest', integer=integer,
+                                    float=float,
+                                    category_ratio=category_ratio, copy=copy)
+        result = self._constructor(new_data).__finalize__(self)
+        if not report:
+            return result
+
+        saved = (self.memory_usage(index=False).values -
+                 result.memory_usage(index=False).values)
+        report = DataFrame({'dtype_before': self.dtypes.values,
+                            'dtype_after': result.dtypes.values,
+                            'bytes_saved': saved}, index=self.columns,
+                           columns=['dtype_before', 'dtype_after',
+                                    'bytes_saved'])
+        return result, report
+
     def transpose(self):
         """Transpose index and columns"""
         return super(DataFrame, self).transpose(1, 0)
@@ -1541,8 +1679,14 @@ class DataFrame(NDFrame):
         """
 
         if takeable:
-            series = self._iget_item_cache(col)
-            return _maybe_box_datetimelike(series.values[index])
+            return _maybe_box_datetimelike(self._data.iget_scalar(col, index))
+
+        # read straight from the block when both labels are unique
+        item_loc = self.columns.get_loc(col)
+        loc = self.index._engine.get_loc(index)
+        if com.is_integer(item_loc) and com.is_integer(loc):
+            return _maybe_box_datetimelike(self._data.iget_scalar(item_loc,
+                                                                  loc))
 
         series = self._get_item_cache(col)
         engine = self.index._engine
@@ -1566,18 +1710,34 @@ class DataFrame(NDFrame):
             otherwise a new object
         """
         try:
+            if takeable is True:
+                item_loc, loc = col, index
+            else:
+                item_loc = self.columns.get_loc(col)
+                loc = self.index._engine.get_loc(index)
+
+            # write straight into the block when it can hold the value
+            if (com.is_integer(item_loc) and com.is_integer(loc) and
+                    self._data.iset_scalar(item_loc, loc, value)):
+                return self
+
             if takeable is True:
                 series = self._iget_item_cache(col)
                 return series.set_value(index, value, takeable=True)
 
             series = self._get_item_cache(col)
+            series._data._copy_on_write()
             engine = self.index._engine
             engine.set_value(series.values, index, value)
             return self
-        except (KeyError, TypeError):
+        except (KeyError, TypeError, ValueError):
 
-            # set using a non-recursive method & reset the cache
-            self.loc[index, col] = value
+            # set using a non-recursive method & reset the cache; this also
+            # upcasts a block that can't hold the value
+            if takeable is True:
+                self.iloc[index, col] = value
+            else:
+                self.loc[index, col] = value
             self._item_cache.pop(col, None)
 
             return self
@@ -2115,6 +2275,8 @@ class DataFrame(NDFrame):
         value = self._sanitize_column(column, value)
         self._data.insert(
             loc, column, value, allow_duplicates=allow_duplicates)
+        # the values of the other columns may have been moved
+        self._clear_item_cache()
 
     def _sanitize_column(self, key, value):
         # Need to make sure new columns (which go into the BlockManager as new
@@ -2220,21 +2382,15 @@ class DataFrame(NDFrame):
         if n != len(col_labels):
             raise ValueError('Row labels must have same size as column labels')
 
-        thresh = 1000
-        if not self._is_mixed_type or n > thresh:
-            values = self.values
-            ridx = self.index.get_indexer(row_labels)
-            cidx = self.columns.get_indexer(col_labels)
-            if (ridx == -1).any():
-                raise KeyError('One or more row labels was not found')
-            if (cidx == -1).any():
-                raise KeyError('One or more column labels was not found')
-            flat_index = ridx * len(self.columns) + cidx
-            result = values.flat[flat_index]
-        else:
-            result = np.empty(n, dtype='O')
-            for i, (r, c) in enumerate(zip(row_labels, col_labels)):
-                result[i] = self.get_value(r, c)
+        ridx = self.index.get_indexer(row_labels)
+        cidx = self.columns.get_indexer(col_labels)
+        if (ridx == -1).any():
+            raise KeyError('One or more row labels was not found')
+        if (cidx == -1).any():
+            raise KeyError('One or more column labels was not found')
+
+        # gathered block by block, without interleaving the whole frame
+        result = self._data.take_pairs(cidx, ridx)
 
         if result.dtype == 'O':
             result = lib.maybe_convert_objects(result)
@@ -2460,7 +2616,7 @@ class DataFrame(NDFrame):
                                                                 mask, np.nan)
             return values
 
-        new_index = np.arange(len(new_obj),dtype='int64')
+        new_index = _default_index(len(new_obj))
         if isinstance(self.index, MultiIndex):
             if level is not None:
                 if not isinstance(level, (tuple, list)):
@@ -4565,10 +4721,14 @@ DataFrame._add_numeric_operations()
 
 _EMPTY_SERIES = Series([])
 
-def _arrays_to_mgr(arrays, arr_names, index, columns, dtype=None):
+def _arrays_to_mgr(arrays, arr_names, index, columns, dtype=None,
+                   consolidate=True):
     """
     Segregate Series based on type and coerce into matrices.
     Needs to handle a lot of exceptional cases.
+
+    If not consolidate, each array is wrapped in its own block, without
+    copying it if possible.
     """
     # figure out the index, if necessary
     if index is None:
@@ -4582,7 +4742,8 @@ def _arrays_to_mgr(arrays, arr_names, index, columns, dtype=None):
     # from BlockManager perspective
     axes = [_ensure_index(columns), _ensure_index(index)]
 
-    return create_block_manager_from_arrays(arrays, arr_names, axes)
+    return create_block_manager_from_arrays(arrays, arr_names, axes,
+                                            consolidate=consolidate)
 
 
 def extract_index(data):
@@ -4632,7 +4793,7 @@ def extract_index(data):
                            % (lengths[0], len(index)))
                     raise ValueError(msg)
             else:
-                index = Index(np.arange(lengths[0]))
+                index = _default_index(lengths[0])
 
     return _ensure_index(index)
 
@@ -4844,10 +5005,11 @@ def _convert_object_array(content, columns, coerce_float=False, dtype=None):
 
 
 def _get_names_from_index(data):
-    index = lrange(len(data))
     has_some_name = any([getattr(s, 'name', None) is not None for s in data])
     if not has_some_name:
-        return index
+        return _default_index(len(data))
+
+    index = lrange(len(data))
 
     count = 0
     for i, s in enumerate(data):
@@ -4907,6 +5069,15 @@ def _put_str(s, space):
     return ('%s' % s)[:space].ljust(space)
 
 
+def _sizeof_fmt(num, size_qualifier=''):
+    # returns size in human readable format
+    for x in ['bytes', 'KB', 'MB', 'GB', 'TB']:
+        if num < 1024.0:
+            return "%3.1f%s %s" % (num, size_qualifier, x)
+        num /= 1024.0
+    return "%3.1f%s %s" % (num, size_qualifier, 'PB')
+
+
 #----------------------------------------------------------------------
 # Add plotting methods to DataFrame
 
@@ -2,7 +2,6 @@
 import warnings
 import operator
 import weakref
-import gc
 import numpy as np
 import pandas.lib as lib
 
@@ -184,9 +183,6 @@ class NDFrame(PandasObject):
         # typ
         setattr(cls, '_typ', cls.__name__.lower())
 
-        # indexing support
-        cls._ix = None
-
         if info_axis is not None:
             cls._info_axis_number = info_axis
             cls._info_axis_name = axes[info_axis]
@@ -967,6 +963,20 @@ class NDFrame(PandasObject):
         from pandas.io.pickle import to_pickle
         return to_pickle(self, path)
 
+    def to_blockfile(self, path):
+        """
+        Write the object to a block file: a columnar binary format storing
+        each internal block as a contiguous buffer, which can be read back
+        memory-mapped with ``read_blockfile``
+
+        Parameters
+        ----------
+        path : string
+            File path
+        """
+        from pandas.io.blockfile import to_blockfile
+        return to_blockfile(self, path)
+
     def save(self, path):  # TODO remove in 0.14
         "Deprecated. Use to_pickle instead"
         import warnings
@@ -1014,21 +1024,15 @@ class NDFrame(PandasObject):
         """ create an indexer like _name in the class """
 
         if getattr(cls, name, None) is None:
-            iname = '_%s' % name
-            setattr(cls, iname, None)
 
+            # the indexer is not cached on the object: it references the
+            # object, and the reference cycle would keep objects alive after
+            # their last use, see _check_setitem_copy
             def _indexer(self):
-                i = getattr(self, iname)
-                if i is None:
-                    i = indexer(self, name)
-                    setattr(self, iname, i)
-                return i
+                return indexer(self, name)
 
             setattr(cls, name, property(_indexer))
 
-            # add to our internal names set
-            cls._internal_names_set.add(iname)
-
     def get(self, key, default=None):
         """
         Get item from object for given key (DataFrame column, Panel slice,
@@ -1218,20 +1222,18 @@ class NDFrame(PandasObject):
 
         if force or self.is_copy:
 
+            # see if the copy is not actually referred; if so, then dissolve
+            # the copy weakref
+            if (self.is_copy is not None and
+                    not isinstance(self.is_copy, string_types) and
+                    self.is_copy() is None):
+                self.is_copy = None
+                return
+
             value = config.get_option('mode.chained_assignment')
             if value is None:
                 return
 
-            # see if the copy is not actually refererd; if so, then disolve
-            # the copy weakref
-            try:
-                gc.collect(2)
-                if not gc.get_referents(self.is_copy()):
-                    self.is_copy = None
-                    return
-            except:
-                pass
-
             # a custom message
             if isinstance(self.is_copy, string_types):
                 t = self.is_copy
@@ -14,7 +14,8 @@ from pandas.core.base import PandasObject
 from pandas.core.categorical import Categorical
 from pandas.core.frame import DataFrame
 from pandas.core.generic import NDFrame
-from pandas.core.index import Index, MultiIndex, _ensure_index, _union_indexes
+from pandas.core.index import (Index, MultiIndex, CategoricalIndex,
+                               _ensure_index, _union_indexes)
 from pandas.core.internals import BlockManager, make_block
 from pandas.core.series import Series
 from pandas.core.panel import Panel
@@ -118,6 +119,23 @@ def _groupby_function(name, alias, npfunc, numeric_only=True,
     return f
 
 
+def _groupby_cum_function(name):
+    def f(self, axis=None, **kwargs):
+        self._set_selection_from_grouper()
+        if (axis in (0, None) and self.axis == 0 and
+                kwargs.get('skipna', True)):
+            try:
+                return self._cython_transform(name)
+            except NotImplementedError:
+                pass
+        return self._make_wrapper(name)(axis=axis, **kwargs)
+
+    f.__doc__ = "Cumulative %s of the values within each group" % name[3:]
+    f.__name__ = name
+
+    return f
+
+
 def _first_compat(x, axis=0):
     def _first(x):
         x = np.asarray(x)
@@ -712,6 +730,147 @@ class GroupBy(PandasObject):
                 return x.median(axis=self.axis)
             return self._python_agg_general(f)
 
+    def quantile(self, q=0.5, interpolation='fraction', **kwargs):
+        """
+        Compute quantile(s) of groups, excluding missing values
+
+        Parameters
+        ----------
+        q : float or array-like, default 0.5 (50% quantile)
+            0 <= q <= 1, the quantile(s) to compute
+        interpolation : {'fraction', 'lower', 'higher'}
+            how a quantile lying between two values is computed, see
+            pandas.core.algorithms.quantile
+
+        For multiple groupings or quantiles, the result index will be a
+        MultiIndex
+        """
+        self._set_selection_from_grouper()
+        obj = self._selected_obj
+        data = self._get_quantile_data(obj, **kwargs)
+        if data is None:
+            if interpolation != 'fraction':
+                raise NotImplementedError("interpolation is only supported "
+                                          "for numeric data")
+            return self._make_wrapper('quantile')(q, **kwargs)
+
+        qs = np.asarray(q, dtype=np.float64).ravel()
+        values = data.values
+        if values.ndim == 1:
+            values = values[:, None]
+        values = values.astype(np.float64)
+
+        result = self.grouper.quantile(values, qs, interpolation)
+        index = self.grouper.result_index
+        ngroups = len(index)
+
+        if com.is_list_like(q):
+            # one row per group and q
+            nq, K = len(qs), values.shape[1]
+            result = result.reshape(ngroups, K, nq).swapaxes(1, 2)
+            result = result.reshape(ngroups * nq, K)
+
+            q_labels, q_level = algos.factorize(qs, sort=True)
+            if isinstance(index, MultiIndex):
+                levels = list(index.levels)
+                labels = [np.repeat(lab, nq) for lab in index.labels]
+            else:
+                levels = [index]
+                labels = [np.repeat(np.arange(ngroups), nq)]
+            index = MultiIndex(levels=levels + [q_level],
+                               labels=labels + [np.tile(q_labels, ngroups)],
+                               names=list(self.grouper.names) + [None],
+                               verify_integrity=False)
+
+        # cast back to the dtype of the data where it is lossless, as the
+        # other cython aggregations (e.g. median) do
+        if isinstance(data, Series):
+            result = self._try_cast(result[:, 0], data)
+            if com.is_list_like(q):
+                return Series(result, index=index)
+            return Series(result, index=index, name=self.name)
+
+        result = DataFrame(dict((j, self._try_cast(result[:, j],
+                                                   data.iloc[:, j]))
+                                for j in range(result.shape[1])),
+                           index=index)
+        result.columns = data.columns
+        return result
+
+    def _get_quantile_data(self, obj, **kwargs):
+        """
+        The numeric data quantiles are computed for, or None when they
+        have to go through apply
+        """
+        if (self.axis != 0 or kwargs.get('axis', 0) not in (0, 'index') or
+                not self.as_index or type(obj) not in (Series, DataFrame) or
+                len(obj) == 0 or
+                len(self.grouper.group_info[0]) != len(obj)):
+            return None
+
+        if isinstance(obj, Series):
+            if not issubclass(obj.dtype.type, (np.integer, np.floating)):
+                return None
+            return obj
+
+        if not kwargs.get('numeric_only', True):
+            return None
+        data = obj._get_numeric_data()
+        if len(data.columns) == 0 or not all(
+                issubclass(dtype.type, (np.integer, np.floating, np.bool_))
+                for dtype in data.dtypes):
+            return None
+        return data
+
+    def rank(self, method='average', na_option='keep', ascending=True,
+             pct=False, axis=0, **kwargs):
+        """
+        Compute numerical data ranks (1 through n) within each group
+
+        Parameters
+        ----------
+        method : {'average', 'min', 'max', 'first', 'dense'}
+            how equal values are ranked, as in Series.rank
+        na_option : {'keep', 'top', 'bottom'}
+            keep NA values where they are, or rank them first or last
+        ascending : boolean, default True
+            False for ranks by high (1) to low (N)
+        pct : boolean, default False
+            Computes percentage rank of data within each group
+
+        Returns
+        -------
+        ranks : same type as the caller, aligned with it
+        """
+        self._set_selection_from_grouper()
+        obj = self._selected_obj
+        dtypes = obj.dtypes if isinstance(obj, DataFrame) else [obj.dtype]
+        if (axis != 0 or self.axis != 0 or kwargs or
+                type(obj) not in (Series, DataFrame) or len(obj) == 0 or
+                len(self.grouper.group_info[0]) != len(obj) or
+                not all(issubclass(dtype.type, (np.integer, np.floating))
+                        for dtype in dtypes)):
+            if axis != 0:
+                kwargs['axis'] = axis
+            return self._make_wrapper('rank')(method=method,
+                                              na_option=na_option,
+                                              ascending=ascending, pct=pct,
+                                              **kwargs)
+
+        values = obj.values
+        if values.ndim == 1:
+            values = values[:, None]
+
+        result = np.empty(values.shape, dtype=np.float64)
+        for i in range(values.shape[1]):
+            result[:, i] = self.grouper.rank(
+                com._ensure_float64(values[:, i]), ties_method=method,
+                ascending=ascending, na_option=na_option, pct=pct)
+
+        if isinstance(obj, Series):
+            return Series(result[:, 0], index=obj.index, name=obj.name)
+        return DataFrame(result, index=obj.index, columns=obj.columns)
+
     def std(self, ddof=1):
         """
         Compute standard deviation of groups, excluding missing values
@@ -760,6 +919,11 @@ class GroupBy(PandasObject):
     _count = _groupby_function('_count', 'count', _count_compat,
                                numeric_only=False)
 
+    cumsum = _groupby_cum_function('cumsum')
+    cumprod = _groupby_cum_function('cumprod')
+    cummin = _groupby_cum_function('cummin')
+    cummax = _groupby_cum_function('cummax')
+
     def count(self, axis=0):
         return self._count().astype('int64')
 
@@ -957,6 +1121,50 @@ class GroupBy(PandasObject):
         cumcounts = self._cumcount_array(ascending=ascending)
         return Series(cumcounts, index)
 
+    def shift(self, periods=1, freq=None, axis=0, **kwargs):
+        """
+        Shift each group by periods observations
+
+        Parameters
+        ----------
+        periods : int, default 1
+            number of periods to shift, can be negative
+        freq : frequency string, optional
+            if passed, shift the index of each group instead, as in
+            Series.shift
+        """
+        self._set_selection_from_grouper()
+        obj = self._selected_obj
+        if (freq is not None or axis != 0 or self.axis != 0 or kwargs or
+                type(obj) not in (Series, DataFrame) or
+                isinstance(self.grouper, BinGrouper)):
+            return self._make_wrapper('shift')(periods=periods, freq=freq,
+                                               axis=axis, **kwargs)
+
+        indexer = self.grouper.shift_indexer(periods)
+        return obj._reindex_with_indexers({0: [obj.index, indexer]},
+                                          allow_dups=True)
+
+    def diff(self, periods=1):
+        """
+        First discrete difference of the values within each group
+
+        Parameters
+        ----------
+        periods : int, default 1
+            periods to shift for forming difference
+        """
+        self._set_selection_from_grouper()
+        obj = self._selected_obj
+        dtypes = obj.dtypes if isinstance(obj, DataFrame) else [obj.dtype]
+        if (self.axis != 0 or type(obj) not in (Series, DataFrame) or
+                isinstance(self.grouper, BinGrouper) or
+                not all(issubclass(dtype.type, (np.integer, np.floating))
+                        for dtype in dtypes)):
+            return self._make_wrapper('diff')(periods=periods)
+
+        return obj - self.shift(periods)
+
     def head(self, n=5):
         """
         Returns first n rows of each group.
@@ -1095,6 +1303,49 @@ class GroupBy(PandasObject):
 
         return self._wrap_aggregated_output(output, names)
 
+    def _cython_transform(self, how):
+        """
+        Cumulative function `how` within each group, aligned with the
+        selected object. Raises NotImplementedError for the cases that need
+        to go through apply
+        """
+        obj = self._selected_obj
+        if (type(obj) not in (Series, DataFrame) or len(obj) == 0 or
+                isinstance(self.grouper, BinGrouper)):
+            raise NotImplementedError
+
+        # a frame is accumulated as a whole, so the result has the dtype of
+        # its interleaved values, as DataFrame.cumsum has
+        values = obj.values
+        if not isinstance(values, np.ndarray):
+            raise NotImplementedError
+        result = self.grouper.accumulate(values, how)
+
+        if isinstance(obj, Series):
+            return Series(result, index=obj.index, name=obj.name)
+        return DataFrame(result, index=obj.index, columns=obj.columns)
+
+    def _broadcast_reduction(self, result, obj):
+        """
+        Take the aggregated `result`, one row per group in the order of the
+        result index, back to the rows of `obj` by the group ids. Rows
+        outside of any group are NaN. Raises NotImplementedError for the
+        cases that need to go through the group by group path
+        """
+        ids, _, ngroups = self.grouper.group_info
+        if (self.axis != 0 or len(result) != ngroups or len(ids) != len(obj)
+                or type(obj) not in (Series, DataFrame)):
+            raise NotImplementedError
+
+        if isinstance(obj, Series):
+            values = com.take_1d(result.values, ids)
+            return Series(values, index=obj.index, name=obj.name)
+
+        # block by block, so every column keeps the dtype of its reduction
+        mgr = result._data.reindex_indexer(obj.index, ids, axis=1,
+                                           allow_dups=True)
+        return DataFrame(mgr)
+
     def _python_agg_general(self, func, *args, **kwargs):
         func = _intercept_function(func)
         f = lambda x: func(x, *args, **kwargs)
@@ -1561,6 +1812,103 @@ class BaseGrouper(object):
 
         return result
 
+    #------------------------------------------------------------
+    # Cumulative functions
+
+    _cython_cum_functions = {
+        'cumsum': ('group_cumsum', 0, 0),
+        'cumprod': ('group_cumprod', 1, 1),
+        'cummin': ('group_cummin', np.inf, np.iinfo(np.int64).max),
+        'cummax': ('group_cummax', -np.inf, np.iinfo(np.int64).min),
+    }
+
+    def accumulate(self, values, how):
+        """
+        Cumulative function `how` of the 1 or 2-d values within each group,
+        computed in a single pass over the group labels. Returns an array
+        aligned with values; the rows that are not in any group are nan.
+        """
+        fname, float_start, int_start = self._cython_cum_functions[how]
+        comp_ids, _, ngroups = self.group_info
+
+        vdim = values.ndim
+        if vdim == 1:
+            values = values[:, None]
+
+        orig_dtype = values.dtype
+        if issubclass(orig_dtype.type, (np.integer, np.bool_)):
+            if (comp_ids < 0).any():
+                # the ungrouped rows are nan, so we need floats
+                values = values.astype('float64')
+            else:
+                values = values.astype('int64')
+        elif issubclass(orig_dtype.type, np.floating):
+            if orig_dtype != np.float32:
+                values = values.astype('float64')
+        else:
+            raise NotImplementedError("function is not implemented for this "
+                                      "dtype: [how->%s,dtype->%s]" %
+                                      (how, orig_dtype.name))
+
+        func = getattr(_algos, '%s_%s' % (fname, values.dtype.name))
+
+        if values.dtype == np.int64:
+            start = int_start
+        else:
+            start = float_start
+        accum = np.empty((ngroups, values.shape[1]), dtype=values.dtype)
+        accum.fill(start)
+
+        result = np.empty(values.shape, dtype=values.dtype)
+        if values.dtype != np.int64:
+            result.fill(np.nan)
+
+        func(result, values, comp_ids, accum)
+
+        # mimic the dtypes of the non-grouped cumulative functions
+        if orig_dtype.kind == 'f':
+            result = result.astype(orig_dtype)
+        elif how in ('cummin', 'cummax') and result.dtype == np.int64:
+            result = result.astype(orig_dtype)
+
+        if vdim == 1:
+            result = result[:, 0]
+
+        return result
+
+    def shift_indexer(self, periods=1):
+        """
+        Indexer taking each row to the row `periods` rows earlier within
+        its group, -1 where there is none
+        """
+        comp_ids, _, ngroups = self.group_info
+        return _algos.group_shift_indexer(comp_ids, ngroups, int(periods))
+
+    def quantile(self, values, qs, interpolation='fraction'):
+        """
+        Quantiles qs of the 2-d float64 values within each group, with a
+        column for each column of values and q
+        """
+        comp_ids, _, ngroups = self.group_info
+        result = np.empty((ngroups, values.shape[1] * len(qs)),
+                          dtype=np.float64)
+        counts = np.zeros(ngroups, dtype=np.int64)
+        _algos.group_quantile(result, counts, values, comp_ids, qs,
+                              interpolation)
+        return result
+
+    def rank(self, values, **kwargs):
+        """
+        Ranks of the float64 values within each group, the rows that are
+        not in any group are nan
+        """
+        comp_ids, _, ngroups = self.group_info
+        result = np.empty(len(values), dtype=np.float64)
+        result.fill(np.nan)
+        _algos.group_rank_float64(result, values, comp_ids, ngroups,
+                                  **kwargs)
+        return result
+
     def agg_series(self, obj, func):
         try:
             return self._aggregate_series_fast(obj, func)
@@ -1743,6 +2091,20 @@ class BinGrouper(BaseGrouper):
     def ngroups(self):
         return len(self.binlabels)
 
+    @cache_readonly
+    def group_info(self):
+        # the rows of a bin are labelled with the position of its label in
+        # the result index, -1 for a NaT label
+        is_nat = self.binlabels.asi8 == tslib.iNaT
+        label_ids = np.where(is_nat, -1, (~is_nat).cumsum() - 1)
+
+        nbins = min(len(self.bins), len(label_ids))
+        sizes = np.diff(np.r_[0, self.bins[:nbins]])
+        comp_ids = np.repeat(label_ids[:nbins], sizes)
+
+        ngroups = len(self.result_index)
+        return com._ensure_int64(comp_ids), np.arange(ngroups), ngroups
+
     @cache_readonly
     def result_index(self):
         mask = self.binlabels.asi8 == tslib.iNaT
@@ -1863,6 +2225,9 @@ class Grouping(object):
 
         if isinstance(grouper, MultiIndex):
             self.grouper = grouper.values
+        elif isinstance(grouper, CategoricalIndex):
+            # group on the codes, as for a passed Categorical
+            self.grouper = grouper._data
 
         # pre-computed
         self._was_factor = False
@@ -2383,7 +2748,7 @@ class SeriesGroupBy(GroupBy):
 
         # if string function
         if isinstance(func, compat.string_types):
-            return self._transform_fast(lambda : getattr(self, func)(*args, **kwargs))
+            return self._transform_fast(func, *args, **kwargs)
 
         # do we have a cython function
         cyfunc = _intercept_cython(func)
@@ -2419,13 +2784,18 @@ class SeriesGroupBy(GroupBy):
                                             index=self._selected_obj.index,
                                             name=self._selected_obj.name)
 
-    def _transform_fast(self, func):
+    def _transform_fast(self, func, *args, **kwargs):
         """
         fast version of transform, only applicable to builtin/cythonizable functions
         """
-        if isinstance(func, compat.string_types):
-            func = getattr(self,func)
-        values = func().values
+        result = getattr(self, func)(*args, **kwargs)
+        if func in _reduction_transforms:
+            try:
+                return self._broadcast_reduction(result, self._selected_obj)
+            except NotImplementedError:
+                pass
+
+        values = result.values
         counts = self.count().values
         values = np.repeat(values, com._ensure_platform_int(counts))
 
@@ -2472,6 +2842,160 @@ class SeriesGroupBy(GroupBy):
         filtered = self._apply_filter(indices, dropna)
         return filtered
 
+    def _value_group_codes(self, dropna=True, sort=False):
+        """
+        Factorize the values once for the distinct value methods
+
+        Returns the group ids and value codes of the rows that are in a
+        group, with the null values removed if dropna (otherwise they get
+        the code len(uniques)), the uniques and the number of groups. None
+        if the values have to go through apply.
+        """
+        values = self._selected_obj.values
+        if (isinstance(self.grouper, BinGrouper) or len(values) == 0 or
+                not isinstance(values, np.ndarray) or
+                (values.dtype == np.object_ and
+                 com.is_period_arraylike(values))):
+            return None
+
+        ids, _, ngroups = self.grouper.group_info
+        if ngroups == 0:
+            return None
+
+        labels, uniques = algos.factorize(values, sort=sort)
+        labels = com._ensure_int64(labels)
+
+        mask = ids >= 0
+        if dropna:
+            mask &= labels >= 0
+        else:
+            labels = np.where(labels < 0, len(uniques), labels)
+
+        return ids[mask], labels[mask], uniques, ngroups
+
+    def nunique(self, dropna=True):
+        """
+        Number of distinct values in each group
+
+        Parameters
+        ----------
+        dropna : boolean, default True
+            Don't include NaN in the counts.
+
+        Returns
+        -------
+        nunique : Series
+        """
+        codes = None
+        if dropna:
+            codes = self._value_group_codes()
+        if codes is None:
+            return self._make_wrapper('nunique')(dropna=dropna)
+        ids, labels, uniques, ngroups = codes
+
+        # each distinct (group, value) pair once
+        nvalues = len(uniques) + 1
+        pairs = algos.unique(ids * nvalues + labels)
+
+        counts = np.bincount(pairs // nvalues, minlength=ngroups)
+        return Series(counts, index=self.grouper.result_index,
+                      name=self.name)
+
+    def value_counts(self, normalize=False, sort=True, ascending=False,
+                     bins=None, dropna=True):
+        """
+        Counts of the distinct values in each group, indexed by the group
+        keys and the values
+
+        Parameters
+        ----------
+        normalize : boolean, default False
+            If True, the counts are relative to the size of their group.
+        sort : boolean, default True
+            Sort the values of each group by their counts
+        ascending : boolean, default False
+            Sort in ascending order
+        bins : integer, optional
+            Rather than count values, group them into half-open bins,
+            a convenience for pd.cut, only works with numeric data
+        dropna : boolean, default True
+            Don't include counts of NaN.
+
+        Returns
+        -------
+        counts : Series
+        """
+        codes = None
+        if bins is None and dropna:
+            codes = self._value_group_codes(sort=True)
+        if codes is None:
+            return self._make_wrapper('value_counts')(
+                normalize=normalize, sort=sort, ascending=ascending,
+                bins=bins, dropna=dropna)
+        ids, labels, uniques, ngroups = codes
+
+        nvalues = len(uniques) + 1
+        pair_ids, pairs = algos.factorize(ids * nvalues + labels)
+        counts = np.bincount(pair_ids, minlength=len(pairs))
+        gids, vals = pairs // nvalues, pairs % nvalues
+
+        # groups in order, and within them by count or by first appearance
+        if sort:
+            order = np.lexsort((counts if ascending else -counts, gids))
+        else:
+            order = gids.argsort(kind='mergesort')
+        gids, vals, counts = gids[order], vals[order], counts[order]
+
+        if normalize:
+            comp_ids = self.grouper.group_info[0]
+            sizes = np.bincount(comp_ids[comp_ids >= 0], minlength=ngroups)
+            counts = counts / sizes.take(gids).astype('float64')
+
+        result_index = self.grouper.result_index
+        if isinstance(result_index, MultiIndex):
+            levels = list(result_index.levels)
+            labels = [np.asarray(lab).take(gids)
+                      for lab in result_index.labels]
+        else:
+            levels, labels = [result_index], [gids]
+
+        index = MultiIndex(levels=levels + [uniques], labels=labels + [vals],
+                           names=list(self.grouper.names) + [None],
+                           verify_integrity=False)
+        return Series(counts, index=index)
+
+    def unique(self):
+        """
+        Distinct values of each group, in order of appearance
+
+        Returns
+        -------
+        uniques : Series of ndarrays
+        """
+        codes = None
+        values = self._selected_obj.values
+        if isinstance(values, np.ndarray) and (values.dtype.kind in 'biuf' or
+                                               (values.dtype == np.object_ and
+                                                not isnull(values).any())):
+            codes = self._value_group_codes(dropna=False)
+        if codes is None:
+            return self._make_wrapper('unique')()
+        ids, labels, uniques, ngroups = codes
+
+        # each distinct (group, value) pair once, in order of appearance
+        nvalues = len(uniques) + 1
+        pairs = algos.unique(ids * nvalues + labels)
+        gids = pairs // nvalues
+        pairs = pairs.take(gids.argsort(kind='mergesort'))
+
+        vals = pairs % nvalues
+        vals[vals == len(uniques)] = -1
+        values = com.take_1d(uniques, vals, fill_value=np.nan)
+
+        ends = np.bincount(gids, minlength=ngroups).cumsum()
+        return Series(np.split(values, ends[:-1]),
+                      index=self.grouper.result_index, name=self.name)
+
     def _apply_to_column_groupbys(self, func):
         """ return a pass thru """
         return func(self)
@@ -2969,11 +3493,12 @@ class NDFrameGroupBy(GroupBy):
         try:
             obj = self._obj_with_exclusions
             if isinstance(func, compat.string_types):
+                how = func
                 result = getattr(self, func)(*args, **kwargs)
             else:
-                cyfunc = _intercept_cython(func)
-                if cyfunc and not args and not kwargs:
-                    result = getattr(self, cyfunc)()
+                how = _intercept_cython(func)
+                if how and not args and not kwargs:
+                    result = getattr(self, how)()
                 else:
                     return self._transform_general(func, *args, **kwargs)
         except:
@@ -2987,6 +3512,13 @@ class NDFrameGroupBy(GroupBy):
         if not result.columns.equals(obj.columns):
             return self._transform_general(func, *args, **kwargs)
 
+        # one row per group, taken back to the rows by the group ids
+        if how in _reduction_transforms:
+            try:
+                return self._broadcast_reduction(result, obj)
+            except NotImplementedError:
+                pass
+
         # a grouped that doesn't preserve the index, remap index based on the grouper
         # and broadcast it
         if ((not isinstance(obj.index,MultiIndex) and
@@ -3729,6 +4261,13 @@ _cython_table = {
 }
 
 
+# reductions giving one row per group, which transform broadcasts back
+# to the rows with the group ids
+_reduction_transforms = frozenset(['sum', 'prod', 'min', 'max', 'mean',
+                                   'median', 'var', 'std', 'sem', 'first',
+                                   'last', 'count', 'size'])
+
+
 def _intercept_function(func):
     return _func_table.get(func, func)
 
@@ -71,6 +71,7 @@ def _new_Index(cls, d):
         and breaks __new__ """
     return cls.__new__(cls, **d)
 
+
 class Index(IndexOpsMixin, PandasObject):
 
     """
@@ -107,6 +108,10 @@ class Index(IndexOpsMixin, PandasObject):
 
     _typ = 'index'
     _data = None
+
+    # [engine or None], shared with the indexes derived from this one that
+    # hold the same values, see _share_engine
+    _engine_slot = None
     _id = None
     name = None
     asi8 = None
@@ -126,6 +131,9 @@ class Index(IndexOpsMixin, PandasObject):
         if fastpath:
             return cls._simple_new(data, name)
 
+        if com.is_categorical_dtype(data) or com.is_categorical_dtype(dtype):
+            return CategoricalIndex(data, copy=copy, name=name, **kwargs)
+
         from pandas.tseries.period import PeriodIndex
         if isinstance(data, (np.ndarray, Index, ABCSeries)):
             if issubclass(data.dtype.type, np.datetime64):
@@ -352,11 +360,40 @@ class Index(IndexOpsMixin, PandasObject):
     def _shallow_copy(self, values=None, **kwargs):
         """ create a new Index, don't copy the data, use the same object attributes
             with passed in attributes taking precedence """
+        same_values = values is None
         if values is None:
             values = self.values
         attributes = self._get_attributes_dict()
         attributes.update(kwargs)
-        return self.__class__._simple_new(values,**attributes)
+        result = self.__class__._simple_new(values,**attributes)
+        if same_values:
+            self._share_engine(result)
+        return result
+
+    def _share_engine(self, other):
+        """
+        Let other, an index derived from this one holding the same values,
+        share its engine, so that the hash table and the uniqueness and
+        monotonicity checks are only computed once, by whichever of the
+        indexes needs them first
+        """
+        slot = self._engine_slot
+        if slot is None:
+            cache = getattr(self, '_cache', None) or {}
+            slot = self._engine_slot = [cache.get('_engine')]
+        other._engine_slot = slot
+
+    def _get_shared_engine(self, make_engine):
+        """
+        Return the engine shared with the indexes derived from this one (see
+        _share_engine), calling make_engine if none of them has built it
+        """
+        slot = self._engine_slot
+        if slot is None:
+            return make_engine()
+        if slot[0] is None:
+            slot[0] = make_engine()
+        return slot[0]
 
     def copy(self, names=None, name=None, dtype=None, deep=False):
         """
@@ -774,7 +811,21 @@ class Index(IndexOpsMixin, PandasObject):
     @cache_readonly
     def _engine(self):
         # property, for now, slow to look up
-        return self._engine_type(lambda: self.values, len(self))
+        def make_engine():
+            engine_type = self._engine_type
+            if (engine_type is _index.ObjectEngine and
+                    self.inferred_type == 'string'):
+                engine_type = _index.StringEngine
+            return engine_type(lambda: self.values, len(self))
+        return self._get_shared_engine(make_engine)
+
+    @Appender(IndexOpsMixin.memory_usage.__doc__)
+    def memory_usage(self, deep=False):
+        result = super(Index, self).memory_usage(deep=deep)
+
+        # include the hash table of the engine, if it has been built
+        result += self._engine.sizeof(deep=deep)
+        return result
 
     def _validate_index_level(self, level):
         """
@@ -893,6 +944,9 @@ class Index(IndexOpsMixin, PandasObject):
         if isinstance(key, slice):
             # This case is separated from the conditional above to avoid
             # pessimization of basic indexing.
+            if key.indices(len(self)) == (0, len(self), 1):
+                # all the values, sharing the engine
+                return promote()
             return promote(getitem(key))
 
         if com._is_bool_indexer(key):
@@ -1192,7 +1246,7 @@ class Index(IndexOpsMixin, PandasObject):
             other = other.astype('O')
             return this.union(other)
 
-        if self.is_monotonic and other.is_monotonic:
+        if self._can_merge_setop(other):
             try:
                 result = self._outer_indexer(self.values, other.values)[0]
             except TypeError:
@@ -1266,7 +1320,7 @@ class Index(IndexOpsMixin, PandasObject):
             other = other.astype('O')
             return this.intersection(other)
 
-        if self.is_monotonic and other.is_monotonic:
+        if self._can_merge_setop(other):
             try:
                 result = self._inner_indexer(self.values, other.values)[0]
                 return self._wrap_union_result(other, result)
@@ -1317,6 +1371,19 @@ class Index(IndexOpsMixin, PandasObject):
         else:
             result_name = self.name if self.name == other.name else None
 
+        if self.is_unique and self._can_merge_setop(other):
+            # positions in self of the values of other, in one pass
+            try:
+                indexer = self._left_indexer_unique(other.values, self.values)
+            except TypeError:
+                pass
+            else:
+                mask = np.ones(len(self), dtype=bool)
+                mask[indexer[indexer != -1]] = False
+                result = self.take(mask.nonzero()[0])
+                result.name = result_name
+                return result
+
         theDiff = sorted(set(self) - set(other))
         return Index(theDiff, name=result_name)
 
@@ -1364,9 +1431,31 @@ class Index(IndexOpsMixin, PandasObject):
             other = Index(other)
             result_name = result_name or self.name
 
+        if (self.is_unique and other.is_unique and
+                self._can_merge_setop(other)):
+            # the values of the outer join found on one side only
+            try:
+                joined, lidx, ridx = self._outer_indexer(self.values,
+                                                         other.values)
+            except TypeError:
+                pass
+            else:
+                result = self._wrap_union_result(
+                    other, joined[(lidx == -1) | (ridx == -1)])
+                result.name = result_name
+                return result
+
         the_diff = sorted(set((self.difference(other)).union(other.difference(self))))
         return Index(the_diff, name=result_name)
 
+    def _can_merge_setop(self, other):
+        """
+        Whether a set operation with other can be computed in one pass over
+        the sorted values, with the join indexer functions
+        """
+        return (isinstance(other, Index) and self.dtype == other.dtype and
+                self.is_monotonic and other.is_monotonic)
+
     def get_loc(self, key):
         """
         Get integer location for requested label
@@ -1467,6 +1556,9 @@ class Index(IndexOpsMixin, PandasObject):
         """
         method = self._get_method(method)
         target = _ensure_index(target)
+        if isinstance(target, CategoricalIndex):
+            # look up the dense labels
+            target = Index(target.values, name=target.name)
 
         pself, ptarget = self._possibly_promote(target)
         if pself is not self or ptarget is not target:
@@ -2255,6 +2347,257 @@ class Int64Index(NumericIndex):
         return Int64Index(joined, name=name)
 Int64Index._add_numeric_methods()
 
+
+class RangeIndex(Int64Index):
+
+    """
+    Immutable Index implementing a monotonic integer range, as the built-in
+    ``range``. RangeIndex only stores its start, stop and step: lookups,
+    slicing, ``take``, ``union`` and ``append`` are computed from the range,
+    and the array of its values is built only when it is needed. This is the
+    default index type used by the DataFrame and Series ctors when no
+    explicit index is provided by the user.
+
+    Parameters
+    ----------
+    start : int (default: 0), or other RangeIndex
+    stop : int (default: 0)
+        If stop is not given, start is used as stop and the range starts at 0
+    step : int (default: 1)
+    name : object
+        Name to be stored in the index
+    """
+
+    def __new__(cls, start=None, stop=None, step=None, name=None,
+                dtype=None, copy=False, fastpath=False, data=None, **kwargs):
+
+        if fastpath:
+            return cls._from_range(start, stop, step, name=name)
+
+        if isinstance(start, RangeIndex):
+            if name is None:
+                name = start.name
+            return cls._from_range(start._start, start._stop, start._step,
+                                   name=name)
+
+        # values (e.g. from a method of Index) which are not a range
+        if (data is None and stop is None and step is None and
+                start is not None and not com.is_integer(start)):
+            data = start
+        if data is not None:
+            return Int64Index(data, dtype=dtype, copy=copy, name=name)
+
+        if start is None and stop is None:
+            start = stop = 0
+        elif stop is None:
+            start, stop = 0, start
+        elif start is None:
+            start = 0
+        if step is None:
+            step = 1
+
+        for value in [start, stop, step]:
+            if not com.is_integer(value):
+                raise TypeError('RangeIndex(...) must be called with '
+                                'integers, %r was passed' % value)
+        if step == 0:
+            raise ValueError('step must not be zero')
+
+        return cls._from_range(start, stop, step, name=name)
+
+    @classmethod
+    def _simple_new(cls, values, name=None, **kwargs):
+        # values (e.g. from a method of Index) which are not a range
+        return Int64Index._simple_new(values, name=name, **kwargs)
+
+    @classmethod
+    def _from_range(cls, start, stop, step, name=None, **kwargs):
+        result = object.__new__(cls)
+        result._start = int(start)
+        result._step = int(step)
+        # normalized so that equal ranges have equal attributes
+        length = max(0, -(-(int(stop) - result._start) // result._step))
+        result._stop = result._start + length * result._step
+        result.name = name
+        for k, v in compat.iteritems(kwargs):
+            setattr(result, k, v)
+        result._reset_identity()
+        return result
+
+    def __reduce__(self):
+        d = dict(start=self._start, stop=self._stop, step=self._step)
+        d.update(self._get_attributes_dict())
+        return _new_Index, (self.__class__, d), None
+
+    @cache_readonly
+    def _data(self):
+        return np.arange(self._start, self._stop, self._step, dtype=np.int64)
+
+    @cache_readonly
+    def _engine(self):
+        return _index.RangeEngine(lambda: self.values, self._start,
+                                  self._step, len(self))
+
+    @cache_readonly
+    def dtype(self):
+        return np.dtype(np.int64)
+
+    def __len__(self):
+        return (self._stop - self._start) // self._step
+
+    @Appender(IndexOpsMixin.memory_usage.__doc__)
+    def memory_usage(self, deep=False):
+        # only the values, if they have been built
+        if '_data' in getattr(self, '_cache', {}):
+            return self._data.nbytes
+        return 0
+
+    def _shallow_copy(self, values=None, **kwargs):
+        if values is not None:
+            return Int64Index._shallow_copy(self, values, **kwargs)
+
+        attributes = self._get_attributes_dict()
+        attributes.update(kwargs)
+        return RangeIndex._from_range(self._start, self._stop, self._step,
+                                      **attributes)
+
+    def copy(self, names=None, name=None, dtype=None, deep=False):
+        if names is not None and name is not None:
+            raise TypeError("Can only provide one of `names` and `name`")
+
+        # a RangeIndex holds no data, a deep copy only copies the name
+        new_index = self._shallow_copy()
+        if names is None and name is None:
+            if deep:
+                from copy import deepcopy
+                name = deepcopy(self.name)
+            else:
+                name = self.name
+        if name is not None:
+            names = [name]
+        if names:
+            new_index = new_index.set_names(names)
+        if dtype:
+            new_index = new_index.astype(dtype)
+        return new_index
+
+    def equals(self, other):
+        """
+        Determines if two Index objects contain the same elements.
+        """
+        if isinstance(other, RangeIndex):
+            return (self._start, self._stop, self._step) == \
+                (other._start, other._stop, other._step) or \
+                len(self) == len(other) == 0 or \
+                (len(self) == len(other) == 1 and
+                 self._start == other._start)
+        return super(RangeIndex, self).equals(other)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            return RangeIndex._from_range(self._start + start * self._step,
+                                          self._start + stop * self._step,
+                                          self._step * step, name=self.name)
+
+        if com.is_integer(key):
+            n = len(self)
+            if key < 0:
+                key += n
+            if not 0 <= key < n:
+                raise IndexError('index %d is out of bounds for size %d'
+                                 % (key, n))
+            return self._start + key * self._step
+
+        return super(RangeIndex, self).__getitem__(key)
+
+    def take(self, indexer, axis=0):
+        """
+        return a new Index of the values selected by the indexer
+
+        See also
+        --------
+        numpy.ndarray.take
+        """
+        indexer = com._ensure_platform_int(indexer)
+        n = len(self)
+        if len(indexer) and (indexer.min() < -n or indexer.max() >= n):
+            raise IndexError('index out of bounds')
+
+        indexer = np.where(indexer < 0, indexer + n, indexer)
+        taken = self._start + indexer.astype(np.int64) * self._step
+        return self._shallow_copy(taken, freq=None)
+
+    def union(self, other):
+        """
+        Form the union of two Index objects and sorts if possible
+
+        Parameters
+        ----------
+        other : Index or array-like
+
+        Returns
+        -------
+        union : Index
+        """
+        if isinstance(other, RangeIndex) and len(self) and len(other):
+            first, second = sorted([self, other], key=lambda x: x._start)
+            step = first._step
+            if (step > 0 and second._step == step and
+                    (second._start - first._start) % step == 0 and
+                    second._start <= first._stop):
+                name = self.name if self.name == other.name else None
+                return RangeIndex._from_range(
+                    first._start, max(first._stop, second._stop), step,
+                    name=name)
+
+        return super(RangeIndex, self).union(other)
+
+    def append(self, other):
+        """
+        Append a collection of Index options together
+
+        Parameters
+        ----------
+        other : Index or list/tuple of indices
+
+        Returns
+        -------
+        appended : Index
+        """
+        to_concat = [self]
+        if isinstance(other, (list, tuple)):
+            to_concat = to_concat + list(other)
+        else:
+            to_concat.append(other)
+
+        # ranges following each other make a range
+        if all(isinstance(obj, RangeIndex) for obj in to_concat):
+            name = self.name
+            if any(obj.name != name for obj in to_concat):
+                name = None
+
+            ranges = [obj for obj in to_concat if len(obj)]
+            if not ranges:
+                return RangeIndex._from_range(0, 0, 1, name=name)
+
+            start, step = ranges[0]._start, ranges[0]._step
+            if len(ranges) > 1 and len(ranges[0]) == 1:
+                step = ranges[1]._start - start
+            stop = start
+            for obj in ranges:
+                if obj._start != stop or (len(obj) > 1 and
+                                          obj._step != step):
+                    break
+                stop = obj._start + len(obj) * step
+            else:
+                if step != 0:
+                    return RangeIndex._from_range(start, stop, step,
+                                                  name=name)
+
+        return super(RangeIndex, self).append(other)
+
+
 class Float64Index(NumericIndex):
 
     """
@@ -2435,6 +2778,11 @@ class Float64Index(NumericIndex):
     def is_unique(self):
         return super(Float64Index, self).is_unique and self._nan_idxs.size < 2
 
+    def _can_merge_setop(self, other):
+        # NaNs are not ordered
+        return (super(Float64Index, self)._can_merge_setop(other) and
+                not self.hasnans and not other.hasnans)
+
     @Appender(Index.isin.__doc__)
     def isin(self, values, level=None):
         value_set = set(values)
@@ -2445,6 +2793,426 @@ class Float64Index(NumericIndex):
 Float64Index._add_numeric_methods()
 
 
+def _cat_index_cmp(opname):
+    """
+    Comparison operations of a CategoricalIndex: equality with a scalar is
+    computed on the codes, everything else on the dense values
+    """
+
+    def wrapper(self, other):
+        if opname in ('__eq__', '__ne__') and np.isscalar(other):
+            try:
+                code = self._get_code(other)
+            except (KeyError, TypeError):
+                code = -1
+
+            # null labels never compare equal
+            if code == -1:
+                result = np.zeros(len(self), dtype=bool)
+            else:
+                result = self._codes_int64 == code
+            return ~result if opname == '__ne__' else result
+
+        func = getattr(self.values, opname)
+        return func(np.asarray(other))
+
+    return wrapper
+
+
+class CategoricalIndex(Index):
+
+    """
+    Immutable Index holding its labels as a Categorical: small integer codes
+    into the (unique) categories. Lookups, reindexing and grouping are done on
+    the codes, which makes it a compact and fast index for labels with a low
+    cardinality.
+
+    Parameters
+    ----------
+    data : array-like or Categorical (1-dimensional)
+    categories : Index-like (unique), optional
+        The categories of the labels. If not given, the unique values of
+        data are used.
+    ordered : boolean, optional
+        Whether or not the categories are ordered
+    copy : bool
+        Make a copy of the codes
+    name : object
+        Name to be stored in the index
+    """
+
+    _typ = 'categoricalindex'
+    _engine_type = _index.Int64Engine
+
+    def _join_object_wrapper(joinf):
+        """ join on the dense values, as objects """
+
+        @staticmethod
+        def wrapper(left, right):
+            return joinf(_ensure_object(_values_from_object(left)),
+                         _ensure_object(_values_from_object(right)))
+
+        return wrapper
+
+    _left_indexer_unique = _join_object_wrapper(
+        _algos.left_join_indexer_unique_object)
+    _left_indexer = _join_object_wrapper(_algos.left_join_indexer_object)
+    _inner_indexer = _join_object_wrapper(_algos.inner_join_indexer_object)
+    _outer_indexer = _join_object_wrapper(_algos.outer_join_indexer_object)
+
+    __eq__ = _cat_index_cmp('__eq__')
+    __ne__ = _cat_index_cmp('__ne__')
+    __lt__ = _cat_index_cmp('__lt__')
+    __gt__ = _cat_index_cmp('__gt__')
+    __le__ = _cat_index_cmp('__le__')
+    __ge__ = _cat_index_cmp('__ge__')
+
+    def __new__(cls, data=None, categories=None, ordered=None, dtype=None,
+                copy=False, name=None, fastpath=False, **kwargs):
+        from pandas.core.categorical import Categorical
+
+        if fastpath:
+            return cls._simple_new(data, name)
+
+        if isinstance(data, CategoricalIndex):
+            if name is None:
+                name = data.name
+            data = data._data
+        elif isinstance(data, ABCSeries) and com.is_categorical_dtype(data):
+            data = data.values
+
+        if data is None or np.isscalar(data):
+            cls._scalar_data_error(data)
+
+        if (not isinstance(data, Categorical) or categories is not None or
+                ordered is not None):
+            data = Categorical(data, categories=categories, ordered=ordered)
+        elif copy:
+            data = data.copy()
+
+        return cls._simple_new(data, name)
+
+    def _create_from_codes(self, codes, **kwargs):
+        """ a new CategoricalIndex of my categories from codes """
+        from pandas.core.categorical import Categorical
+        cat = Categorical(codes, categories=self.categories,
+                          ordered=self.ordered, fastpath=True)
+        return self._simple_new(cat, kwargs.get('name', self.name))
+
+    def _shallow_copy(self, values=None, **kwargs):
+        from pandas.core.categorical import Categorical
+        if values is None:
+            result = super(CategoricalIndex, self)._shallow_copy(self._data,
+                                                                 **kwargs)
+            self._share_engine(result)
+            return result
+        elif not isinstance(values, Categorical):
+            values = Categorical(values, categories=self.categories,
+                                 ordered=self.ordered)
+        return super(CategoricalIndex, self)._shallow_copy(values, **kwargs)
+
+    @property
+    def codes(self):
+        """ the codes of the labels into the categories """
+        return self._data.codes
+
+    @property
+    def categories(self):
+        """ the categories of the labels """
+        return self._data.categories
+
+    @property
+    def ordered(self):
+        """ whether the categories are ordered """
+        return self._data.ordered
+
+    @cache_readonly
+    def _codes_int64(self):
+        return com._ensure_int64(self._data._codes)
+
+    @property
+    def values(self):
+        """ return the (dense) labels as an ndarray """
+        return np.asarray(self._data)
+
+    def __array__(self, result=None):
+        """ the array interface, return my (dense) values """
+        return self.values
+
+    def _array_values(self):
+        return self.values
+
+    def __unicode__(self):
+        """
+        Return a string representation for this object.
+
+        Invoked by unicode(df) in py2 only. Yields a Unicode String in both
+        py2/py3.
+        """
+        prepr = com.pprint_thing(self, escape_chars=('\t', '\r', '\n'),
+                                 quote_strings=True)
+        cats = com.pprint_thing(self.categories,
+                                escape_chars=('\t', '\r', '\n'),
+                                quote_strings=True)
+        return "%s(%s, categories=%s, ordered=%s, dtype='%s')" % (
+            type(self).__name__, prepr, cats, self.ordered, self.dtype)
+
+    @cache_readonly
+    def _engine(self):
+        # an engine over the codes, labels are translated to codes through
+        # the categories before any lookup
+        return self._get_shared_engine(
+            lambda: self._engine_type(lambda: self._codes_int64, len(self)))
+
+    @Appender(IndexOpsMixin.memory_usage.__doc__)
+    def memory_usage(self, deep=False):
+        result = self._data.memory_usage(deep=deep)
+        result += self._engine.sizeof(deep=deep)
+        return result
+
+    @cache_readonly
+    def inferred_type(self):
+        # labels behave as they would in an index of the categories
+        return self.categories.inferred_type
+
+    @cache_readonly
+    def is_all_dates(self):
+        return self.categories.is_all_dates
+
+    @property
+    def is_monotonic(self):
+        # sorted codes of sorted categories, without nulls (sorted first)
+        return (self._engine.is_monotonic and
+                self.categories.is_monotonic and
+                not (len(self) and self._codes_int64[0] == -1))
+
+    def _can_merge_setop(self, other):
+        # the sorted set operations would go through the dense values
+        return False
+
+    def _get_code(self, key):
+        """ the code of a label, -1 for a null label """
+        if lib.checknull(key):
+            return -1
+        code = self.categories.get_loc(key)
+        if not is_integer(code):
+            # e.g. a partial string label of datetime categories
+            raise KeyError(key)
+        return code
+
+    def _get_target_codes(self, target):
+        """
+        the codes of the labels of target in my categories: -1 for the null
+        labels and -2 for the labels that are not categories
+        """
+        from pandas.core.categorical import _get_codes_for_values
+        if isinstance(target, CategoricalIndex):
+            if target.categories.equals(self.categories):
+                return target._codes_int64
+            mapping = com._ensure_int64(
+                self.categories.get_indexer(target.categories))
+            mapping[mapping == -1] = -2
+            return com.take_1d(mapping, target._codes_int64, fill_value=-1)
+
+        values = target.values
+        codes = _get_codes_for_values(values, self.categories)
+        codes[codes == -1] = -2
+        codes[isnull(values)] = -1
+        return com._ensure_int64(codes)
+
+    def __contains__(self, key):
+        hash(key)
+        try:
+            return self._get_code(key) in self._engine
+        except (KeyError, TypeError):
+            return False
+
+    def get_loc(self, key):
+        """
+        Get integer location for requested label
+
+        Returns
+        -------
+        loc : int if unique index, possibly slice or mask if not
+        """
+        try:
+            return self._engine.get_loc(self._get_code(key))
+        except KeyError:
+            raise KeyError(key)
+
+    def get_value(self, series, key):
+        """
+        Fast lookup of value from 1-dimensional ndarray. Only use this if you
+        know what you're doing
+        """
+        s = _values_from_object(series)
+        try:
+            code = self._get_code(key)
+            return self._engine.get_value(s, code)
+        except KeyError:
+            # positional access, as for an object index
+            if (is_integer(key) and
+                    self.inferred_type not in ['integer', 'boolean']):
+                return tslib.get_value_box(s, key)
+            raise KeyError(key)
+        except TypeError:
+            # python 3
+            if np.isscalar(key):  # pragma: no cover
+                raise IndexError(key)
+            raise InvalidIndexError(key)
+
+    def set_value(self, arr, key, value):
+        """
+        Fast lookup of value from 1-dimensional ndarray. Only use this if you
+        know what you're doing
+        """
+        try:
+            code = self._get_code(key)
+        except TypeError:
+            raise InvalidIndexError(key)
+        self._engine.set_value(_values_from_object(arr), code, value)
+
+    def get_indexer(self, target, method=None, limit=None):
+        method = self._get_method(method)
+        target = _ensure_index(target)
+
+        if method is not None:
+            # filling needs the order of the labels
+            return Index(self.values, name=self.name).get_indexer(
+                target, method=method, limit=limit)
+
+        if not self.is_unique:
+            raise InvalidIndexError('Reindexing only valid with uniquely'
+                                    ' valued Index objects')
+
+        indexer = self._engine.get_indexer(self._get_target_codes(target))
+        return com._ensure_platform_int(indexer)
+
+    def get_indexer_non_unique(self, target, **kwargs):
+        target = _ensure_index(target)
+        codes = self._get_target_codes(target)
+        indexer, missing = self._engine.get_indexer_non_unique(codes)
+        return Index(indexer), missing
+
+    def groupby(self, to_groupby):
+        return self._groupby(self.values.astype(object),
+                             _values_from_object(to_groupby))
+
+    def map(self, mapper):
+        # map the categories only, nulls stay null
+        mapped = np.asarray(self.categories.map(mapper))
+        return com.take_1d(mapped, self._data._codes)
+
+    @Appender(Index.isin.__doc__)
+    def isin(self, values, level=None):
+        value_set = set(values)
+        if level is not None:
+            self._validate_index_level(level)
+        found = lib.ismember(_ensure_object(self.categories.values),
+                             value_set)
+        has_null = isnull(list(value_set)).any()
+        return np.append(found, has_null).take(self._data._codes)
+
+    def equals(self, other):
+        """
+        Determines if two Index objects contain the same elements.
+        """
+        if self.is_(other):
+            return True
+
+        if not isinstance(other, Index):
+            return False
+
+        if (isinstance(other, CategoricalIndex) and
+                self.categories.equals(other.categories)):
+            return np.array_equal(self._data._codes, other._data._codes)
+
+        try:
+            return array_equivalent(self.values, np.asarray(other))
+        except (TypeError, ValueError):
+            return False
+
+    def astype(self, dtype):
+        if com.is_categorical_dtype(dtype):
+            return self.copy()
+        return Index(self.values.astype(dtype), name=self.name)
+
+    def take(self, indexer, axis=0):
+        """
+        return a new Index of the values selected by the indexer
+
+        See also
+        --------
+        numpy.ndarray.take
+        """
+        indexer = com._ensure_platform_int(indexer)
+        return self._create_from_codes(self._data._codes.take(indexer))
+
+    def delete(self, loc):
+        """
+        Make new Index with passed location(-s) deleted
+
+        Returns
+        -------
+        new_index : CategoricalIndex
+        """
+        return self._create_from_codes(np.delete(self._data._codes, loc))
+
+    def insert(self, loc, item):
+        """
+        Make new Index inserting new item at location. Follows
+        Python list.append semantics for negative values
+
+        Parameters
+        ----------
+        loc : int
+        item : object, must be a category (or null)
+
+        Returns
+        -------
+        new_index : CategoricalIndex
+        """
+        try:
+            code = self._get_code(item)
+        except KeyError:
+            raise TypeError("cannot insert an item that is not a category "
+                            "into a CategoricalIndex")
+        codes = self._data._codes
+        codes = np.concatenate((codes[:loc], [code], codes[loc:]))
+        return self._create_from_codes(codes.astype(self._data._codes.dtype))
+
+    def append(self, other):
+        """
+        Append a collection of Index options together
+
+        Parameters
+        ----------
+        other : Index or list/tuple of indices
+
+        Returns
+        -------
+        appended : Index
+        """
+        to_concat = [self]
+        if isinstance(other, (list, tuple)):
+            to_concat = to_concat + list(other)
+        else:
+            to_concat.append(other)
+
+        # with the same categories, the codes can be concatenated
+        if all(isinstance(obj, CategoricalIndex) and
+               obj.categories.equals(self.categories) for obj in to_concat):
+            name = self.name
+            if any(obj.name != name for obj in to_concat):
+                name = None
+            codes = np.concatenate([obj._data._codes for obj in to_concat])
+            return self._create_from_codes(codes, name=name)
+
+        return super(CategoricalIndex, self).append(other)
+
+CategoricalIndex._add_numeric_methods_disabled()
+
+
 class MultiIndex(Index):
 
     """
@@ -2931,6 +3699,38 @@ class MultiIndex(Index):
         self._tuples = lib.fast_zip(values)
         return self._tuples
 
+    @cache_readonly
+    def _engine(self):
+        # look up the labels of the levels packed into int64 keys, unless
+        # they do not fit in 63 bits
+        offsets = _index.get_label_offsets([len(lev) for lev in self.levels])
+        if offsets is None:
+            return _index.ObjectEngine(lambda: self.values, len(self))
+        return _index.MultiIndexEngine(self.levels, self.labels, offsets,
+                                       len(self))
+
+    @property
+    def is_monotonic(self):
+        """ return if the index has monotonic (only equaly or increasing) values """
+        # the packed labels of the engine are ordered as the values only if
+        # the levels are sorted
+        if all(lev.is_monotonic for lev in self.levels):
+            return self._engine.is_monotonic
+        return self._tuple_index.is_monotonic
+
+    @Appender(IndexOpsMixin.memory_usage.__doc__)
+    def memory_usage(self, deep=False):
+        # the levels and labels, without building the array of tuples
+        result = sum(lev.memory_usage(deep=deep) for lev in self.levels)
+        result += sum(lab.nbytes for lab in self.labels)
+        if self._tuples is not None:
+            result += self._tuples.nbytes
+            if deep:
+                result += lib.memory_usage_of_objects(self._tuples)
+
+        result += self._engine.sizeof(deep=deep)
+        return result
+
     # fml
     @property
     def _is_v1(self):
@@ -3654,6 +4454,17 @@ class MultiIndex(Index):
 
         target = _ensure_index(target)
 
+        if (method is None and isinstance(target, MultiIndex) and
+                isinstance(self._engine, _index.MultiIndexEngine)):
+            if not self.is_unique:
+                raise Exception('Reindexing only valid with uniquely valued '
+                                'Index objects')
+
+            # translate the labels of target, without building its tuples
+            indexer = self._engine.get_indexer_labels(target.levels,
+                                                      target.labels)
+            return com._ensure_platform_int(indexer)
+
         target_index = target
         if isinstance(target, MultiIndex):
             target_index = target._tuple_index
@@ -3724,6 +4535,13 @@ class MultiIndex(Index):
 
         return target, indexer
 
+    def get_indexer_non_unique(self, target, **kwargs):
+        # the engine does not hold the tuples, look them up in an Index
+        target = _ensure_index(target)
+        if isinstance(target, MultiIndex):
+            target = target._tuple_index
+        return self._tuple_index.get_indexer_non_unique(target, **kwargs)
+
     @cache_readonly
     def _tuple_index(self):
         """
@@ -4192,6 +5010,11 @@ class MultiIndex(Index):
 
         result_names = self.names if self.names == other.names else None
 
+        if self._can_merge_labels(other):
+            keys = _algos.outer_join_indexer_int64(
+                *self._packed_labels(other))[0]
+            return self._from_packed_labels(keys, result_names)
+
         uniq_tuples = lib.fast_unique_multiple([self.values, other.values])
         return MultiIndex.from_arrays(lzip(*uniq_tuples), sortorder=0,
                                       names=result_names)
@@ -4215,6 +5038,12 @@ class MultiIndex(Index):
 
         result_names = self.names if self.names == other.names else None
 
+        if self._can_merge_labels(other):
+            keys = _algos.inner_join_indexer_int64(
+                *self._packed_labels(other))[0]
+            if len(keys):
+                return self._from_packed_labels(keys, result_names)
+
         self_tuples = self.values
         other_tuples = other.values
         uniq_tuples = sorted(set(self_tuples) & set(other_tuples))
@@ -4253,6 +5082,14 @@ class MultiIndex(Index):
                               labels=[[]] * self.nlevels,
                               names=result_names, verify_integrity=False)
 
+        if self._can_merge_labels(other):
+            keys, other_keys = self._packed_labels(other)
+            indexer = _algos.left_join_indexer_unique_int64(other_keys, keys)
+            mask = np.ones(len(self), dtype=bool)
+            mask[indexer[indexer != -1]] = False
+            if mask.any():
+                return self._from_packed_labels(keys[mask], result_names)
+
         difference = sorted(set(self.values) - set(other.values))
 
         if len(difference) == 0:
@@ -4266,6 +5103,30 @@ class MultiIndex(Index):
     def _assert_can_do_setop(self, other):
         pass
 
+    def _can_merge_labels(self, other):
+        """
+        Whether a set operation with other can be computed in one pass over
+        the packed labels of the engines: both need the same sorted levels
+        (for the packed labels to be comparable and ordered as the values),
+        and unique sorted values
+        """
+        return (isinstance(other, MultiIndex) and
+                isinstance(self._engine, _index.MultiIndexEngine) and
+                all(lev.is_monotonic for lev in self.levels) and
+                self.equal_levels(other) and
+                self.is_monotonic and other.is_monotonic and
+                self.is_unique and other.is_unique)
+
+    def _packed_labels(self, other):
+        """ the packed labels of self and of other (with the same levels) """
+        return (self._engine.pack_labels(self.labels),
+                self._engine.pack_labels(other.labels))
+
+    def _from_packed_labels(self, keys, names):
+        return MultiIndex(levels=self.levels,
+                          labels=self._engine.unpack_labels(keys),
+                          names=names, verify_integrity=False)
+
     def astype(self, dtype):
         if np.dtype(dtype) != np.object_:
             raise TypeError('Setting %s dtype to anything other than object '
@@ -1232,6 +1232,51 @@ class _LocIndexer(_LocationIndexer):
                     "index is integers), listlike of labels, boolean")
     _exception = KeyError
 
+    def __getitem__(self, key):
+        if type(key) is tuple:
+            locs = self._scalar_locs(key)
+            if locs is not None:
+                return self.obj.get_value(locs[0], locs[1], takeable=True)
+        return super(_LocIndexer, self).__getitem__(key)
+
+    def __setitem__(self, key, value):
+        if type(key) is tuple:
+            locs = self._scalar_locs(key)
+            if locs is not None:
+                # write straight into the block when it can hold the value
+                self.obj._check_is_chained_assignment_possible()
+                if self.obj._data.iset_scalar(locs[1], locs[0], value):
+                    self.obj._maybe_update_cacher()
+                    return
+        super(_LocIndexer, self).__setitem__(key, value)
+
+    def _scalar_locs(self, key):
+        """
+        Return the positions [row, column] of a pair of scalar labels each
+        found once in the axes of a DataFrame, or None for the keys which go
+        through the general path (which raises for the missing labels)
+        """
+        obj = self.obj
+        if (len(key) != 2 or self.axis is not None or
+                not isinstance(obj, ABCDataFrame)):
+            return None
+
+        locs = []
+        for label, ax in zip(key, obj.axes):
+            # strings on datetimelike axes may be partial dates
+            if (label is None or not lib.isscalar(label) or
+                    (isinstance(label, compat.string_types) and
+                     ax.is_all_dates)):
+                return None
+            try:
+                loc = ax.get_loc(label)
+            except Exception:
+                return None
+            if not com.is_integer(loc):
+                return None
+            locs.append(loc)
+        return locs
+
     def _has_valid_type(self, key, axis):
         ax = self.obj._get_axis(axis)
 
@@ -2,6 +2,7 @@ import copy
 import itertools
 import re
 import operator
+import weakref
 from datetime import datetime, timedelta
 from collections import defaultdict
 
@@ -21,6 +22,8 @@ import pandas.core.common as com
 from pandas.sparse.array import _maybe_to_sparse, SparseArray
 import pandas.lib as lib
 import pandas.tslib as tslib
+import pandas.index as _index
+import pandas.algos as _algos
 import pandas.computation.expressions as expressions
 from pandas.util.decorators import cache_readonly
 
@@ -31,6 +34,96 @@ from pandas.tseries.timedeltas import _coerce_scalar_to_timedelta_type
 
 
 from pandas.lib import BlockPlacement
+from pandas.core.config import get_option
+
+# copy-on-write mode, see Block._copy_on_write
+_copy_on_write_mode = False
+
+
+def _use_copy_on_write(key):
+    """Option change callback for the copy-on-write mode"""
+    globals()['_copy_on_write_mode'] = get_option(key)
+
+
+def _copy_shared_values(blocks):
+    """
+    Give the blocks, which share (views of) the same values, a copy of their
+    values of their own. A block taken as a view of another block of the
+    group is taken again from the copy of the latter, so that the views
+    between them are kept.
+    """
+    refs = [weakref.ref(b) for b in blocks]
+    members = dict((id(b), b) for b in blocks)
+    copied = set()
+
+    def _copy(b):
+        if id(b) in copied:
+            return
+        copied.add(id(b))
+
+        source = indexer = None
+        if b._view_of is not None:
+            source, indexer = b._view_of[0](), b._view_of[1]
+        if (source is not None and id(source) in members and
+                isinstance(b.values, np.ndarray)):
+            _copy(source)
+            b.values = source.values[indexer]
+        else:
+            b.values = b.values.copy()
+            b._view_of = None
+        b._refs = refs
+
+    for b in blocks:
+        _copy(b)
+
+# number of threads of BlockManager.apply (compute.nthreads option) and the
+# (lazily created) thread pool
+_apply_nthreads = 1
+_apply_pool = None
+
+# the block operations that BlockManager.apply may run on several blocks at
+# once; where and eval are not included as they already go through the
+# threads of numexpr
+_threaded_apply_funcs = frozenset(['astype', 'fillna', 'putmask', 'shift',
+                                   'interpolate', 'diff'])
+
+# number of elements above which a block is split along the items axis
+# between the threads
+_apply_split_size = 1000000
+
+
+def _set_apply_nthreads(key):
+    """Option change callback for the number of threads of apply"""
+    global _apply_nthreads, _apply_pool
+    nthreads = max(get_option(key), 1)
+    if nthreads != _apply_nthreads:
+        if _apply_pool is not None:
+            _apply_pool.close()
+        _apply_pool = None
+        _apply_nthreads = nthreads
+
+
+def _get_apply_pool():
+    global _apply_pool
+    if _apply_pool is None:
+        from multiprocessing.pool import ThreadPool
+        _apply_pool = ThreadPool(_apply_nthreads)
+    return _apply_pool
+
+
+def _split_block(block, n):
+    """
+    split a large block along the items axis into (at most) n blocks viewing
+    its values, return a list of blocks
+    """
+    nitems = len(block.mgr_locs)
+    if (block.ndim < 2 or nitems < 2 or not block._can_consolidate or
+            np.prod(block.shape) < _apply_split_size):
+        return [block]
+
+    bounds = np.linspace(0, nitems, min(n, nitems) + 1).astype(int)
+    return [block.getitem_block(slice(start, stop))
+            for start, stop in zip(bounds[:-1], bounds[1:])]
 
 
 class Block(PandasObject):
@@ -59,6 +152,20 @@ class Block(PandasObject):
     _validate_ndim = True
     _ftype = 'dense'
 
+    # copy-on-write bookkeeping: _refs is a list of weakrefs to the blocks
+    # sharing (views of) the same values, shared by all of these blocks;
+    # _cow_token identifies the copy a block belongs to (views keep the
+    # token of the block they are taken from); _view_of is a weakref to the
+    # block the values are taken from and the indexer taking them
+    _refs = None
+    _cow_token = None
+    _view_of = None
+
+    # weakref to the array whose leading items are the values of the block,
+    # with spare capacity along the items axis used by append_items, and the
+    # number of items filled in it
+    _items_buffer = None
+
     def __init__(self, values, placement, ndim=None, fastpath=False):
         if ndim is None:
             ndim = values.ndim
@@ -180,7 +287,10 @@ class Block(PandasObject):
         if self._validate_ndim and new_values.ndim != self.ndim:
             raise ValueError("Only same dim slicing is allowed")
 
-        return self.make_block_same_class(new_values, new_mgr_locs)
+        block = self.make_block_same_class(new_values, new_mgr_locs)
+        if _copy_on_write_mode:
+            block._share_values(self, indexer=slicer)
+        return block
 
     @property
     def shape(self):
@@ -190,6 +300,21 @@ class Block(PandasObject):
     def itemsize(self):
         return self.values.itemsize
 
+    def memory_usage(self, deep=False):
+        """
+        Return the number of bytes used by each item of the block (as an
+        array); if deep, include the size of the objects held by an object
+        block
+        """
+        nitems = len(self.mgr_locs)
+        result = np.empty(nitems, dtype=np.int64)
+        result.fill(self.values.nbytes // max(nitems, 1))
+        if deep and self.is_object:
+            values = self.values.reshape(nitems, -1)
+            for i in range(nitems):
+                result[i] += lib.memory_usage_of_objects(values[i])
+        return result
+
     @property
     def dtype(self):
         return self.values.dtype
@@ -263,7 +388,11 @@ class Block(PandasObject):
             mask[mask.cumsum(self.ndim-1)>limit]=False
 
         value = self._try_fill(value)
-        blocks = self.putmask(mask, value, inplace=inplace)
+        if not mask.any():
+            # nothing to fill
+            blocks = [self if inplace else self.copy()]
+        else:
+            blocks = self.putmask(mask, value, inplace=inplace)
         return self._maybe_downcast(blocks, downcast)
 
     def _maybe_downcast(self, blocks, downcast=None):
@@ -332,6 +461,45 @@ class Block(PandasObject):
 
         return blocks
 
+    def downcast_smallest(self, integer=None, float=None,
+                          category_ratio=None, copy=True):
+        """
+        Cast the items of the block to the smallest dtype that holds their
+        values, return a list of blocks (one per resulting dtype); see
+        DataFrame.downcast
+        """
+        return [self.copy()] if copy else [self]
+
+    def _items_values(self):
+        """ return my values as a 2-dim array, one row per item """
+        return self.values.reshape(len(self.mgr_locs), -1)
+
+    def _split_astype(self, dtypes, copy=True):
+        """
+        Cast each item of the block to its dtype in dtypes (None keeps the
+        current dtype), return a list of blocks, one per dtype
+        """
+        dtypes = [self.dtype if dtype is None else np.dtype(dtype)
+                  for dtype in dtypes]
+        uniques = []
+        for dtype in dtypes:
+            if dtype not in uniques:
+                uniques.append(dtype)
+
+        if len(uniques) == 1:
+            if uniques[0] == self.dtype:
+                return [self.copy()] if copy else [self]
+            return [make_block(self.values.astype(uniques[0]),
+                               ndim=self.ndim, placement=self.mgr_locs)]
+
+        blocks = []
+        for dtype in uniques:
+            locs = [i for i, d in enumerate(dtypes) if d == dtype]
+            blocks.append(make_block(self.values[locs].astype(dtype),
+                                     ndim=self.ndim,
+                                     placement=self.mgr_locs.as_array[locs]))
+        return blocks
+
     def astype(self, dtype, copy=False, raise_on_error=True, values=None):
         return self._astype(dtype, copy=copy, raise_on_error=raise_on_error,
                             values=values)
@@ -466,11 +634,116 @@ class Block(PandasObject):
     # block actions ####
     def copy(self, deep=True):
         values = self.values
-        if deep:
+        if deep and not _copy_on_write_mode:
             values = values.copy()
-        return make_block(values, ndim=self.ndim,
-                          klass=self.__class__, fastpath=True,
-                          placement=self.mgr_locs)
+        block = make_block(values, ndim=self.ndim,
+                           klass=self.__class__, fastpath=True,
+                           placement=self.mgr_locs)
+        if _copy_on_write_mode:
+            # defer the copy until either block is modified
+            block._share_values(self, new_copy=deep,
+                                indexer=None if deep else Ellipsis)
+        return block
+
+    def _share_values(self, other, new_copy=False, indexer=None):
+        """
+        Record that this block holds (a view of) the values of other, for the
+        copy-on-write mode. If new_copy, this block is a (lazy) copy of other,
+        otherwise a view that sees the modifications of other; indexer, if
+        given, takes the values of this block from those of other.
+        """
+        if other._refs is None:
+            other._refs = [weakref.ref(other)]
+            other._cow_token = object()
+        refs = other._refs
+        refs[:] = [r for r in refs if r() is not None]
+        refs.append(weakref.ref(self))
+        self._refs = refs
+        self._cow_token = object() if new_copy else other._cow_token
+        if not new_copy and indexer is not None:
+            self._view_of = (weakref.ref(other), indexer)
+
+    def _copy_on_write(self):
+        """
+        Detach the lazy copies sharing the values of this block, to be called
+        before the values are modified in-place. Each of them gets its own
+        copy of the values, shared with the views taken from it, while this
+        block keeps its values and so the views of the same object (e.g. the
+        cached columns of a frame) see the modification.
+
+        Returns
+        -------
+        True if any lazy copy was detached
+        """
+        refs = self._refs
+        if refs is None:
+            return False
+
+        token = self._cow_token
+        blocks = [r() for r in refs]
+        blocks = [b for b in blocks if b is not None]
+
+        copies = {}
+        for b in blocks:
+            if b._cow_token is not token:
+                copies.setdefault(b._cow_token, []).append(b)
+
+        refs[:] = [weakref.ref(b) for b in blocks if b._cow_token is token]
+        for shared in copies.values():
+            _copy_shared_values(shared)
+        return len(copies) > 0
+
+    def append_items(self, other):
+        """
+        Return a block of the same type holding the items of this block
+        followed by those of the block other. The values are stored in a
+        buffer with spare capacity along the items axis, grown geometrically,
+        so that appending items one at a time takes amortized constant time.
+
+        This block is left untouched, as it may be shared with other managers.
+        The spare capacity of a buffer is only used by the block whose values
+        end where the buffer was last filled, so that appending to an older
+        block (or to the same block from another manager) never overwrites
+        items stored since.
+
+        Returns
+        -------
+        None if other cannot be stored in a block of this type
+        """
+        if (not self._can_consolidate or type(other) is not type(self) or
+                other.dtype != self.dtype or other.ndim != self.ndim):
+            return None
+
+        values = self.values
+        n, k = len(values), len(other)
+
+        # [weakref to the buffer, number of items filled], shared by the
+        # blocks viewing the buffer
+        state = self._items_buffer
+        buf = state[0]() if state is not None else None
+
+        shared = not (buf is None or state[1] != n or values.base is not buf or
+                      len(buf) < n + k or values.strides != buf.strides or
+                      values.shape[1:] != buf.shape[1:] or
+                      values.ctypes.data != buf.ctypes.data)
+        if not shared:
+            buf = np.empty((n + max(n, k),) + values.shape[1:],
+                           dtype=values.dtype)
+            buf[:n] = values
+            state = [weakref.ref(buf), n]
+
+        buf[n:n + k] = other.values
+        state[1] = n + k
+
+        block = self.make_block_same_class(
+            buf[:n + k], placement=self.mgr_locs.append([other.mgr_locs]))
+        block._items_buffer = state
+        if shared and _copy_on_write_mode:
+            # the leading items are the values of this block
+            block._share_values(self)
+            if self._view_of is None:
+                self._view_of = (weakref.ref(block), slice(0, n))
+        return block
 
     def replace(self, to_replace, value, inplace=False, filter=None,
                 regex=False):
@@ -1146,6 +1419,22 @@ class FloatBlock(FloatOrComplexBlock):
     is_float = True
     _downcast_dtype = 'int64'
 
+    def downcast_smallest(self, integer=None, float=None,
+                          category_ratio=None, copy=True):
+        if float is None or self.dtype.itemsize <= np.dtype(float).itemsize:
+            return [self.copy()] if copy else [self]
+
+        values = self._items_values()
+        converted = values.astype(float)
+
+        # keep the items with (finite) values out of the range of float
+        overflow = (np.isinf(converted) & np.isfinite(values)).any(axis=1)
+        if not overflow.any():
+            return [make_block(converted.reshape(self.shape), ndim=self.ndim,
+                               placement=self.mgr_locs)]
+        return self._split_astype([None if o else float for o in overflow],
+                                  copy=copy)
+
     def _can_hold_element(self, element):
         if is_list_like(element):
             element = np.array(element)
@@ -1238,6 +1527,18 @@ class IntBlock(NumericBlock):
     def should_store(self, value):
         return com.is_integer_dtype(value) and value.dtype == self.dtype
 
+    def downcast_smallest(self, integer=None, float=None,
+                          category_ratio=None, copy=True):
+        if integer is None or self.is_timedelta or not np.prod(self.shape):
+            return [self.copy()] if copy else [self]
+
+        values = self._items_values()
+        unsigned = integer == 'unsigned'
+        dtypes = [_smallest_int_dtype(low, high, unsigned=unsigned)
+                  for low, high in zip(values.min(axis=1),
+                                       values.max(axis=1))]
+        return self._split_astype(dtypes, copy=copy)
+
 
 class TimeDeltaBlock(IntBlock):
     __slots__ = ()
@@ -1389,6 +1690,31 @@ class ObjectBlock(Block):
         """
         return lib.is_bool_array(self.values.ravel())
 
+    def downcast_smallest(self, integer=None, float=None,
+                          category_ratio=None, copy=True):
+        # convert the items with few distinct values to categoricals
+        if category_ratio is None or self.ndim > 2 or not np.prod(self.shape):
+            return [self.copy()] if copy else [self]
+
+        values = self._items_values()
+        blocks = []
+        keep = []
+        for i, loc in enumerate(self.mgr_locs):
+            cat = Categorical(values[i])
+            if len(cat.categories) < category_ratio * len(cat):
+                blocks.append(make_block(cat, ndim=self.ndim,
+                                         placement=[loc]))
+            else:
+                keep.append(i)
+
+        if not blocks:
+            return [self.copy()] if copy else [self]
+        if keep:
+            blocks.append(make_block(self.values[keep], ndim=self.ndim,
+                                     placement=self.mgr_locs.as_array[keep],
+                                     klass=self.__class__, fastpath=True))
+        return blocks
+
     def convert(self, convert_dates=True, convert_numeric=True, convert_timedeltas=True,
                 copy=True, by_item=True):
         """ attempt to coerce any object types to better types
@@ -1604,6 +1930,13 @@ class CategoricalBlock(NonConsolidatableMixIn, ObjectBlock):
     def to_dense(self):
         return self.values.to_dense().view()
 
+    def memory_usage(self, deep=False):
+        return np.array([self.values.memory_usage(deep=deep)], dtype=np.int64)
+
+    def downcast_smallest(self, integer=None, float=None,
+                          category_ratio=None, copy=True):
+        return [self.copy()] if copy else [self]
+
     @property
     def shape(self):
         return (len(self.mgr_locs), len(self.values))
@@ -2430,22 +2763,49 @@ class BlockManager(PandasObject):
         aligned_args = dict((k, kwargs[k]) for k in align_keys
                             if hasattr(kwargs[k], 'reindex_axis'))
 
-        for b in self.blocks:
+        # run the operation on several blocks at once (and on parts of the
+        # large blocks, unless it modifies them in-place)
+        threaded = _apply_nthreads > 1 and f in _threaded_apply_funcs
+        split = threaded and not kwargs.get('inplace')
+
+        # the (block, kwargs) to call f with, in order; kwargs is None for
+        # the blocks that are left untouched
+        calls = []
+        for blk in self.blocks:
             if filter is not None:
-                if not b.mgr_locs.isin(filter_locs).any():
-                    result_blocks.append(b)
+                if not blk.mgr_locs.isin(filter_locs).any():
+                    calls.append((blk, None))
                     continue
 
-            if aligned_args:
-                b_items = self.items[b.mgr_locs.indexer]
+            for b in (_split_block(blk, _apply_nthreads) if split
+                      else [blk]):
+                b_kwargs = kwargs
+                if aligned_args:
+                    b_items = self.items[b.mgr_locs.indexer]
+
+                    b_kwargs = kwargs.copy()
+                    for k, obj in aligned_args.items():
+                        axis = getattr(obj, '_info_axis_number', 0)
+                        b_kwargs[k] = obj.reindex_axis(b_items, axis=axis,
+                                                       copy=align_copy)
 
-                for k, obj in aligned_args.items():
-                    axis = getattr(obj, '_info_axis_number', 0)
-                    kwargs[k] = obj.reindex_axis(b_items, axis=axis,
-                                                 copy=align_copy)
+                if f == 'setitem' or kwargs.get('inplace'):
+                    b._copy_on_write()
 
-            applied = getattr(b, f)(**kwargs)
+                calls.append((b, b_kwargs))
 
+        def apply_block(call):
+            b, b_kwargs = call
+            if b_kwargs is None:
+                return b
+            return getattr(b, f)(**b_kwargs)
+
+        if threaded and len(calls) > 1:
+            results = _get_apply_pool().map(apply_block, calls, chunksize=1)
+        else:
+            results = [apply_block(call) for call in calls]
+
+        for applied in results:
             if isinstance(applied, list):
                 result_blocks.extend(applied)
             else:
@@ -2516,6 +2876,8 @@ class BlockManager(PandasObject):
             # its possible to get multiple result blocks here
             # replace ALWAYS will return a list
             rb = [blk if inplace else blk.copy()]
+            # the values of rb are modified in-place below
+            rb[0]._copy_on_write()
             for i, (s, d) in enumerate(zip(src_list, dest_list)):
                 new_rb = []
                 for b in rb:
@@ -2587,6 +2949,16 @@ class BlockManager(PandasObject):
 
         return False
 
+    def _copy_on_write(self):
+        """
+        Detach the lazy copies sharing the values of the blocks, before these
+        are modified in-place; return True if any copy was detached
+        """
+        copied = False
+        for blk in self.blocks:
+            copied |= blk._copy_on_write()
+        return copied
+
     def get_bool_data(self, copy=False):
         """
         Parameters
@@ -2779,7 +3151,11 @@ class BlockManager(PandasObject):
         single block
         """
         if len(self.blocks) == 1:
-            return self.blocks[0].values[:, loc]
+            values = self.blocks[0].values[:, loc]
+            if _copy_on_write_mode:
+                # the cross-section is not tracked as a view
+                values = values.copy()
+            return values
 
         items = self.items
 
@@ -2867,11 +3243,12 @@ class BlockManager(PandasObject):
             return values
 
         # fastpath shortcut for select a single-dim from a 2-dim BM
-        return SingleBlockManager([ block.make_block_same_class(values,
-                                                                placement=slice(0, len(values)),
-                                                                ndim=1,
-                                                                fastpath=True) ],
-                                  self.axes[1])
+        new_block = block.make_block_same_class(values,
+                                                placement=slice(0, len(values)),
+                                                ndim=1, fastpath=True)
+        if _copy_on_write_mode:
+            new_block._share_values(block, indexer=self._blklocs[i])
+        return SingleBlockManager([new_block], self.axes[1])
 
 
     def get_scalar(self, tup):
@@ -2886,6 +3263,89 @@ class BlockManager(PandasObject):
         # FIXME: this may return non-upcasted types?
         return blk.values[tuple(full_loc)]
 
+    def iget_scalar(self, item_loc, loc):
+        """
+        Retrieve the value at position loc of the item at position item_loc,
+        straight from its block
+        """
+        blk = self.blocks[self._blknos[item_loc]]
+        return blk.iget((self._blklocs[item_loc], loc))
+
+    def iset_scalar(self, item_loc, loc, value):
+        """
+        Set the value at position loc of the item at position item_loc
+        in-place, if its block can hold it without changing its dtype
+
+        Returns
+        -------
+        set : boolean
+            False if the block cannot hold the value (nothing is set)
+        """
+        blk = self.blocks[self._blknos[item_loc]]
+        if (not blk._can_consolidate or is_list_like(value) or
+                not blk._can_hold_element(value)):
+            return False
+
+        blk._copy_on_write()
+        values = blk.values
+        values[self._blklocs[item_loc], loc] = _index.convert_scalar(values,
+                                                                     value)
+        return True
+
+    def take_pairs(self, item_indexer, indexer):
+        """
+        Gather the values at the pairs of positions (item_indexer[i],
+        indexer[i]) along the items and the second axis, block by block
+
+        Returns
+        -------
+        values : 1-dimensional ndarray, of the dtype of the block holding
+            the pairs if there is only one, otherwise of the common dtype of
+            the blocks holding them
+        """
+        item_indexer = com._ensure_platform_int(item_indexer)
+        indexer = com._ensure_platform_int(indexer)
+        blknos = self._blknos.take(item_indexer)
+        blklocs = self._blklocs.take(item_indexer)
+
+        used = np.unique(blknos)
+        if len(used) == 1:
+            groups = [(used[0], slice(None))]
+        else:
+            # positions of the pairs grouped by block, in one pass
+            sorter, counts = _algos.groupsort_indexer(blknos,
+                                                      len(self.blocks))
+            ends = counts[1:].cumsum()
+            groups = [(blkno, sorter[ends[blkno] - counts[blkno + 1]:
+                                     ends[blkno]])
+                      for blkno in used]
+
+        blocks = [self.blocks[blkno] for blkno in used] or self.blocks
+        if len(used) == 1 and blocks[0]._can_consolidate:
+            # the values of a single block keep its dtype (e.g. datetime64,
+            # which the interleaved dtype would box as objects)
+            dtype = blocks[0].dtype
+        else:
+            dtype = _interleaved_dtype(blocks)
+        result = np.empty(len(indexer), dtype=dtype)
+
+        for blkno, pos in groups:
+            blk = self.blocks[blkno]
+            rows, cols = blklocs[pos], indexer[pos]
+            if blk._can_consolidate:
+                # box (e.g. datetimes as object) only the gathered values
+                taken = blk.values[rows, cols].reshape(1, -1)
+                taken = blk.make_block_same_class(
+                    taken, placement=[0]).get_values(dtype)[0]
+            else:
+                values = np.asarray(blk.get_values(dtype))
+                if values.ndim == 1:
+                    values = values.reshape(1, -1)
+                taken = values[rows, cols]
+            result[pos] = taken
+
+        return result
+
     def delete(self, item):
         """
         Delete selected item (items if non-unique) in-place.
@@ -2981,6 +3441,7 @@ class BlockManager(PandasObject):
             blk = self.blocks[blkno]
             blk_locs = blklocs[val_locs.indexer]
             if blk.should_store(value):
+                blk._copy_on_write()
                 blk.set(blk_locs, value_getitem(val_locs), check=check)
             else:
                 unfit_mgr_locs.append(blk.mgr_locs.as_array[blk_locs])
@@ -3065,6 +3526,20 @@ class BlockManager(PandasObject):
                            ndim=self.ndim,
                            placement=slice(loc, loc+1))
 
+        if loc == len(self.items):
+            # appending, store the item in a block of the same type if
+            # possible, without creating a new block (and a consolidation)
+            for blkno in reversed(range(len(self.blocks))):
+                blk = self.blocks[blkno].append_items(block)
+                if blk is not None:
+                    self.blocks = (self.blocks[:blkno] + (blk,) +
+                                   self.blocks[blkno + 1:])
+                    self._blklocs = np.append(self._blklocs, len(blk) - 1)
+                    self._blknos = np.append(self._blknos, blkno)
+                    self.axes[0] = self.items.insert(loc, item)
+                    self._shape = None
+                    return
+
         for blkno, count in _fast_count_smallints(self._blknos[loc:]):
             blk = self.blocks[blkno]
             if count == len(blk.mgr_locs):
@@ -3410,8 +3885,11 @@ class SingleBlockManager(BlockManager):
         if axis >= self.ndim:
             raise IndexError("Requested axis not found in manager")
 
-        return self.__class__(self._block._slice(slobj),
-                              self.index[slobj], fastpath=True)
+        mgr = self.__class__(self._block._slice(slobj),
+                             self.index[slobj], fastpath=True)
+        if _copy_on_write_mode:
+            mgr._block._share_values(self._block, indexer=slobj)
+        return mgr
 
     @property
     def index(self):
@@ -3518,19 +3996,39 @@ def create_block_manager_from_blocks(blocks, axes):
         construction_error(tot_items, blocks[0].shape[1:], axes, e)
 
 
-def create_block_manager_from_arrays(arrays, names, axes):
+def create_block_manager_from_arrays(arrays, names, axes, consolidate=True):
     try:
-        blocks = form_blocks(arrays, names, axes)
+        blocks = form_blocks(arrays, names, axes, consolidate=consolidate)
         mgr = BlockManager(blocks, axes)
-        mgr._consolidate_inplace()
+        if consolidate:
+            mgr._consolidate_inplace()
         return mgr
     except (ValueError) as e:
         construction_error(len(arrays), arrays[0].shape, axes, e)
 
 
-def form_blocks(arrays, names, axes):
+def _smallest_int_dtype(low, high, unsigned=False):
+    """
+    return the smallest integer dtype holding the range [low, high]
+    (unsigned if possible and unsigned is True), None if there is none
+    """
+    if unsigned and low >= 0:
+        candidates = [np.uint8, np.uint16, np.uint32, np.uint64]
+    else:
+        candidates = [np.int8, np.int16, np.int32, np.int64]
+
+    for t in candidates:
+        info = np.iinfo(t)
+        if info.min <= low and high <= info.max:
+            return np.dtype(t)
+    return None
+
+
+def form_blocks(arrays, names, axes, consolidate=True):
     # put "leftover" items in float bucket, where else?
     # generalize?
+    # if not consolidate, each array is wrapped in its own block (without
+    # copying it if possible)
     float_items = []
     complex_items = []
     int_items = []
@@ -3586,31 +4084,31 @@ def form_blocks(arrays, names, axes):
 
     blocks = []
     if len(float_items):
-        float_blocks = _multi_blockify(float_items)
+        float_blocks = _multi_blockify(float_items, consolidate=consolidate)
         blocks.extend(float_blocks)
 
     if len(complex_items):
         complex_blocks = _simple_blockify(
-            complex_items, np.complex128)
+            complex_items, np.complex128, consolidate=consolidate)
         blocks.extend(complex_blocks)
 
     if len(int_items):
-        int_blocks = _multi_blockify(int_items)
+        int_blocks = _multi_blockify(int_items, consolidate=consolidate)
         blocks.extend(int_blocks)
 
     if len(datetime_items):
         datetime_blocks = _simple_blockify(
-            datetime_items, _NS_DTYPE)
+            datetime_items, _NS_DTYPE, consolidate=consolidate)
         blocks.extend(datetime_blocks)
 
     if len(bool_items):
         bool_blocks = _simple_blockify(
-            bool_items, np.bool_)
+            bool_items, np.bool_, consolidate=consolidate)
         blocks.extend(bool_blocks)
 
     if len(object_items) > 0:
         object_blocks = _simple_blockify(
-            object_items, np.object_)
+            object_items, np.object_, consolidate=consolidate)
         blocks.extend(object_blocks)
 
     if len(sparse_items) > 0:
@@ -3638,10 +4136,13 @@ def form_blocks(arrays, names, axes):
     return blocks
 
 
-def _simple_blockify(tuples, dtype):
+def _simple_blockify(tuples, dtype, consolidate=True):
     """ return a single array of a block that has a single dtype; if dtype is
     not None, coerce to this dtype
     """
+    if not consolidate:
+        return _unstacked_blockify(tuples, dtype)
+
     values, placement = _stack_arrays(tuples, dtype)
 
     # CHECK DTYPE?
@@ -3652,8 +4153,10 @@ def _simple_blockify(tuples, dtype):
     return [block]
 
 
-def _multi_blockify(tuples, dtype=None):
+def _multi_blockify(tuples, dtype=None, consolidate=True):
     """ return an array of blocks that potentially have different dtypes """
+    if not consolidate:
+        return _unstacked_blockify(tuples)
 
     # group by dtype
     grouper = itertools.groupby(tuples, lambda x: x[2].dtype)
@@ -3670,6 +4173,25 @@ def _multi_blockify(tuples, dtype=None):
     return new_blocks
 
 
+def _unstacked_blockify(tuples, dtype=None):
+    """ return a block per array, viewing its values; if dtype is not None,
+    coerce to this dtype
+    """
+    new_blocks = []
+    for i, names, array in tuples:
+        if isinstance(array, ABCSeries):
+            array = array.values
+        values = np.asarray(array)
+        if dtype is not None and values.dtype != dtype:
+            values = values.astype(dtype)
+
+        block = make_block(values.reshape((1,) + values.shape),
+                           placement=[i])
+        new_blocks.append(block)
+
+    return new_blocks
+
+
 def _sparse_blockify(tuples, dtype=None):
     """ return an array of blocks that potentially have different dtypes (and
     are sparse)
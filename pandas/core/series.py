@@ -306,6 +306,32 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         """ same as values (but handles sparseness conversions); is a view """
         return self._data.get_values()
 
+    def memory_usage(self, index=True, deep=False):
+        """
+        Memory usage of the Series
+
+        Parameters
+        ----------
+        index : bool, default True
+            Include the memory usage of the index (and of its hash table,
+            if it has been built)
+        deep : bool, default False
+            Introspect the data deeply: include the size of the Python
+            objects held by an ``object`` dtype
+
+        Returns
+        -------
+        bytes used
+
+        See Also
+        --------
+        numpy.ndarray.nbytes
+        DataFrame.memory_usage
+        """
+        v = super(Series, self).memory_usage(deep=deep)
+        if index:
+            v += self.index.memory_usage(deep=deep)
+        return v
 
     # ops
     def ravel(self, order='C'):
@@ -609,6 +635,9 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
 
     def __setitem__(self, key, value):
 
+        # copy-on-write mode: the values below are modified in-place
+        self._data._copy_on_write()
+
         def setitem(key, value):
             try:
                 self._set_with_engine(key, value)
@@ -805,6 +834,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
             otherwise a new object
         """
         try:
+            self._data._copy_on_write()
             if takeable:
                 self.values[label] = value
             else:
@@ -838,7 +868,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         resetted : DataFrame, or Series if drop == True
         """
         if drop:
-            new_index = np.arange(len(self))
+            new_index = _default_index(len(self))
             if level is not None and isinstance(self.index, MultiIndex):
                 if not isinstance(level, (tuple, list)):
                     level = [level]
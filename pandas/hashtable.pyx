@@ -1,4 +1,5 @@
 from cpython cimport PyObject, Py_INCREF, PyList_Check, PyTuple_Check
+from libc.string cimport strlen
 
 from khash cimport *
 from numpy cimport *
@@ -145,9 +146,27 @@ cdef class HashTable:
     pass
 
 
+cdef inline char *_get_string_key(object val):
+    """
+    The data of the string val as a key of a kh_str table, NULL if val is
+    not a string or holds NUL characters (the keys are NUL terminated)
+    """
+    cdef:
+        char *buf
+        Py_ssize_t size
+
+    buf = util.get_string_data(val, &size)
+    if buf is NULL or strlen(buf) != size:
+        return NULL
+    return buf
+
+
 cdef class StringHashTable(HashTable):
     cdef kh_str_t *table
 
+    # the values mapped by map_locations, which own the data of the keys
+    cdef ndarray values
+
     def __cinit__(self, int size_hint=1):
         self.table = kh_init_str()
         if size_hint is not None:
@@ -156,16 +175,78 @@ cdef class StringHashTable(HashTable):
     def __dealloc__(self):
         kh_destroy_str(self.table)
 
+    def __len__(self):
+        return self.table.size
+
+    def sizeof(self, deep=False):
+        """ return the size of my table in bytes """
+        return self.table.n_buckets * (sizeof(char *) + # keys
+                                       sizeof(size_t) + # vals
+                                       sizeof(uint32_t)) # flags
+
     cdef inline int check_type(self, object val):
         return util.is_string_object(val)
 
+    def __contains__(self, object key):
+        cdef char *buf = _get_string_key(key)
+        return buf is not NULL and (kh_get_str(self.table, buf) !=
+                                    self.table.n_buckets)
+
+    def map_locations(self, ndarray[object] values):
+        """
+        Map the strings of values to their locations. Their (utf-8 or bytes)
+        data is hashed directly, and used as keys without being copied.
+
+        Raises ValueError if a value is not a string, or is a string holding
+        NUL characters, which cannot be a key.
+        """
+        cdef:
+            Py_ssize_t i, n = len(values)
+            int ret = 0
+            char *buf
+            khiter_t k
+
+        for i in range(n):
+            buf = _get_string_key(values[i])
+            if buf is NULL:
+                raise ValueError('%r cannot be the key of a StringHashTable'
+                                 % (values[i],))
+            k = kh_put_str(self.table, buf, &ret)
+            self.table.vals[k] = i
+
+        self.values = values
+
+    def lookup(self, ndarray[object] values):
+        cdef:
+            Py_ssize_t i, n = len(values)
+            char *buf
+            khiter_t k
+            ndarray[int64_t] locs = np.empty(n, dtype=np.int64)
+
+        for i in range(n):
+            buf = _get_string_key(values[i])
+            if buf is NULL:
+                locs[i] = -1
+                continue
+
+            k = kh_get_str(self.table, buf)
+            if k != self.table.n_buckets:
+                locs[i] = self.table.vals[k]
+            else:
+                locs[i] = -1
+
+        return locs
+
     cpdef get_item(self, object val):
-        cdef khiter_t k
-        k = kh_get_str(self.table, util.get_c_string(val))
-        if k != self.table.n_buckets:
-            return self.table.vals[k]
-        else:
-            raise KeyError(val)
+        cdef:
+            khiter_t k
+            char *buf = _get_string_key(val)
+
+        if buf is not NULL:
+            k = kh_get_str(self.table, buf)
+            if k != self.table.n_buckets:
+                return self.table.vals[k]
+        raise KeyError(val)
 
     def get_iter_test(self, object key, Py_ssize_t iterations):
         cdef Py_ssize_t i, val
@@ -378,6 +459,12 @@ cdef class Int64HashTable: #(HashTable):
     def __len__(self):
         return self.table.size
 
+    def sizeof(self, deep=False):
+        """ return the size of my table in bytes """
+        return self.table.n_buckets * (sizeof(int64_t) + # keys
+                                       sizeof(size_t) + # vals
+                                       sizeof(uint32_t)) # flags
+
     cpdef get_item(self, int64_t val):
         cdef khiter_t k
         k = kh_get_int64(self.table, val)
@@ -546,6 +633,12 @@ cdef class Float64HashTable(HashTable):
     def __len__(self):
         return self.table.size
 
+    def sizeof(self, deep=False):
+        """ return the size of my table in bytes """
+        return self.table.n_buckets * (sizeof(float64_t) + # keys
+                                       sizeof(size_t) + # vals
+                                       sizeof(uint32_t)) # flags
+
     cpdef get_item(self, float64_t val):
         cdef khiter_t k
         k = kh_get_float64(self.table, val)
@@ -681,6 +774,12 @@ cdef class PyObjectHashTable(HashTable):
     def __len__(self):
         return self.table.size
 
+    def sizeof(self, deep=False):
+        """ return the size of my table in bytes """
+        return self.table.n_buckets * (sizeof(PyObject *) + # keys
+                                       sizeof(size_t) + # vals
+                                       sizeof(uint32_t)) # flags
+
     def __contains__(self, object key):
         cdef khiter_t k
         hash(key)
@@ -12,6 +12,7 @@ cnp.import_ufunc()
 cimport util
 
 import numpy as np
+import weakref
 
 cimport tslib
 from hashtable cimport *
@@ -65,37 +66,93 @@ def set_value_at(ndarray arr, object loc, object val):
     return util.set_value_at(arr, loc, val)
 
 
-# Don't populate hash tables in monotonic indexes larger than this
-_SIZE_CUTOFF = 1000000
+# the engines holding a hash table, by id
+_hashtable_engines = weakref.WeakValueDictionary()
+
+# total size in bytes of their tables, and its limit (-1 for none)
+cdef int64_t _hashtable_nbytes = 0
+cdef int64_t _hashtable_limit = -1
+
+# incremented on every hash table lookup, to find the least recently used
+cdef int64_t _hashtable_clock = 0
+
+
+def set_hashtable_limit(limit):
+    """
+    Cap the total size in bytes of the hash tables of the index engines
+    (None for no limit). Beyond it, the tables of the least recently used
+    engines are released; they are rebuilt if they are needed again.
+    """
+    global _hashtable_limit
+    _hashtable_limit = -1 if limit is None else limit
+    _release_hashtables()
+
+
+def get_hashtable_nbytes():
+    """ return the total size in bytes of the hash tables of the engines """
+    return _hashtable_nbytes
+
+
+cdef _release_hashtables():
+    if _hashtable_limit < 0 or _hashtable_nbytes <= _hashtable_limit:
+        return
+
+    # the most recently used table is always kept
+    engines = sorted(_hashtable_engines.values(),
+                     key=lambda engine: engine.last_used)
+    for engine in engines[:-1]:
+        if _hashtable_nbytes <= _hashtable_limit:
+            break
+        engine.clear_mapping()
 
 
 cdef class IndexEngine:
+    """
+    Lookups in monotonic indexes are binary searches of their values; the
+    hash table (mapping) is only built for the other indexes. The tables
+    of all the engines are subject to set_hashtable_limit.
+    """
 
     cdef readonly:
         object vgetter
         HashTable mapping
-        bint over_size_threshold
+        int64_t last_used
 
     cdef:
         bint unique, monotonic
         bint initialized, monotonic_check, unique_check
+        bint bin_search, bin_search_check
+        int64_t mapping_nbytes
+        object __weakref__
 
     def __init__(self, vgetter, n):
         self.vgetter = vgetter
 
-        self.over_size_threshold = n >= _SIZE_CUTOFF
-
         self.initialized = 0
         self.monotonic_check = 0
+        self.bin_search_check = 0
 
         self.unique = 0
         self.monotonic = 0
 
+    def __dealloc__(self):
+        global _hashtable_nbytes
+        _hashtable_nbytes -= self.mapping_nbytes
+
     def __contains__(self, object val):
-        self._ensure_mapping_populated()
         hash(val)
+        if self._use_bin_search():
+            return self._bin_search_loc(val) != -1
+
+        self._ensure_mapping_populated()
         return val in self.mapping
 
+    def sizeof(self, deep=False):
+        """ return the size of my hash table in bytes (0 if not built) """
+        if self.mapping is None:
+            return 0
+        return self.mapping.sizeof(deep=deep)
+
     cpdef get_value(self, ndarray arr, object key):
         '''
         arr : 1-dimensional ndarray
@@ -131,15 +188,18 @@ cdef class IndexEngine:
             util.set_value_at(arr, loc, value)
 
     cpdef get_loc(self, object val):
+        cdef Py_ssize_t loc
+
         if is_definitely_invalid_key(val):
             raise TypeError
 
-        if self.over_size_threshold and self.is_monotonic:
+        if self._use_bin_search():
             if not self.is_unique:
                 return self._get_loc_duplicates(val)
-            values = self._get_index_values()
-            loc = _bin_search(values, val) # .searchsorted(val, side='left')
-            if util.get_value_at(values, loc) != val:
+
+            self._check_type(val)
+            loc = self._bin_search_loc(val)
+            if loc == -1:
                 raise KeyError(val)
             return loc
 
@@ -154,6 +214,27 @@ cdef class IndexEngine:
         except TypeError:
             raise KeyError(val)
 
+    cdef Py_ssize_t _bin_search_loc(self, object val) except -2:
+        """ location of val in the (monotonic) values, -1 if missing """
+        cdef Py_ssize_t loc
+
+        values = self._get_index_values()
+        if len(values) == 0:
+            return -1
+
+        # as in the hash tables of the numeric engines, a tuple is not a
+        # key (numpy would compare it elementwise with the values)
+        if PyTuple_Check(val) and values.dtype != np.object_:
+            return -1
+        try:
+            loc = _bin_search(values, val)
+            if loc == len(values) or util.get_value_at(values, loc) != val:
+                return -1
+        except (TypeError, ValueError):
+            # not comparable with the values
+            return -1
+        return loc
+
     cdef inline _get_loc_duplicates(self, object val):
         cdef:
             Py_ssize_t diff
@@ -234,8 +315,42 @@ cdef class IndexEngine:
     cdef _get_index_values(self):
         return self.vgetter()
 
+    def set_monotonic_from(self, IndexEngine other):
+        """
+        Take the monotonicity and uniqueness of other, if it is known to be
+        monotonic, for values taken from those of other in the same order
+        (e.g. a slice of them)
+        """
+        if other.monotonic_check and other.monotonic:
+            self.monotonic = 1
+            self.monotonic_check = 1
+            if other.unique_check and other.unique:
+                self.unique = 1
+                self.unique_check = 1
+
     cdef inline _do_unique_check(self):
-        self._ensure_mapping_populated()
+        # the monotonic check finds duplicates of monotonic values, without
+        # building the hash table, but not duplicated NaNs, which compare
+        # unequal to each other
+        if not self.monotonic_check:
+            self._do_monotonic_check()
+        if self.unique_check and self.unique and self._has_nans():
+            self.unique = 0
+            self.unique_check = 0
+        if not self.unique_check:
+            self._ensure_mapping_populated()
+            self.unique = len(self.mapping) == len(self._get_index_values())
+            self.unique_check = 1
+
+    cdef bint _use_bin_search(self) except -1:
+        if not self.bin_search_check:
+            self.bin_search = self.is_monotonic and not self._has_nans()
+            self.bin_search_check = 1
+        return self.bin_search
+
+    cdef bint _has_nans(self) except -1:
+        # NaNs are not ordered: values holding them can't be binary searched
+        return 0
 
     def _call_monotonic(self, values):
         raise NotImplementedError
@@ -247,10 +362,16 @@ cdef class IndexEngine:
         hash(val)
 
     cdef inline _ensure_mapping_populated(self):
+        global _hashtable_clock
+        _hashtable_clock += 1
+        self.last_used = _hashtable_clock
+
         if not self.initialized:
             self.initialize()
 
     cdef initialize(self):
+        global _hashtable_nbytes
+
         values = self._get_index_values()
 
         self.mapping = self._make_hash_table(len(values))
@@ -262,14 +383,34 @@ cdef class IndexEngine:
 
         self.initialized = 1
 
+        self.mapping_nbytes = self.mapping.sizeof()
+        _hashtable_nbytes += self.mapping_nbytes
+        _hashtable_engines[id(self)] = self
+        _release_hashtables()
+
     def clear_mapping(self):
+        global _hashtable_nbytes
+        _hashtable_nbytes -= self.mapping_nbytes
+        self.mapping_nbytes = 0
+        _hashtable_engines.pop(id(self), None)
+
         self.mapping = None
         self.initialized = 0
 
     def get_indexer(self, values):
+        if self._use_bin_search() and self.is_unique:
+            try:
+                return self._get_indexer_monotonic(values)
+            except TypeError:
+                # not comparable with the values
+                pass
+
         self._ensure_mapping_populated()
         return self.mapping.lookup(values)
 
+    cdef _get_indexer_monotonic(self, ndarray values):
+        return _searchsorted_indexer(self._get_index_values(), values)
+
     def get_indexer_non_unique(self, targets):
         """ return an indexer suitable for takng from a non unique index
             return the labels in the same order ast the target
@@ -347,6 +488,13 @@ cdef class Int64Engine(IndexEngine):
     def _call_monotonic(self, values):
         return algos.is_monotonic_int64(values)
 
+    cdef _get_indexer_monotonic(self, ndarray values):
+        # merge sorted targets with the values in a single pass
+        if values.dtype == np.int64 and algos.is_monotonic_int64(values)[0]:
+            return algos.left_join_indexer_unique_int64(
+                values, self._get_index_values())
+        return IndexEngine._get_indexer_monotonic(self, values)
+
     def get_pad_indexer(self, other, limit=None):
         return algos.pad_int64(self._get_index_values(), other,
                                limit=limit)
@@ -437,6 +585,9 @@ cdef class Float64Engine(IndexEngine):
     def _call_monotonic(self, values):
         return algos.is_monotonic_float64(values)
 
+    cdef bint _has_nans(self) except -1:
+        return np.isnan(self._get_index_values()).any()
+
     def get_pad_indexer(self, other, limit=None):
         return algos.pad_float64(self._get_index_values(), other,
                                     limit=limit)
@@ -471,6 +622,23 @@ cdef Py_ssize_t _bin_search(ndarray values, object val) except -1:
     else:
         return mid + 1
 
+
+cdef _searchsorted_indexer(ndarray values, ndarray target):
+    """
+    Locations of target in the monotonic unique values, -1 for the labels
+    which are not found
+    """
+    cdef Py_ssize_t n = len(values)
+
+    if n == 0:
+        return np.repeat(-1, len(target)).astype(np.int64)
+
+    indexer = values.searchsorted(target, side='left')
+    found = values.take(np.minimum(indexer, n - 1)) == target
+    if not isinstance(found, np.ndarray):
+        raise TypeError('cannot compare the values with the target')
+    return algos.ensure_int64(np.where(found, indexer, -1))
+
 _pad_functions = {
     'object' : algos.pad_object,
     'int64' : algos.pad_int64,
@@ -491,6 +659,13 @@ cdef class ObjectEngine(IndexEngine):
     def _call_monotonic(self, values):
         return algos.is_monotonic_object(values)
 
+    cdef bint _has_nans(self) except -1:
+        values = self._get_index_values()
+        try:
+            return bool((values != values).any())
+        except (TypeError, ValueError):
+            return 1
+
     def get_pad_indexer(self, other, limit=None):
         return algos.pad_object(self._get_index_values(), other,
                                    limit=limit)
@@ -500,19 +675,47 @@ cdef class ObjectEngine(IndexEngine):
                                         limit=limit)
 
 
+cdef class StringEngine(ObjectEngine):
+    """
+    Engine of an object index of strings, whose hash table (StringHashTable)
+    hashes and compares the utf-8 or bytes data of the strings rather than
+    calling their __hash__ and __eq__. Strings holding NUL characters can't
+    be keys of a StringHashTable, a PyObjectHashTable is then used.
+    """
+
+    cdef bint object_table
+
+    cdef _make_hash_table(self, n):
+        if self.object_table:
+            return _hash.PyObjectHashTable(n)
+        return _hash.StringHashTable(n)
+
+    cdef initialize(self):
+        try:
+            IndexEngine.initialize(self)
+        except ValueError:
+            self.object_table = 1
+            IndexEngine.initialize(self)
+
+    def get_indexer(self, values):
+        # probing the table with the data of the targets is cheaper than
+        # comparing them as objects with the values, even sorted ones
+        self._ensure_mapping_populated()
+        return self.mapping.lookup(values)
+
+
 cdef class DatetimeEngine(Int64Engine):
 
     cdef _get_box_dtype(self):
         return 'M8[ns]'
 
     def __contains__(self, object val):
-        if self.over_size_threshold and self.is_monotonic:
-            if not self.is_unique:
-                return self._get_loc_duplicates(val)
-            values = self._get_index_values()
-            conv = _to_i8(val)
-            loc = values.searchsorted(conv, side='left')
-            return util.get_value_at(values, loc) == conv
+        if self._use_bin_search():
+            hash(val)
+            try:
+                return self._bin_search_loc(_to_i8(val)) != -1
+            except (TypeError, ValueError):
+                return False
 
         self._ensure_mapping_populated()
         return _to_i8(val) in self.mapping
@@ -529,14 +732,14 @@ cdef class DatetimeEngine(Int64Engine):
 
         # Welcome to the spaghetti factory
 
-        if self.over_size_threshold and self.is_monotonic:
-            if not self.is_unique:
-                val = _to_i8(val)
-                return self._get_loc_duplicates(val)
-            values = self._get_index_values()
+        if self._use_bin_search():
             conv = _to_i8(val)
-            loc = values.searchsorted(conv, side='left')
-            if loc == len(values) or util.get_value_at(values, loc) != conv:
+            if not self.is_unique:
+                return self._get_loc_duplicates(conv)
+            if not util.is_integer_object(conv):
+                self._date_check_type(conv)
+            loc = self._bin_search_loc(conv)
+            if loc == -1:
                 raise KeyError(val)
             return loc
 
@@ -565,11 +768,10 @@ cdef class DatetimeEngine(Int64Engine):
             raise KeyError(val)
 
     def get_indexer(self, values):
-        self._ensure_mapping_populated()
         if values.dtype != self._get_box_dtype():
             return np.repeat(-1, len(values)).astype('i4')
         values = np.asarray(values).view('i8')
-        return self.mapping.lookup(values)
+        return Int64Engine.get_indexer(self, values)
 
     def get_pad_indexer(self, other, limit=None):
         if other.dtype != self._get_box_dtype():
@@ -591,6 +793,211 @@ cdef class TimedeltaEngine(DatetimeEngine):
     cdef _get_box_dtype(self):
         return 'm8[ns]'
 
+cdef class RangeEngine(Int64Engine):
+    """
+    Engine of a RangeIndex: lookups are computed from the start and step of
+    the range, without a hash table or the values of the index (which are
+    only built by the methods that need them, e.g. get_pad_indexer)
+    """
+
+    cdef readonly:
+        int64_t start, step, length
+
+    def __init__(self, vgetter, start, step, n):
+        IndexEngine.__init__(self, vgetter, n)
+        self.start = start
+        self.step = step
+        self.length = n
+
+        self.unique = 1
+        self.unique_check = 1
+        self.monotonic = step > 0 or n <= 1
+        self.monotonic_check = 1
+
+    def __contains__(self, object val):
+        hash(val)
+        if util.is_float_object(val):
+            # as in the hash table of an Int64Index, an integral float is
+            # found at the position of the integer
+            try:
+                if val != int(val):
+                    return False
+            except (ValueError, OverflowError):
+                return False
+            val = int(val)
+        try:
+            self.get_loc(val)
+        except (KeyError, TypeError, OverflowError):
+            return False
+        return True
+
+    cpdef get_loc(self, object val):
+        cdef int64_t offset, loc
+
+        if is_definitely_invalid_key(val):
+            raise TypeError
+
+        self._check_type(val)
+        if not util.is_integer_object(val):
+            raise KeyError(val)
+
+        offset = val - self.start
+        loc = offset // self.step
+        if offset % self.step != 0 or loc < 0 or loc >= self.length:
+            raise KeyError(val)
+        return loc
+
+    def get_indexer(self, values):
+        values = np.asarray(values)
+        if not issubclass(values.dtype.type, np.integer):
+            return Int64Engine.get_indexer(self, values)
+
+        offset = algos.ensure_int64(values) - self.start
+        loc = offset // self.step
+        found = (offset % self.step == 0) & (loc >= 0) & (loc < self.length)
+        return np.where(found, loc, -1)
+
+
+def get_label_offsets(sizes):
+    """
+    Return the bit offsets at which the labels of levels of the given sizes
+    are packed into int64 keys by MultiIndexEngine (the first level in the
+    most significant bits), None if the keys would need more than 63 bits
+    """
+    cdef:
+        list bits, offsets = []
+        int total = 0
+
+    # labels are shifted by one so that missing values (-1) are kept
+    bits = [int(size).bit_length() for size in sizes]
+    if sum(bits) > 63:
+        return None
+
+    for b in reversed(bits):
+        offsets.append(total)
+        total += b
+    return np.array(offsets[::-1], dtype=np.int64)
+
+
+cdef class MultiIndexEngine(Int64Engine):
+    """
+    Engine of a MultiIndex looking up the labels of its levels packed into
+    int64 keys (see get_label_offsets), instead of the tuples of its values,
+    which are then never built. Keys are translated level by level.
+    """
+
+    cdef readonly:
+        object levels, labels
+        ndarray offsets
+
+    cdef:
+        ndarray packed
+
+    def __init__(self, levels, labels, offsets, n):
+        IndexEngine.__init__(self, None, n)
+        self.levels = levels
+        self.labels = labels
+        self.offsets = offsets
+
+    cdef _get_index_values(self):
+        if self.packed is None:
+            self.packed = self.pack_labels(self.labels)
+        return self.packed
+
+    def pack_labels(self, labels):
+        """ pack a list of label arrays (one per level) into int64 keys """
+        cdef Py_ssize_t i
+
+        result = np.zeros(len(labels[0]) if len(labels) else 0,
+                          dtype=np.int64)
+        for i in range(len(labels)):
+            result |= (algos.ensure_int64(labels[i]) + 1) << self.offsets[i]
+        return result
+
+    def unpack_labels(self, ndarray[int64_t] keys):
+        """ inverse of pack_labels, return the list of label arrays """
+        cdef:
+            Py_ssize_t i
+            int64_t nbits
+
+        labels = []
+        for i in range(len(self.levels)):
+            lab = keys >> self.offsets[i]
+            if i > 0:
+                nbits = self.offsets[i - 1] - self.offsets[i]
+                lab &= ((<int64_t> 1) << nbits) - 1
+            labels.append(lab - 1)
+        return labels
+
+    cdef int64_t _pack_key(self, object key) except? -1:
+        cdef:
+            Py_ssize_t i, nlevels = len(self.levels)
+            ndarray[int64_t] offsets = self.offsets
+            int64_t label, result = 0
+
+        if not PyTuple_Check(key) or len(key) != nlevels:
+            raise KeyError(key)
+
+        for i in range(nlevels):
+            k = key[i]
+            if util._checknull(k):
+                label = -1
+            else:
+                try:
+                    loc = self.levels[i].get_loc(k)
+                except (KeyError, TypeError, ValueError):
+                    raise KeyError(key)
+                if not util.is_integer_object(loc):
+                    raise KeyError(key)
+                label = loc
+            result |= (label + 1) << offsets[i]
+        return result
+
+    def __contains__(self, object val):
+        hash(val)
+        try:
+            key = self._pack_key(val)
+        except KeyError:
+            return False
+        return IndexEngine.__contains__(self, key)
+
+    cpdef get_loc(self, object val):
+        if is_definitely_invalid_key(val):
+            raise TypeError
+
+        try:
+            return IndexEngine.get_loc(self, self._pack_key(val))
+        except KeyError:
+            raise KeyError(val)
+
+    def get_indexer_labels(self, levels, labels):
+        """
+        Return the locations of the keys given by the labels into levels
+        (those of another MultiIndex), -1 for the keys that are not found
+        """
+        cdef Py_ssize_t i
+
+        n = len(labels[0]) if len(labels) else 0
+        if len(levels) != len(self.levels):
+            return np.repeat(-1, n).astype(np.int64)
+
+        missing = np.zeros(n, dtype=bool)
+        new_labels = []
+        for i in range(len(levels)):
+            # the labels of our level, with a trailing -1 taken by the
+            # missing values (-1 labels)
+            level_indexer = np.append(
+                algos.ensure_int64(self.levels[i].get_indexer(levels[i])), -1)
+            lab = algos.ensure_int64(labels[i])
+            new_lab = level_indexer.take(lab)
+            missing |= (new_lab == -1) & (lab != -1)
+            new_labels.append(new_lab)
+
+        result = Int64Engine.get_indexer(self, self.pack_labels(new_labels))
+        result[missing] = -1
+        return result
+
+
 cpdef convert_scalar(ndarray arr, object value):
     if arr.descr.type_num == NPY_DATETIME:
         if isinstance(value,np.ndarray):
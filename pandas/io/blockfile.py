@@ -0,0 +1,291 @@
+"""
+Columnar binary file format for pandas objects
+
+Each block of the BlockManager is stored as an aligned, contiguous buffer and
+object blocks of strings as offsets plus utf-8 data, so that whole objects
+can be written at close to memcpy speed and read back as read-only views onto
+a memory-mapped file. The axes and the block layout are kept in a small
+(pickled) header in front of the buffers.
+
+File layout::
+
+    magic (8 bytes) | header length (uint64, little-endian) | header |
+    padding | buffer 0 | padding | buffer 1 | ...
+
+Buffer offsets in the header are relative to the first (aligned) byte
+following the header.
+"""
+
+import mmap as _mmap
+import struct
+
+import numpy as np
+
+from pandas import compat
+from pandas.compat import cPickle as pkl, range, zip
+from pandas.core.index import Index
+from pandas.core.categorical import Categorical
+from pandas.core.internals import (BlockManager, SingleBlockManager,
+                                   make_block)
+import pandas.core.common as com
+import pandas.lib as lib
+
+_MAGIC = b'PDBLOCK1'
+_VERSION = 1
+
+# alignment of the start of every buffer, in bytes
+_ALIGNMENT = 64
+
+
+def to_blockfile(obj, path):
+    """
+    Write a pandas object to a block file
+
+    Parameters
+    ----------
+    obj : Series, DataFrame or Panel
+    path : string
+        File path
+    """
+    writer = _BlockFileWriter()
+    header = writer.encode(obj)
+    writer.write(path, header)
+
+
+def read_blockfile(path, mmap=True):
+    """
+    Load a pandas object stored with ``to_blockfile``
+
+    Warning: the header of a block file is pickled, loading files received
+    from untrusted sources can be unsafe.
+
+    Parameters
+    ----------
+    path : string
+        File path
+    mmap : boolean, default True
+        Memory-map the file: numeric blocks and axes are then returned as
+        read-only views onto the mapped file, without copying the data. If
+        False, the data is read into newly allocated (writeable) arrays.
+
+    Returns
+    -------
+    obj : type of object stored in file
+    """
+    reader = _BlockFileReader(path, mmap=mmap)
+    return reader.decode()
+
+
+def _align(nbytes):
+    return -(-nbytes // _ALIGNMENT) * _ALIGNMENT
+
+
+class _BlockFileWriter(object):
+
+    def __init__(self):
+        # list of (offset, bytes or ndarray)
+        self.buffers = []
+        self.nbytes = 0
+
+    def _add_buffer(self, buf, nbytes):
+        offset = self.nbytes
+        self.buffers.append((offset, buf))
+        self.nbytes = _align(offset + nbytes)
+        return offset
+
+    def encode(self, obj):
+        mgr = obj._data
+        if not isinstance(mgr, BlockManager):
+            raise NotImplementedError("cannot write %s to a block file"
+                                      % type(obj).__name__)
+
+        blocks = []
+        for blk in mgr.blocks:
+            if blk.is_sparse:
+                raise NotImplementedError("sparse blocks cannot be written "
+                                          "to a block file")
+            blocks.append({'klass': type(blk),
+                           'ndim': blk.ndim,
+                           'mgr_locs': self._encode_value(
+                               blk.mgr_locs.indexer),
+                           'values': self._encode_values(blk.values)})
+
+        return {'version': _VERSION,
+                'klass': type(obj),
+                'mgr_klass': type(mgr),
+                'metadata': dict((k, getattr(obj, k, None))
+                                 for k in obj._metadata),
+                'axes': [self._encode_index(ax) for ax in mgr.axes],
+                'blocks': blocks}
+
+    def _encode_values(self, values):
+        if isinstance(values, Categorical):
+            return {'kind': 'categorical',
+                    'codes': self._encode_array(values.codes),
+                    'categories': self._encode_index(values.categories),
+                    'ordered': values.ordered,
+                    'name': values.name}
+        return self._encode_array(values)
+
+    def _encode_array(self, arr):
+        arr = np.ascontiguousarray(arr)
+
+        if arr.dtype != np.object_:
+            offset = self._add_buffer(arr, arr.nbytes)
+            return {'kind': 'array', 'dtype': arr.dtype.str,
+                    'shape': arr.shape, 'offset': offset}
+
+        flat = arr.ravel()
+        mask = com.isnull(flat)
+        inferred = lib.infer_dtype(flat[~mask])
+        if inferred in ('string', 'unicode', 'empty'):
+            # offsets plus utf-8 (or bytes) data
+            decode = inferred == 'unicode' or (compat.PY3 and
+                                               inferred == 'string')
+            encoded = [b'' if isnull else
+                       (v.encode('utf-8') if decode else v)
+                       for v, isnull in zip(flat, mask)]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            offsets[1:] = np.fromiter((len(v) for v in encoded),
+                                      dtype=np.int64,
+                                      count=len(encoded)).cumsum()
+            data = b''.join(encoded)
+            return {'kind': 'string', 'shape': arr.shape, 'decode': decode,
+                    'mask': self._encode_array(mask),
+                    'offsets': self._encode_array(offsets),
+                    'data': self._add_buffer(data, len(data)),
+                    'nbytes': len(data)}
+
+        data = pkl.dumps(arr, protocol=pkl.HIGHEST_PROTOCOL)
+        return {'kind': 'pickle', 'data': self._add_buffer(data, len(data)),
+                'nbytes': len(data)}
+
+    def _encode_index(self, index):
+        # reuse the pickle protocol of the Index classes, storing the
+        # arrays it refers to as buffers
+        func, (klass, d) = index.__reduce__()[:2]
+        return {'kind': 'index', 'func': func, 'klass': klass,
+                'attrs': dict((k, self._encode_value(v))
+                              for k, v in compat.iteritems(d))}
+
+    def _encode_value(self, value):
+        if isinstance(value, Index):
+            return self._encode_index(value)
+        elif isinstance(value, np.ndarray):
+            return self._encode_array(value)
+        elif isinstance(value, list):
+            return {'kind': 'list',
+                    'values': [self._encode_value(v) for v in value]}
+        return {'kind': 'raw', 'value': value}
+
+    def write(self, path, header):
+        header = pkl.dumps(header, protocol=pkl.HIGHEST_PROTOCOL)
+        start = len(_MAGIC) + 8 + len(header)
+
+        with open(path, 'wb') as f:
+            f.write(_MAGIC)
+            f.write(struct.pack('<Q', len(header)))
+            f.write(header)
+            f.write(b'\x00' * (_align(start) - start))
+
+            pos = 0
+            for offset, buf in self.buffers:
+                if offset > pos:
+                    f.write(b'\x00' * (offset - pos))
+                if isinstance(buf, np.ndarray):
+                    buf.tofile(f)
+                    pos = offset + buf.nbytes
+                else:
+                    f.write(buf)
+                    pos = offset + len(buf)
+
+
+class _BlockFileReader(object):
+
+    def __init__(self, path, mmap=True):
+        with open(path, 'rb') as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError("%s is not a block file" % path)
+            hlen, = struct.unpack('<Q', f.read(8))
+            self.header = pkl.loads(f.read(hlen))
+            self.start = _align(len(_MAGIC) + 8 + hlen)
+
+            if mmap:
+                buf = _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ)
+                self.buf = np.frombuffer(buf, dtype=np.uint8)
+            else:
+                f.seek(0)
+                self.buf = np.fromfile(f, dtype=np.uint8)
+
+    def _get_buffer(self, offset, nbytes):
+        start = self.start + offset
+        return self.buf[start:start + nbytes]
+
+    def decode(self):
+        header = self.header
+        if header['version'] > _VERSION:
+            raise ValueError("unsupported block file version %d"
+                             % header['version'])
+
+        axes = [self._decode_value(ax) for ax in header['axes']]
+        blocks = [make_block(self._decode_values(b['values']),
+                             placement=self._decode_value(b['mgr_locs']),
+                             klass=b['klass'], ndim=b['ndim'], fastpath=True)
+                  for b in header['blocks']]
+
+        if issubclass(header['mgr_klass'], SingleBlockManager):
+            mgr = SingleBlockManager(blocks[0], axes[0], fastpath=True)
+        else:
+            mgr = BlockManager(blocks, axes)
+
+        obj = header['klass'](mgr)
+        for k, v in compat.iteritems(header['metadata']):
+            setattr(obj, k, v)
+        return obj
+
+    def _decode_values(self, d):
+        if d['kind'] == 'categorical':
+            return Categorical(self._decode_array(d['codes']),
+                               categories=self._decode_value(d['categories']),
+                               ordered=d['ordered'], name=d['name'],
+                               fastpath=True)
+        return self._decode_array(d)
+
+    def _decode_array(self, d):
+        kind = d['kind']
+        if kind == 'array':
+            dtype = np.dtype(d['dtype'])
+            nbytes = int(np.prod(d['shape'])) * dtype.itemsize
+            values = self._get_buffer(d['offset'], nbytes).view(dtype)
+            return values.reshape(d['shape'])
+
+        elif kind == 'string':
+            mask = self._decode_array(d['mask'])
+            offsets = self._decode_array(d['offsets'])
+            data = self._get_buffer(d['data'], d['nbytes']).tostring()
+            values = [data[offsets[i]:offsets[i + 1]]
+                      for i in range(len(offsets) - 1)]
+            if d['decode']:
+                values = [v.decode('utf-8') for v in values]
+            result = np.empty(len(values), dtype=np.object_)
+            result[:] = values
+            result[mask] = np.nan
+            return result.reshape(d['shape'])
+
+        elif kind == 'pickle':
+            return pkl.loads(self._get_buffer(d['data'],
+                                              d['nbytes']).tostring())
+
+        raise ValueError("unknown block file array kind %r" % kind)
+
+    def _decode_value(self, d):
+        kind = d['kind']
+        if kind == 'index':
+            attrs = dict((k, self._decode_value(v))
+                         for k, v in compat.iteritems(d['attrs']))
+            return d['func'](d['klass'], attrs)
+        elif kind == 'list':
+            return [self._decode_value(v) for v in d['values']]
+        elif kind == 'raw':
+            return d['value']
+        return self._decode_array(d)
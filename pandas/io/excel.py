@@ -110,11 +110,15 @@ def read_excel(io, sheetname=0, **kwds):
         True if the cols defined in index_col have an index name and are
         not in the header. Index name will be placed on a separate line below
         the header.
+    chunksize : int, default None
+        Return an iterator yielding DataFrames of at most ``chunksize`` rows,
+        see ``ExcelFile.parse``
 
     Returns
     -------
-    parsed : DataFrame
-        DataFrame from the passed in Excel file
+    parsed : DataFrame or TextFileReader
+        DataFrame from the passed in Excel file, or an iterator of DataFrames
+        if ``chunksize`` is given
 
     """
     if 'kind' in kwds:
@@ -124,7 +128,14 @@ def read_excel(io, sheetname=0, **kwds):
 
     engine = kwds.pop('engine', None)
 
-    return ExcelFile(io, engine=engine).parse(sheetname=sheetname, **kwds)
+    xl = ExcelFile(io, engine=engine)
+    try:
+        return xl.parse(sheetname=sheetname, **kwds)
+    finally:
+        # the parsed sheet is loaded in full, a chunked reader only reads
+        # its rows, so the workbook can be released right away; io belongs
+        # to the caller and is left open
+        xl._release_book()
 
 
 class ExcelFile(object):
@@ -156,18 +167,21 @@ class ExcelFile(object):
         if engine is not None and engine != 'xlrd':
             raise ValueError("Unknown engine: %s" % engine)
 
+        # only load the sheets which are actually parsed (xls only, xlrd
+        # always loads all the sheets of a xlsx workbook)
         if isinstance(io, compat.string_types):
             if _is_url(io):
                 data = _urlopen(io).read()
-                self.book = xlrd.open_workbook(file_contents=data)
+                self.book = xlrd.open_workbook(file_contents=data,
+                                               on_demand=True)
             else:
-                self.book = xlrd.open_workbook(io)
+                self.book = xlrd.open_workbook(io, on_demand=True)
         elif engine == 'xlrd' and isinstance(io, xlrd.Book):
             self.book = io
         elif not isinstance(io, xlrd.Book) and hasattr(io, "read"):
             # N.B. xlrd.Book has a read attribute too
             data = io.read()
-            self.book = xlrd.open_workbook(file_contents=data)
+            self.book = xlrd.open_workbook(file_contents=data, on_demand=True)
         else:
             raise ValueError('Must explicitly set engine if not passing in'
                              ' buffer or path for io.')
@@ -207,7 +221,10 @@ class ExcelFile(object):
         thousands : str, default None
             Thousands separator
         chunksize : int, default None
-            Size of file chunk to read for lazy evaluation.
+            Number of rows per chunk. If given, an iterator yielding
+            DataFrames of at most ``chunksize`` rows is returned instead of
+            a single DataFrame; rows are only converted when the chunk they
+            belong to is read.
         convert_float : boolean, default True
             convert integral floats to int (i.e., 1.0 --> 1). If False, all
             numeric data will be read in as floats: Excel stores all numbers as
@@ -218,8 +235,9 @@ class ExcelFile(object):
 
         Returns
         -------
-        parsed : DataFrame
-            DataFrame parsed from the Excel file
+        parsed : DataFrame or TextFileReader
+            DataFrame parsed from the Excel file, or an iterator of DataFrames
+            if ``chunksize`` is given
         """
         skipfooter = kwds.pop('skipfooter', None)
         if skipfooter is not None:
@@ -293,59 +311,69 @@ class ExcelFile(object):
         else:  # assume an integer if not a string
             sheet = self.book.sheet_by_index(sheetname)
 
-        data = []
         should_parse = {}
-        for i in range(sheet.nrows):
-            row = []
-            for j, (value, typ) in enumerate(zip(sheet.row_values(i),
-                                                 sheet.row_types(i))):
-                if parse_cols is not None and j not in should_parse:
-                    should_parse[j] = self._should_parse(j, parse_cols)
-
-                if parse_cols is None or should_parse[j]:
-                    if typ == XL_CELL_DATE:
-                        if xlrd_0_9_3:
-                            # Use the newer xlrd datetime handling.
-                            value = xldate.xldate_as_datetime(value, epoch1904)
-
-                            # Excel doesn't distinguish between dates and time,
-                            # so we treat dates on the epoch as times only.
-                            # Also, Excel supports 1900 and 1904 epochs.
-                            year = (value.timetuple())[0:3]
-                            if ((not epoch1904 and year == (1899, 12, 31))
-                                    or (epoch1904 and year == (1904, 1, 1))):
-                                value = datetime.time(value.hour,
-                                                      value.minute,
-                                                      value.second,
-                                                      value.microsecond)
-                        else:
-                            # Use the xlrd <= 0.9.2 date handling.
-                            dt = xldate.xldate_as_tuple(value, epoch1904)
-
-                            if dt[0] < datetime.MINYEAR:
-                                value = datetime.time(*dt[3:])
-                            else:
-                                value = datetime.datetime(*dt)
-
-                    elif typ == XL_CELL_ERROR:
-                        value = np.nan
-                    elif typ == XL_CELL_BOOLEAN:
-                        value = bool(value)
-                    elif convert_float and typ == XL_CELL_NUMBER:
-                        # GH5394 - Excel 'numbers' are always floats
-                        # it's a minimal perf hit and less suprising
-                        val = int(value)
-                        if val == value:
-                            value = val
-
-                    row.append(value)
-
-            data.append(row)
-
-        if header is not None:
-            data[header] = _trim_excel_header(data[header])
-
-        parser = TextParser(data, header=header, index_col=index_col,
+
+        def _parse_cell(value, typ):
+            if typ == XL_CELL_DATE:
+                if xlrd_0_9_3:
+                    # Use the newer xlrd datetime handling.
+                    value = xldate.xldate_as_datetime(value, epoch1904)
+
+                    # Excel doesn't distinguish between dates and time,
+                    # so we treat dates on the epoch as times only.
+                    # Also, Excel supports 1900 and 1904 epochs.
+                    year = (value.timetuple())[0:3]
+                    if ((not epoch1904 and year == (1899, 12, 31))
+                            or (epoch1904 and year == (1904, 1, 1))):
+                        value = datetime.time(value.hour,
+                                              value.minute,
+                                              value.second,
+                                              value.microsecond)
+                else:
+                    # Use the xlrd <= 0.9.2 date handling.
+                    dt = xldate.xldate_as_tuple(value, epoch1904)
+
+                    if dt[0] < datetime.MINYEAR:
+                        value = datetime.time(*dt[3:])
+                    else:
+                        value = datetime.datetime(*dt)
+
+            elif typ == XL_CELL_ERROR:
+                value = np.nan
+            elif typ == XL_CELL_BOOLEAN:
+                value = bool(value)
+            elif convert_float and typ == XL_CELL_NUMBER:
+                # GH5394 - Excel 'numbers' are always floats
+                # it's a minimal perf hit and less suprising
+                val = int(value)
+                if val == value:
+                    value = val
+
+            return value
+
+        def _iter_rows():
+            # convert the sheet lazily, one row at a time, so that only the
+            # rows of the chunk being parsed are materialized
+            for i in range(sheet.nrows):
+                row = []
+                for j, (value, typ) in enumerate(zip(sheet.row_values(i),
+                                                     sheet.row_types(i))):
+                    if parse_cols is not None and j not in should_parse:
+                        should_parse[j] = self._should_parse(j, parse_cols)
+
+                    if parse_cols is None or should_parse[j]:
+                        row.append(_parse_cell(value, typ))
+
+                if i == header:
+                    row = _trim_excel_header(row)
+
+                yield row
+
+        if self.book.on_demand:
+            # the rows iterator keeps a reference to the sheet
+            self.book.unload_sheet(sheet.name)
+
+        parser = TextParser(_iter_rows(), header=header, index_col=index_col,
                             has_index_names=has_index_names,
                             na_values=na_values,
                             thousands=thousands,
@@ -356,14 +384,23 @@ class ExcelFile(object):
                             chunksize=chunksize,
                             **kwds)
 
+        if chunksize is not None:
+            return parser
+
         return parser.read()
 
     @property
     def sheet_names(self):
         return self.book.sheet_names()
 
+    def _release_book(self):
+        if self.book is not self.io and self.book.on_demand:
+            # release the file contents kept around to load sheets on demand
+            self.book.release_resources()
+
     def close(self):
         """close io if necessary"""
+        self._release_book()
         if hasattr(self.io, 'close'):
             self.io.close()
 
@@ -415,6 +452,15 @@ class ExcelWriter(object):
     datetime_format : string, default None
         Format string for datetime objects written into Excel files
         (e.g. 'YYYY-MM-DD HH:MM:SS')
+
+    Notes
+    -----
+    Any other keyword arguments are passed to the engine's workbook. The
+    cells of a frame are written row by row, so the xlsxwriter engine can be
+    used in constant memory mode for large frames:
+
+    >>> writer = ExcelWriter('output.xlsx', engine='xlsxwriter',
+    ...                      options={'constant_memory': True})
     """
     # Defining an ExcelWriter implementation (see abstract methods for more...)
 
@@ -433,6 +479,8 @@ class ExcelWriter(object):
     # - Optional:
     #   - ``__init__(self, path, engine=None, **kwargs)`` --> always called
     #     with path as first argument.
+    #   - ``supports_merged_cells`` - False if the writer cannot write merged
+    #     cells, ``DataFrame.to_excel`` then ignores ``merge_cells``.
 
     # You also need to register the class with ``register_writer()``.
     # Technically, ExcelWriter implementations don't need to subclass
@@ -455,6 +503,7 @@ class ExcelWriter(object):
     book = None
     curr_sheet = None
     path = None
+    supports_merged_cells = True
 
     @abc.abstractproperty
     def supported_extensions(self):
@@ -1209,6 +1258,12 @@ class _XlsxWriter(ExcelWriter):
 
         self.book = xlsxwriter.Workbook(path, **engine_kwargs)
 
+        # in constant memory mode each row is flushed once the next one is
+        # started, so a merged range would overwrite the rows below it
+        options = engine_kwargs.get('options') or {}
+        if options.get('constant_memory'):
+            self.supports_merged_cells = False
+
     def save(self):
         """
         Save workbook to disk.
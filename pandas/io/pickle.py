@@ -1,4 +1,7 @@
-from pandas.compat import cPickle as pkl, pickle_compat as pc, PY3
+import numpy as np
+
+from pandas.compat import (cPickle as pkl, pickle_compat as pc, PY3,
+                           BytesIO)
 
 def to_pickle(obj, path):
     """
@@ -62,3 +65,85 @@ def read_pickle(path):
         if PY3:
             return try_read(path, encoding='latin1')
         raise
+
+
+def dumps_with_buffers(obj, buffer_callback):
+    """
+    Pickle (serialize) an object to bytes, passing the data of the numeric
+    arrays it holds (e.g. the blocks and axes of a DataFrame) out-of-band to
+    ``buffer_callback`` instead of copying it into the pickle stream
+
+    This mirrors the ``buffer_callback`` of pickle protocol 5: the returned
+    bytes only hold the metadata, and the buffers can be sent separately
+    (e.g. placed in shared memory) and handed back to ``loads_with_buffers``
+    in the same order.
+
+    Parameters
+    ----------
+    obj : any object
+    buffer_callback : callable
+        Called once per exported array, in order, with a flat uint8 array
+        viewing the array's data (an object exposing the buffer interface)
+
+    Returns
+    -------
+    pickled : bytes
+    """
+    # arrays referenced more than once are only exported once; keep them
+    # alive so that their ids are not reused while pickling
+    exported = {}
+
+    def persistent_id(arr):
+        if (type(arr) is not np.ndarray or arr.dtype.hasobject or
+                not (arr.flags.c_contiguous or arr.flags.f_contiguous)):
+            return None
+
+        key = id(arr)
+        if key not in exported:
+            # a Fortran ordered array is exported as its (C ordered)
+            # transpose
+            fortran = not arr.flags.c_contiguous
+            data = arr.T if fortran else arr
+            buffer_callback(data.reshape(-1).view(np.uint8))
+            exported[key] = (arr, (len(exported), arr.dtype.str,
+                                   arr.shape, fortran))
+        return exported[key][1]
+
+    buf = BytesIO()
+    pickler = pkl.Pickler(buf, pkl.HIGHEST_PROTOCOL)
+    pickler.persistent_id = persistent_id
+    pickler.dump(obj)
+    return buf.getvalue()
+
+
+def loads_with_buffers(data, buffers):
+    """
+    Load an object pickled with ``dumps_with_buffers``
+
+    The numeric arrays of the result are views onto ``buffers``, which are
+    not copied (and are read-only if the buffers are).
+
+    Parameters
+    ----------
+    data : bytes
+        Pickled metadata
+    buffers : list of objects exposing the buffer interface
+        The buffers passed to ``buffer_callback``, in the same order
+
+    Returns
+    -------
+    unpickled : type of object pickled
+    """
+
+    def persistent_load(pid):
+        i, dtype, shape, fortran = pid
+        if not np.prod(shape):
+            return np.empty(shape, dtype=dtype)
+        arr = np.frombuffer(buffers[i], dtype=np.uint8).view(dtype)
+        if fortran:
+            return arr.reshape(shape[::-1]).T
+        return arr.reshape(shape)
+
+    unpickler = pkl.Unpickler(BytesIO(data))
+    unpickler.persistent_load = persistent_load
+    return unpickler.load()
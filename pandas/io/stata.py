@@ -1016,10 +1016,13 @@ class StataReader(StataParser):
                 dtype.append(('s' + str(i), self.NUMPY_TYPE_MAP[typ]))
             else:
                 dtype.append(('s' + str(i), 'S' + str(typ)))
-        dtype = np.dtype(dtype)
+        # the numeric fields are stored in the byte order of the file
+        dtype = np.dtype(dtype).newbyteorder(self.byteorder)
         read_len = count * dtype.itemsize
         self.path_or_buf.seek(self.data_location)
         data = np.frombuffer(self.path_or_buf.read(read_len),dtype=dtype,count=count)
+        if self.byteorder != _set_endianness(sys.byteorder):
+            data = data.astype(dtype.newbyteorder('='))
         self._data_read = True
 
         if convert_categoricals:
@@ -1325,6 +1328,8 @@ class StataWriter(StataParser):
             fname, self._encoding or self._default_encoding
         )
         self.type_converters = {253: np.int32, 252: np.int16, 251: np.int8}
+        # approximate number of bytes of the data section assembled per write
+        self._write_chunksize = 2 ** 22
 
     def _write(self, to_write):
         """
@@ -1426,15 +1431,6 @@ class StataWriter(StataParser):
     def _prepare_pandas(self, data):
         #NOTE: we might need a different API / class for pandas objects so
         # we can set different semantics - handle this with a PR to pandas.io
-        class DataFrameRowIter(object):
-            def __init__(self, data):
-                self.data = data
-
-            def __iter__(self):
-                for row in data.itertuples():
-                    # First element is index, so remove
-                    yield row[1:]
-
         if self._write_index:
             data = data.reset_index()
         # Check columns for compatibility with stata
@@ -1443,7 +1439,6 @@ class StataWriter(StataParser):
         data = self._check_column_names(data)
         # Replace NaNs with Stata missing values
         data = self._replace_nans(data)
-        self.datarows = DataFrameRowIter(data)
         self.nobs, self.nvar = data.shape
         self.data = data
         self.varlist = data.columns.tolist()
@@ -1542,45 +1537,56 @@ class StataWriter(StataParser):
                 self._write(_pad_bytes("", 81))
 
     def _prepare_data(self):
-        data = self.data.copy()
+        data = self.data
         typlist = self.typlist
         convert_dates = self._convert_dates
-        # 1. Convert dates
-        if self._convert_dates is not None:
-            for i, col in enumerate(data):
-                if i in convert_dates:
-                    data[col] = _datetime_to_stata_elapsed_vec(data[col],
-                                                               self.fmtlist[i])
+        byteorder = self._byteorder
 
-        # 2. Convert bad string data to '' and pad to correct length
+        # Build the on-disk record layout and the column arrays which fill it.
+        # Numeric fields carry the requested byte order so that assigning
+        # native values into a chunk byte-swaps them column-wise.
         dtype = []
         data_cols = []
-        has_strings = False
         for i, col in enumerate(data):
+            values = data.iloc[:, i]
+            # 1. Convert dates
+            if convert_dates is not None and i in convert_dates:
+                values = _datetime_to_stata_elapsed_vec(values,
+                                                        self.fmtlist[i])
             typ = ord(typlist[i])
             if typ <= 244:
-                has_strings = True
-                data[col] = data[col].fillna('').apply(_pad_bytes, args=(typ,))
+                # 2. Convert bad string data to '', encode and pad with
+                # null bytes to the correct length
                 stype = 'S%d' % typ
-                dtype.append(('c'+str(i), stype))
-                string = data[col].str.encode(self._encoding)
-                data_cols.append(string.values.astype(stype))
+                values = values.fillna('').str.encode(self._encoding)
+                dtype.append(('c' + str(i), stype))
+                data_cols.append(values.values.astype(stype))
             else:
-                dtype.append(('c'+str(i), data[col].dtype))
-                data_cols.append(data[col].values)
-        dtype = np.dtype(dtype)
+                values = np.asarray(values)
+                dtype.append(('c' + str(i),
+                              values.dtype.newbyteorder(byteorder)))
+                data_cols.append(values)
 
-        # 3. Convert to record array
-
-        # data.to_records(index=False, convert_datetime64=False)
-        if has_strings:
-            self.data = np.fromiter(zip(*data_cols), dtype=dtype)
-        else:
-            self.data = data.to_records(index=False)
+        self._record_dtype = np.dtype(dtype)
+        self.data = data_cols
 
     def _write_data(self):
-        data = self.data
-        data.tofile(self._file)
+        """
+        Write the data section in chunks of rows; each chunk is assembled
+        column-wise into a packed record array and written with a single
+        buffer write, so that memory use is bounded by ``_write_chunksize``
+        """
+        record_dtype = self._record_dtype
+        names = record_dtype.names
+        nobs = self.nobs
+        chunksize = max(self._write_chunksize // max(record_dtype.itemsize, 1),
+                        1)
+        for start in range(0, nobs, chunksize):
+            stop = min(start + chunksize, nobs)
+            records = np.empty(stop - start, dtype=record_dtype)
+            for name, values in zip(names, self.data):
+                records[name] = values[start:stop]
+            self._file.write(records.tostring())
 
     def _null_terminate(self, s, as_string=False):
         null_byte = '\x00'
@@ -0,0 +1,136 @@
+import nose
+
+import numpy as np
+
+import pandas as pd
+from pandas import (Series, DataFrame, MultiIndex, date_range,
+                    Categorical, read_blockfile)
+from pandas.compat import u
+import pandas.util.testing as tm
+from pandas.util.testing import ensure_clean
+
+
+class TestBlockFile(tm.TestCase):
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        self.frame = DataFrame({'A': np.random.randn(10),
+                                'B': np.arange(10),
+                                'C': ['foo', 'bar', np.nan, u('\u03c3'),
+                                      'baz'] * 2,
+                                'D': date_range('20130101', periods=10),
+                                'E': [True, False] * 5,
+                                'F': pd.to_timedelta(np.arange(10), unit='s'),
+                                'G': np.random.randn(10).astype('float32')},
+                               columns=list('ABCDEFG'))
+
+    def roundtrip(self, obj, **kwargs):
+        with ensure_clean() as path:
+            obj.to_blockfile(path)
+            result = read_blockfile(path, **kwargs)
+            # make sure the data is not tied to the (deleted) file
+            return result.copy()
+
+    def test_frame(self):
+        for mmap in [True, False]:
+            result = self.roundtrip(self.frame, mmap=mmap)
+            tm.assert_frame_equal(result, self.frame)
+
+        df = tm.makeMixedDataFrame()
+        tm.assert_frame_equal(self.roundtrip(df), df)
+
+        df = DataFrame()
+        tm.assert_frame_equal(self.roundtrip(df), df)
+
+    def test_frame_non_consolidated(self):
+        df = DataFrame({'A': np.arange(5.)})
+        df.insert(0, 'B', np.arange(5.))
+        df['C'] = 'a'
+        df['D'] = np.arange(5)
+        self.assertFalse(df._data.is_consolidated())
+        tm.assert_frame_equal(self.roundtrip(df), df)
+
+        # duplicate columns
+        df.columns = ['A', 'B', 'A', 'B']
+        tm.assert_frame_equal(self.roundtrip(df), df)
+
+    def test_object_columns(self):
+        df = DataFrame({'all_nan': [np.nan] * 3,
+                        'mixed': [1, 'a', 2.5],
+                        'empty_str': ['', 'a', '']})
+        tm.assert_frame_equal(self.roundtrip(df), df)
+
+    def test_indexes(self):
+        df = self.frame.copy()
+
+        df.index = date_range('20130101', periods=10, tz='US/Eastern',
+                              name='date')
+        result = self.roundtrip(df)
+        tm.assert_frame_equal(result, df)
+        self.assertEqual(result.index.tz, df.index.tz)
+        self.assertEqual(result.index.freq, df.index.freq)
+
+        df.index = MultiIndex.from_product([['a', 'b'], range(5)],
+                                           names=['first', 'second'])
+        tm.assert_frame_equal(self.roundtrip(df), df)
+
+        df.index = pd.period_range('2000-01', periods=10, freq='M')
+        tm.assert_frame_equal(self.roundtrip(df), df)
+
+        df.index = np.arange(10.) / 2
+        df.columns.name = 'columns'
+        tm.assert_frame_equal(self.roundtrip(df), df)
+
+    def test_categorical(self):
+        df = DataFrame({'A': Categorical(['a', 'b', 'a', np.nan],
+                                         categories=['b', 'a']),
+                        'B': np.arange(4)})
+        result = self.roundtrip(df)
+        tm.assert_frame_equal(result, df)
+        self.assert_numpy_array_equal(result['A'].cat.categories,
+                                      df['A'].cat.categories)
+
+    def test_series(self):
+        s = Series(np.random.randn(5), index=list('abcde'), name='foo')
+        result = self.roundtrip(s)
+        tm.assert_series_equal(result, s)
+        self.assertEqual(result.name, 'foo')
+
+        s = Series(['a', np.nan, 'c'])
+        tm.assert_series_equal(self.roundtrip(s), s)
+
+    def test_panel(self):
+        p = tm.makePanel()
+        tm.assert_panel_equal(self.roundtrip(p), p)
+
+    def test_mmap_views(self):
+        with ensure_clean() as path:
+            self.frame.to_blockfile(path)
+
+            result = read_blockfile(path)
+            for blk in result._data.blocks:
+                if blk.dtype != np.object_:
+                    self.assertFalse(blk.values.flags.writeable)
+
+            result = read_blockfile(path, mmap=False)
+            result.iloc[0, 0] = 1.5
+            self.assertEqual(result.iloc[0, 0], 1.5)
+
+            # release the mapping before the file is removed
+            del result
+
+    def test_sparse_raises(self):
+        with ensure_clean() as path:
+            sdf = tm.makeDataFrame().to_sparse()
+            self.assertRaises(NotImplementedError, sdf.to_blockfile, path)
+
+    def test_invalid_file(self):
+        with ensure_clean() as path:
+            with open(path, 'wb') as f:
+                f.write(b'not a block file')
+            self.assertRaises(ValueError, read_blockfile, path)
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
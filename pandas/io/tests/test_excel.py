@@ -349,6 +349,51 @@ class ExcelReaderTests(SharedItems, tm.TestCase):
 
         self.assertTrue(f.closed)
 
+    def test_excel_read_chunksize(self):
+        _skip_if_no_xlrd()
+
+        for pth in [self.xls1, self.xlsx1]:
+            xls = ExcelFile(pth)
+            expected = xls.parse('Sheet1', index_col=0, parse_dates=True)
+
+            reader = xls.parse('Sheet1', index_col=0, parse_dates=True,
+                               chunksize=3)
+            chunks = list(reader)
+            self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 1])
+            tm.assert_frame_equal(pd.concat(chunks), expected)
+
+            reader = read_excel(pth, 'Sheet1', index_col=0, parse_dates=True,
+                                chunksize=4)
+            tm.assert_frame_equal(reader.get_chunk(), expected[:4])
+
+    def test_read_excel_releases_book(self):
+        _skip_if_no_xlrd()
+        import xlrd
+
+        released = []
+        release_resources = xlrd.Book.release_resources
+
+        def _release_resources(book):
+            released.append(book)
+            release_resources(book)
+
+        xlrd.Book.release_resources = _release_resources
+        try:
+            expected = ExcelFile(self.xls1).parse('Sheet1', index_col=0)
+            del released[:]
+
+            result = read_excel(self.xls1, 'Sheet1', index_col=0)
+            tm.assert_frame_equal(result, expected)
+            self.assertEqual(len(released), 1)
+
+            # the rows of a chunked reader are read after the release
+            reader = read_excel(self.xls1, 'Sheet1', index_col=0,
+                                chunksize=3)
+            self.assertEqual(len(released), 2)
+            tm.assert_frame_equal(pd.concat(list(reader)), expected)
+        finally:
+            xlrd.Book.release_resources = release_resources
+
     def test_reader_special_dtypes(self):
         _skip_if_no_xlrd()
 
@@ -1291,6 +1336,29 @@ class XlsxWriterTests(ExcelWriterBase, tm.TestCase):
     engine_name = 'xlsxwriter'
     check_skip = staticmethod(_skip_if_no_xlsxwriter)
 
+    def test_constant_memory(self):
+        _skip_if_no_xlrd()
+
+        frame = self.mixed_frame
+        # repeated labels in the first level, which would be merged
+        first = np.arange(len(frame.index)) // 2
+        second = np.arange(len(frame.index))
+        frame.index = MultiIndex.from_arrays([first, second],
+                                             names=['first', 'second'])
+        with ensure_clean(self.ext) as path:
+            with ExcelWriter(path, options={'constant_memory': True}) as writer:
+                self.frame.to_excel(writer, 'test1')
+                frame.to_excel(writer, 'test2', merge_cells=self.merge_cells)
+
+            reader = ExcelFile(path)
+            recons = reader.parse('test1', index_col=0)
+            tm.assert_frame_equal(self.frame, recons)
+            # merged cells cannot be streamed, so they are never written
+            recons = reader.parse('test2', index_col=[0, 1],
+                                  parse_dates=False,
+                                  has_index_names=False)
+            tm.assert_frame_equal(frame, recons)
+
 
 class OpenpyxlTests_NoMerge(ExcelWriterBase, tm.TestCase):
     ext = '.xlsx'
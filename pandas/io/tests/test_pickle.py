@@ -141,6 +141,52 @@ class TestPickle(tm.TestCase):
                         result = python_unpickler(path)
                         self.compare_element(typ, result, expected)
 
+    def test_round_trip_buffers(self):
+        from pandas.io.pickle import dumps_with_buffers, loads_with_buffers
+
+        for typ, dv in self.data.items():
+            for dt, expected in dv.items():
+                buffers = []
+                data = dumps_with_buffers(expected, buffers.append)
+                result = loads_with_buffers(data, buffers)
+                self.compare_element(typ, result, expected)
+
+        # the block data is not copied into the pickle stream
+        df = pd.DataFrame(np.random.randn(10000, 10),
+                          index=pd.date_range('20130101', periods=10000))
+        buffers = []
+        data = dumps_with_buffers(df, buffers.append)
+        self.assertTrue(len(data) < 10000 * 8)
+        nbytes = sum(b.nbytes for b in buffers)
+        self.assertTrue(nbytes >= df.values.size * 8)
+
+        # object blocks are still pickled in-band
+        df['A'] = 'foo'
+        buffers = []
+        data = dumps_with_buffers(df, buffers.append)
+        self.assertEqual(sum(b.nbytes for b in buffers), nbytes)
+
+        # buffers can be any object exposing the buffer interface
+        result = loads_with_buffers(data, [b.tostring() for b in buffers])
+        tm.assert_frame_equal(result, df)
+        self.assertEqual(result.index.freq, df.index.freq)
+
+        # and the result is a view onto them
+        result = loads_with_buffers(data, buffers)
+        blk = [b for b in result._data.blocks if b.is_float][0]
+        self.assertTrue(any(np.may_share_memory(blk.values, b)
+                            for b in buffers))
+
+    def test_round_trip_buffers_fortran(self):
+        from pandas.io.pickle import dumps_with_buffers, loads_with_buffers
+
+        arr = np.asfortranarray(np.arange(12.).reshape(3, 4))
+        buffers = []
+        result = loads_with_buffers(dumps_with_buffers(arr, buffers.append),
+                                    buffers)
+        self.assert_numpy_array_equal(result, arr)
+        self.assertEqual(len(buffers), 1)
+
     def _validate_timeseries(self, pickled, current):
         # GH 7748
         tm.assert_series_equal(pickled, current)
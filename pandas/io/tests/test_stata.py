@@ -15,8 +15,8 @@ import pandas as pd
 from pandas.compat import iterkeys
 from pandas.core.frame import DataFrame, Series
 from pandas.io.parsers import read_csv
-from pandas.io.stata import (read_stata, StataReader, InvalidColumnName,
-    PossiblePrecisionLoss, StataMissingValue)
+from pandas.io.stata import (read_stata, StataReader, StataWriter,
+    InvalidColumnName, PossiblePrecisionLoss, StataMissingValue)
 import pandas.util.testing as tm
 from pandas.tslib import NaT
 from pandas.util.misc import is_little_endian
@@ -694,7 +694,41 @@ class TestStata(tm.TestCase):
             tm.assert_frame_equal(written_and_read_again.set_index('index'),
                                   expected)
 
-
+    def test_write_byteorder(self):
+        original = DataFrame({'int8': np.array([1, -2, 3], dtype=np.int8),
+                              'int16': np.array([1, -2, 300], dtype=np.int16),
+                              'int32': np.array([1, -2, 70000],
+                                                dtype=np.int32),
+                              'float32': np.array([1.5, np.nan, 3.5],
+                                                  dtype=np.float32),
+                              'float64': [1.5, 2.5, np.nan],
+                              'string': ['a', 'bb', None]},
+                             columns=['int8', 'int16', 'int32', 'float32',
+                                      'float64', 'string'])
+        original.index.name = 'index'
+        expected = original.copy()
+        expected['string'] = ['a', 'bb', '']
+        for byteorder in ['<', '>']:
+            with tm.ensure_clean() as path:
+                original.to_stata(path, byteorder=byteorder)
+                written_and_read_again = self.read_dta(path)
+                tm.assert_frame_equal(
+                    written_and_read_again.set_index('index'), expected)
+
+    def test_write_data_chunked(self):
+        original = DataFrame({'x': np.arange(1000.0),
+                              'y': np.arange(1000, dtype=np.int32),
+                              's': ['abc'] * 1000},
+                             columns=['x', 'y', 's'])
+        original.index.name = 'index'
+        with tm.ensure_clean() as path:
+            writer = StataWriter(path, original)
+            # force several chunks, including a partial one
+            writer._write_chunksize = 64
+            writer.write_file()
+            written_and_read_again = self.read_dta(path)
+            tm.assert_frame_equal(written_and_read_again.set_index('index'),
+                                  original)
 
 
 if __name__ == '__main__':
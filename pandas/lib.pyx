@@ -238,6 +238,20 @@ def isscalar(object val):
     return np.isscalar(val) or val is None or PyDateTime_Check(val) or PyDelta_Check(val)
 
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def memory_usage_of_objects(ndarray[object, ndim=1] arr):
+    """ return the memory usage of the objects of an object array in bytes,
+    not including the pointers of the array itself """
+    cdef Py_ssize_t i, n
+    cdef int64_t s = 0
+
+    n = len(arr)
+    for i from 0 <= i < n:
+        s += arr[i].__sizeof__()
+    return s
+
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def isnullobj(ndarray[object] arr):
@@ -1676,6 +1676,162 @@ def group_ohlc_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
             out[b, 3] = vclose
 """
 
+group_cumsum_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumsum_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                          ndarray[%(c_type)s, ndim=2] values,
+                          ndarray[int64_t] labels,
+                          ndarray[%(c_type)s, ndim=2] accum):
+    '''
+    Cumulative sums within each group, in a single pass over the rows.
+    accum holds the running sums of the groups (initialized with 0),
+    nans are skipped and the rows with a negative label are left as is
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        %(c_type)s val
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                accum[lab, j] += val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = val
+
+
+"""
+
+group_cumprod_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumprod_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                           ndarray[%(c_type)s, ndim=2] values,
+                           ndarray[int64_t] labels,
+                           ndarray[%(c_type)s, ndim=2] accum):
+    '''
+    Cumulative products within each group, in a single pass over the rows.
+    accum holds the running products of the groups (initialized with 1),
+    nans are skipped and the rows with a negative label are left as is
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        %(c_type)s val
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                accum[lab, j] *= val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = val
+
+
+"""
+
+group_cummin_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                          ndarray[%(c_type)s, ndim=2] values,
+                          ndarray[int64_t] labels,
+                          ndarray[%(c_type)s, ndim=2] accum):
+    '''
+    Cumulative minimums within each group, in a single pass over the rows.
+    accum holds the running minimums of the groups (initialized with the
+    largest value of the dtype), nans are skipped and the rows with a
+    negative label are left as is
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        %(c_type)s val
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                if val < accum[lab, j]:
+                    accum[lab, j] = val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = val
+
+
+"""
+
+group_cummax_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummax_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                          ndarray[%(c_type)s, ndim=2] values,
+                          ndarray[int64_t] labels,
+                          ndarray[%(c_type)s, ndim=2] accum):
+    '''
+    Cumulative maximums within each group, in a single pass over the rows.
+    accum holds the running maximums of the groups (initialized with the
+    smallest value of the dtype), nans are skipped and the rows with a
+    negative label are left as is
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        %(c_type)s val
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                if val > accum[lab, j]:
+                    accum[lab, j] = val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = val
+
+
+"""
+
 arrmap_template = """@cython.wraparound(False)
 @cython.boundscheck(False)
 def arrmap_%(name)s(ndarray[%(c_type)s] index, object func):
@@ -2347,6 +2503,11 @@ groupbys = [group_last_template,
 
 groupby_count = [group_count_template, group_count_bin_template]
 
+groupby_cumulative = [group_cumsum_template,
+                      group_cumprod_template,
+                      group_cummin_template,
+                      group_cummax_template]
+
 templates_1d = [map_indices_template,
                 pad_template,
                 backfill_template,
@@ -2392,6 +2553,10 @@ def generate_take_cython_file(path='generated.pyx'):
                                         use_datelikes=True, use_objects=True),
                   file=f)
 
+        for template in groupby_cumulative:
+            print(generate_put_template(template, use_ints=False,
+                                        use_datelikes=True), file=f)
+
         # for template in templates_1d_datetime:
         #     print >> f, generate_from_template_datetime(template)
 
@@ -6906,6 +6906,455 @@ def group_count_bin_int64(ndarray[float64_t, ndim=2] out,
 
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumsum_float64(ndarray[float64_t, ndim=2] out,
+                          ndarray[float64_t, ndim=2] values,
+                          ndarray[int64_t] labels,
+                          ndarray[float64_t, ndim=2] accum):
+    '''
+    Cumulative sums within each group, in a single pass over the rows.
+    accum holds the running sums of the groups (initialized with 0),
+    nans are skipped and the rows with a negative label are left as is
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                accum[lab, j] += val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = val
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumsum_float32(ndarray[float32_t, ndim=2] out,
+                          ndarray[float32_t, ndim=2] values,
+                          ndarray[int64_t] labels,
+                          ndarray[float32_t, ndim=2] accum):
+    '''
+    Cumulative sums within each group, in a single pass over the rows.
+    accum holds the running sums of the groups (initialized with 0),
+    nans are skipped and the rows with a negative label are left as is
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float32_t val
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                accum[lab, j] += val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = val
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumsum_int64(ndarray[int64_t, ndim=2] out,
+                          ndarray[int64_t, ndim=2] values,
+                          ndarray[int64_t] labels,
+                          ndarray[int64_t, ndim=2] accum):
+    '''
+    Cumulative sums within each group, in a single pass over the rows.
+    accum holds the running sums of the groups (initialized with 0),
+    nans are skipped and the rows with a negative label are left as is
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                accum[lab, j] += val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = val
+
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumprod_float64(ndarray[float64_t, ndim=2] out,
+                           ndarray[float64_t, ndim=2] values,
+                           ndarray[int64_t] labels,
+                           ndarray[float64_t, ndim=2] accum):
+    '''
+    Cumulative products within each group, in a single pass over the rows.
+    accum holds the running products of the groups (initialized with 1),
+    nans are skipped and the rows with a negative label are left as is
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                accum[lab, j] *= val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = val
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumprod_float32(ndarray[float32_t, ndim=2] out,
+                           ndarray[float32_t, ndim=2] values,
+                           ndarray[int64_t] labels,
+                           ndarray[float32_t, ndim=2] accum):
+    '''
+    Cumulative products within each group, in a single pass over the rows.
+    accum holds the running products of the groups (initialized with 1),
+    nans are skipped and the rows with a negative label are left as is
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float32_t val
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                accum[lab, j] *= val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = val
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumprod_int64(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[int64_t] labels,
+                           ndarray[int64_t, ndim=2] accum):
+    '''
+    Cumulative products within each group, in a single pass over the rows.
+    accum holds the running products of the groups (initialized with 1),
+    nans are skipped and the rows with a negative label are left as is
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                accum[lab, j] *= val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = val
+
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummin_float64(ndarray[float64_t, ndim=2] out,
+                          ndarray[float64_t, ndim=2] values,
+                          ndarray[int64_t] labels,
+                          ndarray[float64_t, ndim=2] accum):
+    '''
+    Cumulative minimums within each group, in a single pass over the rows.
+    accum holds the running minimums of the groups (initialized with the
+    largest value of the dtype), nans are skipped and the rows with a
+    negative label are left as is
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                if val < accum[lab, j]:
+                    accum[lab, j] = val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = val
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummin_float32(ndarray[float32_t, ndim=2] out,
+                          ndarray[float32_t, ndim=2] values,
+                          ndarray[int64_t] labels,
+                          ndarray[float32_t, ndim=2] accum):
+    '''
+    Cumulative minimums within each group, in a single pass over the rows.
+    accum holds the running minimums of the groups (initialized with the
+    largest value of the dtype), nans are skipped and the rows with a
+    negative label are left as is
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float32_t val
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                if val < accum[lab, j]:
+                    accum[lab, j] = val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = val
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummin_int64(ndarray[int64_t, ndim=2] out,
+                          ndarray[int64_t, ndim=2] values,
+                          ndarray[int64_t] labels,
+                          ndarray[int64_t, ndim=2] accum):
+    '''
+    Cumulative minimums within each group, in a single pass over the rows.
+    accum holds the running minimums of the groups (initialized with the
+    largest value of the dtype), nans are skipped and the rows with a
+    negative label are left as is
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                if val < accum[lab, j]:
+                    accum[lab, j] = val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = val
+
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummax_float64(ndarray[float64_t, ndim=2] out,
+                          ndarray[float64_t, ndim=2] values,
+                          ndarray[int64_t] labels,
+                          ndarray[float64_t, ndim=2] accum):
+    '''
+    Cumulative maximums within each group, in a single pass over the rows.
+    accum holds the running maximums of the groups (initialized with the
+    smallest value of the dtype), nans are skipped and the rows with a
+    negative label are left as is
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                if val > accum[lab, j]:
+                    accum[lab, j] = val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = val
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummax_float32(ndarray[float32_t, ndim=2] out,
+                          ndarray[float32_t, ndim=2] values,
+                          ndarray[int64_t] labels,
+                          ndarray[float32_t, ndim=2] accum):
+    '''
+    Cumulative maximums within each group, in a single pass over the rows.
+    accum holds the running maximums of the groups (initialized with the
+    smallest value of the dtype), nans are skipped and the rows with a
+    negative label are left as is
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float32_t val
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                if val > accum[lab, j]:
+                    accum[lab, j] = val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = val
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummax_int64(ndarray[int64_t, ndim=2] out,
+                          ndarray[int64_t, ndim=2] values,
+                          ndarray[int64_t] labels,
+                          ndarray[int64_t, ndim=2] accum):
+    '''
+    Cumulative maximums within each group, in a single pass over the rows.
+    accum holds the running maximums of the groups (initialized with the
+    smallest value of the dtype), nans are skipped and the rows with a
+    negative label are left as is
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                if val > accum[lab, j]:
+                    accum[lab, j] = val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = val
+
+
+
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def left_join_indexer_unique_float64(ndarray[float64_t] left,
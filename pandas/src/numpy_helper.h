@@ -109,6 +109,52 @@ get_c_string(PyObject* obj) {
 #endif
 }
 
+// the data of a string, as utf-8 (py3 str, cached by the object) or bytes
+// (py2 str, or unicode as ascii, cached by the object), which lives as long
+// as obj. NULL, with no exception set, if obj is not a string or cannot be
+// encoded.
+PANDAS_INLINE char*
+get_string_data(PyObject* obj, Py_ssize_t* size) {
+#if PY_VERSION_HEX >= 0x03030000
+  char *ret;
+  if (!PyUnicode_Check(obj)) {
+    return NULL;
+  }
+  ret = (char *) PyUnicode_AsUTF8AndSize(obj, size);
+  if (ret == NULL) {
+    PyErr_Clear();
+  }
+  return ret;
+#elif PY_VERSION_HEX >= 0x03000000
+  PyObject* enc_str;
+  if (!PyUnicode_Check(obj)) {
+    return NULL;
+  }
+  enc_str = _PyUnicode_AsDefaultEncodedString(obj, NULL);
+  if (enc_str == NULL) {
+    PyErr_Clear();
+    return NULL;
+  }
+  *size = PyBytes_GET_SIZE(enc_str);
+  return PyBytes_AS_STRING(enc_str);
+#else
+  PyObject* enc_str;
+  if (PyString_Check(obj)) {
+    enc_str = obj;
+  } else if (PyUnicode_Check(obj)) {
+    enc_str = _PyUnicode_AsDefaultEncodedString(obj, NULL);
+    if (enc_str == NULL) {
+      PyErr_Clear();
+      return NULL;
+    }
+  } else {
+    return NULL;
+  }
+  *size = PyString_GET_SIZE(enc_str);
+  return PyString_AS_STRING(enc_str);
+#endif
+}
+
 PANDAS_INLINE PyObject*
 char_to_string(char* data) {
 #if PY_VERSION_HEX >= 0x03000000
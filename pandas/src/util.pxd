@@ -18,6 +18,7 @@ cdef extern from "numpy_helper.h":
     inline object get_value_1d(ndarray, Py_ssize_t)
     inline int floatify(object, double*) except -1
     inline char *get_c_string(object)
+    inline char *get_string_data(object, Py_ssize_t*)
     inline object char_to_string(char*)
     inline void transfer_object_column(char *dst, char *src, size_t stride,
                                        size_t length)
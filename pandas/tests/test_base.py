@@ -272,6 +272,28 @@ class TestIndexOps(Ops):
         self.assertEqual(Index([1]).item(), 1)
         self.assertEqual(Series([1]).item(), 1)
 
+    def test_memory_usage(self):
+        for o in self.objs:
+            # deep=True also introspects an object index of a Series
+            kwargs = {'index': False} if isinstance(o, Series) else {}
+            res = o.memory_usage(**kwargs)
+            res_deep = o.memory_usage(deep=True, **kwargs)
+
+            if o.dtype == np.object_:
+                self.assertTrue(res_deep > res)
+            else:
+                self.assertEqual(res, res_deep)
+
+            if isinstance(o, Series):
+                self.assertEqual(
+                    o.memory_usage(index=False) + o.index.memory_usage(),
+                    o.memory_usage(index=True))
+                self.assertEqual(
+                    res_deep + o.index.memory_usage(deep=True),
+                    o.memory_usage(index=True, deep=True))
+            else:
+                self.assertTrue(res >= o.nbytes)
+
     def test_ops(self):
         for op in ['max','min']:
             for o in self.objs:
@@ -1548,12 +1548,56 @@ class CheckIndexing(object):
         with tm.assertRaisesRegexp(ValueError, 'same size'):
             self.frame.lookup(['a', 'b', 'c'], ['a'])
 
+    def test_lookup_mixed_blocks(self):
+        df = DataFrame({'A': np.arange(5.), 'B': np.arange(5),
+                        'C': list('abcde'),
+                        'D': date_range('20130101', periods=5)},
+                       index=list('vwxyz'))
+
+        rows = np.tile(df.index.values, 1000)
+        cols = np.repeat(df.columns.values, 1250)
+        result = df.lookup(rows, cols)
+        self.assertEqual(len(result), 5000)
+        for i in np.random.randint(0, 5000, size=50):
+            self.assertEqual(result[i], df.get_value(rows[i], cols[i]))
+
+        # dtype of the columns looked up
+        result = df.lookup(['x', 'v', 'z'], ['A', 'B', 'A'])
+        self.assert_numpy_array_equal(result, [2., 0., 4.])
+        self.assertEqual(result.dtype, np.float64)
+        result = df.lookup(['x', 'y'], ['D', 'D'])
+        self.assertEqual(result.dtype, 'M8[ns]')
+
+        result = df.lookup([], [])
+        self.assertEqual(len(result), 0)
+
     def test_set_value(self):
         for idx in self.frame.index:
             for col in self.frame.columns:
                 self.frame.set_value(idx, col, 1)
                 assert_almost_equal(self.frame[col][idx], 1)
 
+    def test_set_value_inplace(self):
+        df = DataFrame({'A': [1., 2., 3.], 'B': [1, 2, 3]}, index=list('abc'))
+        col = df['A']
+        df.at['b', 'A'] = 5.
+        df.iat[2, 1] = 7
+
+        # written into the blocks, which the cached columns are views of
+        self.assertEqual(col['b'], 5.)
+        self.assertEqual(df.at['c', 'B'], 7)
+        self.assertEqual(df.iat[1, 0], 5.)
+        self.assertEqual(df.iat[-1, -1], 7)
+        self.assertEqual(df['B'].dtype, np.int64)
+
+        # the block can't hold it
+        df.at['a', 'B'] = 'foo'
+        self.assertEqual(df.at['a', 'B'], 'foo')
+        self.assertEqual(df['B'].dtype, np.object_)
+        df.iat[0, 0] = 'bar'
+        self.assertEqual(df.at['a', 'A'], 'bar')
+        self.assertEqual(df['A'].dtype, np.object_)
+
     def test_set_value_resize(self):
 
         res = self.frame.set_value('foobar', 'B', 0)
@@ -3168,6 +3212,37 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
         self.assert_numpy_array_equal(result.index, index)
         self.assert_numpy_array_equal(result.columns, columns)
 
+    def test_from_dict_no_copy(self):
+        data = {'A': np.arange(5.), 'B': np.arange(5.),
+                'C': np.arange(5), 'D': list('abcde'),
+                'E': Series(np.arange(5.) * 2)}
+        expected = DataFrame(data)
+
+        result = DataFrame.from_dict(data, copy=False)
+        assert_frame_equal(result, expected)
+        self.assertFalse(result._data.is_consolidated())
+        self.assertEqual(len(result._data.blocks), 5)
+
+        # the arrays are not copied
+        data['A'][0] = 100
+        data['C'][1] = 100
+        data['E'][2] = 100
+        self.assertEqual(result['A'][0], 100)
+        self.assertEqual(result['C'][1], 100)
+        self.assertEqual(result['E'][2], 100)
+
+        consolidated = result.consolidate()
+        self.assertTrue(consolidated._data.is_consolidated())
+        assert_frame_equal(consolidated, result)
+
+        data = OrderedDict([('b', np.arange(3)), ('a', np.arange(3.))])
+        result = DataFrame.from_dict(data, copy=False, dtype='float64')
+        self.assert_numpy_array_equal(result.columns, ['b', 'a'])
+        self.assertEqual(result['b'].dtype, np.float64)
+
+        self.assertRaises(ValueError, DataFrame.from_dict, data,
+                          orient='index', copy=False)
+
     def test_constructor_from_items(self):
         items = [(c, self.frame[c]) for c in self.frame.columns]
         recons = DataFrame.from_items(items)
@@ -6546,7 +6621,7 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
 
     def test_info_max_cols(self):
         df = DataFrame(np.random.randn(10, 5))
-        for len_, verbose in [(5, None), (5, False), (10, True)]:
+        for len_, verbose in [(6, None), (6, False), (11, True)]:
         # For verbose always      ^ setting  ^ summarize ^ full output
             with option_context('max_info_columns', 4):
                 buf = StringIO()
@@ -6554,7 +6629,7 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
                 res = buf.getvalue()
                 self.assertEqual(len(res.split('\n')), len_)
 
-        for len_, verbose in [(10, None), (5, False), (10, True)]:
+        for len_, verbose in [(11, None), (6, False), (11, True)]:
 
             # max_cols no exceeded
             with option_context('max_info_columns', 5):
@@ -6563,7 +6638,7 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
                 res = buf.getvalue()
                 self.assertEqual(len(res.split('\n')), len_)
 
-        for len_, max_cols in [(10, 5), (5, 4)]:
+        for len_, max_cols in [(11, 5), (6, 4)]:
             # setting truncates
             with option_context('max_info_columns', 4):
                 buf = StringIO()
@@ -6578,6 +6653,154 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
                 res = buf.getvalue()
                 self.assertEqual(len(res.split('\n')), len_)
 
+    def test_info_memory_usage(self):
+        # Ensure memory usage is displayed, when asserted, on the last line
+        dtypes = ['int64', 'float64', 'datetime64[ns]', 'timedelta64[ns]',
+                  'complex128', 'object', 'bool']
+        data = {}
+        n = 10
+        for i, dtype in enumerate(dtypes):
+            data[i] = np.random.randint(2, size=n).astype(dtype)
+        df = DataFrame(data)
+        buf = StringIO()
+
+        # display memory usage case
+        df.info(buf=buf, memory_usage=True)
+        res = buf.getvalue().splitlines()
+        self.assertTrue("memory usage: " in res[-1])
+        # an object column: the size of the objects is not included
+        self.assertTrue("+" in res[-1])
+
+        # do not display memory usage case
+        buf = StringIO()
+        df.info(buf=buf, memory_usage=False)
+        res = buf.getvalue().splitlines()
+        self.assertTrue("memory usage: " not in res[-1])
+
+        buf = StringIO()
+        df.info(buf=buf, memory_usage='deep')
+        res = buf.getvalue().splitlines()
+        self.assertTrue("memory usage: " in res[-1])
+        self.assertTrue("+" not in res[-1])
+
+        with option_context('display.memory_usage', False):
+            buf = StringIO()
+            df.info(buf=buf)
+            res = buf.getvalue().splitlines()
+            self.assertTrue("memory usage: " not in res[-1])
+
+        # numeric only: exact size
+        df = DataFrame(np.random.randn(10, 2), columns=['A', 'B'])
+        buf = StringIO()
+        df.info(buf=buf)
+        res = buf.getvalue().splitlines()
+        self.assertTrue("+" not in res[-1])
+
+    def test_memory_usage(self):
+        n = 10
+        df = DataFrame({'a': np.arange(n, dtype='int64'),
+                        'b': np.arange(n, dtype='float32'),
+                        'c': ['x' * 10] * n,
+                        'd': pd.Categorical(['a', 'b'] * (n // 2))},
+                       columns=list('abcd'))
+
+        result = df.memory_usage(index=False)
+        self.assert_numpy_array_equal(result.index, list('abcd'))
+        self.assertEqual(result['a'], n * 8)
+        self.assertEqual(result['b'], n * 4)
+        self.assertEqual(result['c'], df['c'].values.nbytes)
+        self.assertEqual(result['d'], df['d'].values.memory_usage())
+
+        result = df.memory_usage()
+        self.assertEqual(result.index[0], 'Index')
+        self.assertEqual(result['Index'], df.index.memory_usage())
+        self.assertEqual(result.sum(),
+                         df.memory_usage(index=False).sum() +
+                         df.index.memory_usage())
+
+        deep = df.memory_usage(index=False, deep=True)
+        self.assertEqual(deep['a'], result['a'])
+        self.assertTrue(deep['c'] > result['c'])
+        self.assertTrue(deep['d'] > result['d'])
+
+        # consistent with the columns as Series
+        for col in df.columns:
+            self.assertEqual(df[col].memory_usage(index=False, deep=True),
+                             deep[col])
+
+        # the hash table of the index, once built, is included (lookups in
+        # monotonic indexes don't build one)
+        df = DataFrame({'a': np.arange(n)}, index=np.arange(n)[::-1] * 2)
+        before = df.memory_usage()['Index']
+        df.loc[4]
+        self.assertTrue(df.memory_usage()['Index'] > before)
+
+    def test_downcast(self):
+        n = 10
+        df = DataFrame({'a': np.arange(n, dtype='int64'),
+                        'b': np.arange(n, dtype='int64') * 1000,
+                        'c': np.arange(n, dtype='int64') - 2 ** 40,
+                        'd': np.random.randn(n),
+                        'e': [1e300] + [1.] * (n - 1),
+                        'f': ['x', 'y'] * (n // 2),
+                        'g': [str(i) for i in range(n)],
+                        'h': pd.date_range('20130101', periods=n)},
+                       columns=list('abcdefgh'))
+
+        result = df.downcast()
+        self.assertEqual(result['a'].dtype, np.int8)
+        self.assertEqual(result['b'].dtype, np.int16)
+        self.assertEqual(result['c'].dtype, np.int64)
+        self.assertEqual(result['d'].dtype, np.float32)
+        self.assertEqual(result['e'].dtype, np.float64)
+        self.assertEqual(result['f'].dtype, np.object_)
+        self.assertEqual(result['h'].dtype, 'M8[ns]')
+        assert_frame_equal(result, df, check_dtype=False,
+                           check_less_precise=True)
+
+        # the items of a block are split by dtype and same dtypes are
+        # consolidated
+        self.assertEqual(sorted(result._data.blocks[i].dtype.name
+                                for i in range(len(result._data.blocks))),
+                         ['datetime64[ns]', 'float32', 'float64', 'int16',
+                          'int64', 'int8', 'object'])
+
+        result = df.downcast(integer='unsigned', float=None)
+        self.assertEqual(result['a'].dtype, np.uint8)
+        self.assertEqual(result['c'].dtype, np.int64)
+        self.assertEqual(result['d'].dtype, np.float64)
+
+        result = df.downcast(integer=None, category_ratio=0.5)
+        self.assertEqual(result['a'].dtype, np.int64)
+        self.assertTrue(com.is_categorical_dtype(result['f'].dtype))
+        self.assertEqual(result['g'].dtype, np.object_)
+        assert_frame_equal(result[['g']], df[['g']])
+        self.assert_numpy_array_equal(result['f'].values.get_values(),
+                                      df['f'].values)
+
+        # unchanged columns are copied
+        result = df.downcast()
+        result.loc[0, 'c'] = 5
+        self.assertEqual(df.loc[0, 'c'], -2 ** 40)
+
+        self.assertRaises(ValueError, df.downcast, integer='foo')
+        self.assertRaises(ValueError, df.downcast, float='int32')
+
+    def test_downcast_report(self):
+        df = DataFrame({'a': np.arange(10, dtype='int64'),
+                        'b': np.random.randn(10),
+                        'c': ['x'] * 10}, columns=list('abc'))
+        result, report = df.downcast(category_ratio=0.5, report=True)
+        self.assert_numpy_array_equal(report.index, df.columns)
+        self.assertEqual(list(report.columns),
+                         ['dtype_before', 'dtype_after', 'bytes_saved'])
+        self.assertEqual(report.loc['a', 'dtype_after'], np.int8)
+        self.assertEqual(report.loc['a', 'bytes_saved'], 70)
+        self.assertEqual(report.loc['b', 'bytes_saved'], 40)
+        self.assertEqual(report['bytes_saved'].sum(),
+                         df.memory_usage().sum() -
+                         result.memory_usage().sum())
+
 
     def test_dtypes(self):
         self.mixed_frame['bool'] = self.mixed_frame['A'] > 0
@@ -12445,11 +12668,47 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
         self.assertIsNot(recons, consolidated)
         assert_frame_equal(recons, consolidated)
 
-        self.frame['F'] = 8.
-        self.assertEqual(len(self.frame._data.blocks), 3)
+        self.frame.insert(0, 'F', 8.)
+        self.assertEqual(len(self.frame._data.blocks), 2)
         self.frame.consolidate(inplace=True)
         self.assertEqual(len(self.frame._data.blocks), 1)
 
+    def test_setitem_append_inplace(self):
+        # appended columns are stored in the existing block of their dtype
+        df = DataFrame({'A': np.arange(5.)})
+        expected = {'A': np.arange(5.)}
+        for i in range(50):
+            df['f%d' % i] = expected['f%d' % i] = np.arange(5.) * i
+            df['i%d' % i] = expected['i%d' % i] = np.arange(5) * i
+        self.assertEqual(len(df._data.blocks), 2)
+        self.assertTrue(df._data.is_consolidated())
+        assert_frame_equal(df, DataFrame(expected, columns=df.columns))
+
+        # the values are copied
+        values = np.arange(5.)
+        df['x'] = values
+        values[0] = 100
+        self.assertEqual(df['x'][0], 0)
+
+        # the blocks of another frame sharing them are left untouched
+        df = DataFrame({'A': np.arange(5.), 'B': np.arange(5.)})
+        result = df.astype('float64', copy=False)
+        result['x'] = 1.
+        result['y'] = 2.
+        df['z'] = 3.
+        self.assert_numpy_array_equal(df.columns, ['A', 'B', 'z'])
+        self.assertEqual(len(df._data.blocks[0].mgr_locs), 3)
+        self.assertTrue((result['y'] == 2.).all())
+        self.assertTrue((df['z'] == 3.).all())
+        self.assert_numpy_array_equal(result.columns, ['A', 'B', 'x', 'y'])
+
+        # cached columns are invalidated when the block is moved
+        df = DataFrame({'A': np.arange(5.)})
+        df['A']
+        df.insert(1, 'B', 1.)
+        df.loc[0, 'A'] = -1
+        self.assertEqual(df['A'][0], -1)
+
     def test_consolidate_inplace(self):
         frame = self.frame.copy()
 
@@ -12458,7 +12717,7 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
             self.frame[chr(letter)] = chr(letter)
 
     def test_as_matrix_consolidate(self):
-        self.frame['E'] = 7.
+        self.frame.insert(0, 'E', 7.)
         self.assertFalse(self.frame._data.is_consolidated())
         _ = self.frame.as_matrix()
         self.assertTrue(self.frame._data.is_consolidated())
@@ -912,6 +912,56 @@ class TestGroupBy(tm.TestCase):
         result = grp.transform('mean')
         assert_series_equal(result,expected)
 
+    def test_transform_broadcast_reduction(self):
+        df = DataFrame({'A': ['b', 'a', 'c', 'a', 'b', 'a', np.nan, 'c'],
+                        'B': [1, 2, 3, 4, 5, 6, 7, 8],
+                        'C': [1., np.nan, 3., 4., 5., 6., 7., 8.],
+                        'D': date_range('20140101', periods=8)})
+        grouped = df.groupby('A')
+
+        # the group by group path keeps the values of the rows without a key
+        has_key = df['A'].notnull()
+        for how in ['sum', 'prod', 'min', 'max', 'mean', 'median', 'var',
+                    'std', 'count']:
+            result = grouped['C'].transform(how)
+            expected = grouped['C'].transform(lambda x: getattr(x, how)())
+            expected[~has_key] = np.nan
+            assert_series_equal(result, expected)
+
+        for func in [np.sum, np.mean, min, max]:
+            result = grouped['B'].transform(func)
+            expected = grouped['B'].transform(lambda x: func(x))
+            assert_series_equal(result[has_key],
+                                expected[has_key].astype(float))
+            self.assertTrue(com.isnull(result[~has_key]).all())
+
+        result = grouped['D'].transform('min')
+        expected = Series(df['D'].values[[0, 1, 2, 1, 0, 1, 0, 2]],
+                          name='D')
+        expected[6] = pd.NaT
+        assert_series_equal(result, expected)
+
+        # a frame is taken block by block, each column keeping the dtype of
+        # its reduction
+        result = grouped[['B', 'C']].transform('sum')
+        expected = DataFrame({'B': [6., 12., 11., 12., 6., 12., np.nan, 11.],
+                              'C': [6., 10., 11., 10., 6., 10., np.nan, 11.]})
+        assert_frame_equal(result, expected)
+
+        keyed = df.dropna(subset=['A'])
+        grouped = keyed.groupby('A')[['B', 'C']]
+        result = grouped.transform(np.max)
+        expected = grouped.max().reindex(keyed['A'])
+        expected.index = keyed.index
+        assert_frame_equal(result, expected)
+
+        # several keys
+        grouped = df.groupby(['A', df['B'] % 2])
+        result = grouped['C'].transform('mean')
+        expected = grouped['C'].transform(lambda x: x.mean())
+        expected[~has_key] = np.nan
+        assert_series_equal(result, expected)
+
     def test_transform_broadcast(self):
         grouped = self.ts.groupby(lambda x: x.month)
         result = grouped.transform(np.mean)
@@ -2005,6 +2055,23 @@ class TestGroupBy(tm.TestCase):
         result = a.groupby(level=0).sum()
         self.assertEqual(result.index.name, a.index.name)
 
+    def test_groupby_level_categorical_index(self):
+        index = pd.CategoricalIndex(list('abcabd'), categories=list('dcba'),
+                                    name='foo')
+        s = Series([1, 2, 3, 10, 20, 30], index=index)
+
+        grouped = s.groupby(level=0)
+        assert_almost_equal(grouped.grouper.labels[0], index.codes)
+
+        result = grouped.sum()
+        expected = Series([30, 3, 22, 11], index=Index(list('dcba'),
+                                                       name='foo'))
+        assert_series_equal(result, expected)
+
+        df = DataFrame({'A': s.values}, index=index)
+        result = df.groupby(level='foo').sum()
+        assert_frame_equal(result, expected.to_frame('A'))
+
     def test_level_preserve_order(self):
         grouped = self.mframe.groupby(level=0)
         exp_labels = np.array([0, 0, 0, 1, 1, 2, 2, 3, 3, 3])
@@ -2851,6 +2918,80 @@ class TestGroupBy(tm.TestCase):
         expected = self.df.groupby('A').agg(np.mean)
         assert_frame_equal(result, expected)
 
+    def test_groupby_quantile(self):
+        from pandas.core.algorithms import quantile
+
+        df = DataFrame({'key': ['a', 'b', 'a', np.nan, 'b', 'a', 'c', 'a'],
+                        'A': [1., 5., np.nan, 2., 4., 3., np.nan, 7.],
+                        'B': [3, 1, 4, 1, 5, 9, 2, 6]})
+        g = df.groupby('key')
+
+        for interpolation in ['fraction', 'lower', 'higher']:
+            for q in [0.5, 0.25, 1.]:
+                result = g.quantile(q, interpolation=interpolation)
+                expected = g.agg(lambda x: quantile(x.values, q,
+                                                    interpolation))
+                assert_frame_equal(result, expected)
+
+                result = g['A'].quantile(q, interpolation=interpolation)
+                expected = g['A'].agg(lambda x: quantile(x.values, q,
+                                                         interpolation))
+                assert_series_equal(result, expected)
+
+        # the same as the quantiles of each group
+        assert_series_equal(g['A'].quantile(0.3),
+                            g['A'].apply(lambda x: x.quantile(0.3)))
+        assert_frame_equal(g.quantile(0.3),
+                           g.apply(lambda x: x.quantile(0.3)))
+
+        # several quantiles
+        result = g['B'].quantile([0.75, 0.25])
+        expected = Series([6.75, 3.75, 4., 2., 2., 2.],
+                          index=MultiIndex.from_product([['a', 'b', 'c'],
+                                                         [0.75, 0.25]],
+                                                        names=['key', None]))
+        assert_series_equal(result, expected)
+
+        result = g.quantile([0.75, 0.25])
+        self.assert_numpy_array_equal(result.columns, ['A', 'B'])
+        expected.name = 'B'
+        assert_series_equal(result['B'], expected)
+
+        # cast back to integers when lossless, as for the median
+        result = g.quantile(0.5, interpolation='lower')
+        self.assertEqual(result['B'].dtype, np.int64)
+        assert_series_equal(g['B'].quantile(0.5), g['B'].median())
+
+        self.assertRaises(ValueError, g.quantile, 1.5)
+        self.assertRaises(ValueError, g.quantile, 0.5, interpolation='foo')
+
+    def test_groupby_rank(self):
+        df = DataFrame({'key': ['a', 'b', 'a', np.nan, 'b', 'a', 'c', 'a'],
+                        'A': [1., 5., np.nan, 2., 4., 1., np.nan, 7.],
+                        'B': [3, 1, 3, 1, 5, 9, 2, 3]})
+        g = df.groupby('key')
+
+        for method in ['average', 'min', 'max', 'first', 'dense']:
+            for na_option in ['keep', 'top', 'bottom']:
+                for ascending in [True, False]:
+                    for pct in [True, False]:
+                        kwargs = dict(method=method, na_option=na_option,
+                                      ascending=ascending, pct=pct)
+                        result = g.rank(**kwargs)
+                        expected = g.apply(lambda x: x.rank(**kwargs))
+                        assert_frame_equal(result, expected)
+
+                        for col in ['A', 'B']:
+                            result = g[col].rank(**kwargs)
+                            expected = g[col].apply(
+                                lambda x: x.rank(**kwargs))
+                            assert_series_equal(result, expected)
+
+        # non-numeric go through apply
+        result = df.groupby('B').key.rank()
+        expected = df.groupby('B').key.apply(lambda x: x.rank())
+        assert_series_equal(result, expected)
+
     def test_rank_apply(self):
         lev1 = np.array([rands(10) for _ in range(100)], dtype=object)
         lev2 = np.array([rands(10) for _ in range(130)], dtype=object)
@@ -3695,6 +3836,138 @@ class TestGroupBy(tm.TestCase):
         assert_series_equal(expected, g.cumcount())
         assert_series_equal(expected, sg.cumcount())
 
+    def test_cython_cumulative(self):
+        keys = np.array(['b', 'a', np.nan, 'a', 'b', 'a', 'b', np.nan, 'c'],
+                        dtype=object)
+        df = DataFrame({'key': keys,
+                        'floats': [1.5, np.nan, 2., -3., 4., 0.5, np.nan,
+                                   1., 2.],
+                        'ints': [3, 1, 4, 1, 5, 9, 2, 6, 5]},
+                       index=list('abcdefghi'))
+
+        for how in ['cumsum', 'cumprod', 'cummin', 'cummax']:
+            for frame in [df, df[df.key.notnull()]]:
+                g = frame.groupby('key')
+                expected = frame[['floats', 'ints']].groupby(
+                    frame.key).apply(lambda x: getattr(x, how)())
+                assert_frame_equal(getattr(g, how)(), expected)
+
+                for col in ['floats', 'ints']:
+                    expected = frame[col].groupby(frame.key).apply(
+                        lambda x: getattr(x, how)())
+                    result = getattr(g[col], how)()
+                    assert_series_equal(result, expected)
+
+        # int results stay int when every row is in a group
+        s = Series([1, 2, 3, 4], dtype='int32')
+        result = s.groupby([0, 1, 0, 1]).cumsum()
+        assert_series_equal(result, Series([1, 2, 4, 6], dtype='int64'))
+        result = s.groupby([0, 1, 0, 1]).cummax()
+        assert_series_equal(result, Series([1, 2, 3, 4], dtype='int32'))
+
+        s = Series([True, False, False, True])
+        result = s.groupby([0, 1, 0, 1]).cummax()
+        assert_series_equal(result, Series([True, False, True, True]))
+
+        # non-numeric falls back to apply
+        s = Series(['a', 'b', 'c'])
+        result = s.groupby([0, 0, 1]).cumsum()
+        assert_series_equal(result, Series(['a', 'ab', 'c'], dtype=object))
+
+    def test_groupby_shift_diff(self):
+        keys = ['b', 'a', np.nan, 'a', 'b', 'a', 'b', np.nan, 'c']
+        df = DataFrame({'key': keys,
+                        'floats': np.arange(9) ** 2.,
+                        'ints': np.arange(9),
+                        'strs': list('abcdefghi')},
+                       index=[0] * 9)
+        g = df.groupby('key')
+
+        for periods in [1, 2, -1, 0]:
+            result = g.shift(periods)
+            for col in ['floats', 'ints', 'strs']:
+                expected = Series(np.nan, index=df.index, name=col,
+                                  dtype=object)
+                for _, idx in compat.iteritems(g.indices):
+                    expected.iloc[idx] = df[col].iloc[idx].shift(
+                        periods).values
+                expected = expected.convert_objects()
+                assert_series_equal(result[col], expected)
+                assert_series_equal(g[col].shift(periods), expected)
+
+            result = g[['floats', 'ints']].diff(periods)
+            for col in ['floats', 'ints']:
+                expected = Series(np.nan, index=df.index, name=col)
+                for _, idx in compat.iteritems(g.indices):
+                    expected.iloc[idx] = df[col].iloc[idx].diff(
+                        periods).values
+                assert_series_equal(result[col], expected)
+                assert_series_equal(g[col].diff(periods), expected)
+
+    def test_series_groupby_nunique(self):
+        df = DataFrame({'A': ['a', 'b', 'a', 'b', np.nan, 'a', 'c', 'c'],
+                        'B': [1, 2, 1, 3, 4, 2, np.nan, np.nan],
+                        'C': ['x', 'y', 'x', np.nan, 'z', 'y', 'x', 'x'],
+                        'D': [1, 1, 2, 2, 3, 3, 3, 3]})
+
+        for keys in ['A', ['A', 'D']]:
+            for col in ['B', 'C']:
+                for dropna in [True, False]:
+                    g = df.groupby(keys)[col]
+                    result = g.nunique(dropna=dropna)
+                    expected = g.apply(lambda x: x.nunique(dropna=dropna))
+                    assert_series_equal(result, expected)
+
+        # unobserved levels
+        mi = MultiIndex(levels=[[0, 1, 2], [0, 1, 2]],
+                        labels=[[0, 0, 2], [0, 1, 2]])
+        g = Series([1, 1, 2], index=mi).groupby(level=0)
+        assert_series_equal(g.nunique(), g.apply(lambda x: x.nunique()))
+
+    def test_series_groupby_value_counts(self):
+        df = DataFrame({'A': ['a', 'b', 'a', 'b', np.nan, 'a', 'c', 'c'],
+                        'B': [1, 2, 1, 1, 4, 1, np.nan, np.nan],
+                        'C': ['x', 'y', 'x', 'y', 'z', 'y', 'x', np.nan],
+                        'D': [1, 1, 2, 2, 3, 3, 3, 3]})
+
+        for keys in ['A', ['A', 'D']]:
+            for col in ['B', 'C']:
+                for normalize in [True, False]:
+                    g = df.groupby(keys)[col]
+                    result = g.value_counts(normalize=normalize)
+                    expected = g.apply(
+                        lambda x: x.value_counts(normalize=normalize))
+                    assert_series_equal(result.sort_index(),
+                                        expected.sort_index())
+
+        # sorted by count within each group
+        s = Series(['x', 'y', 'y', 'x', 'x', 'z'])
+        result = s.groupby([1, 1, 1, 2, 2, 2]).value_counts()
+        expected = Series([2, 1, 2, 1],
+                          index=MultiIndex.from_tuples([(1, 'y'), (1, 'x'),
+                                                        (2, 'x'), (2, 'z')]))
+        assert_series_equal(result, expected)
+
+        result = s.groupby([1, 1, 1, 2, 2, 2]).value_counts(ascending=True)
+        self.assertEqual(list(result.values), [1, 2, 1, 2])
+
+    def test_series_groupby_unique(self):
+        df = DataFrame({'A': ['a', 'b', 'a', 'b', np.nan, 'a'],
+                        'B': [3., 2., np.nan, 2., 4., 1.],
+                        'C': ['x', 'y', 'z', 'y', 'z', 'x']})
+        for col in ['B', 'C']:
+            g = df.groupby('A')[col]
+            result = g.unique()
+            expected = g.apply(lambda x: x.unique())
+            self.assert_numpy_array_equal(result.index, expected.index)
+            self.assertEqual(result.name, expected.name)
+            for res, exp in zip(result, expected):
+                tm.assert_almost_equal(res, exp)
+
+        result = df.groupby('A')['B'].unique()
+        tm.assert_almost_equal(result['a'], [3., np.nan, 1.])
+        tm.assert_almost_equal(result['b'], [2.])
+
     def test_filter_series(self):
         import pandas as pd
         s = pd.Series([1, 3, 20, 5, 22, 24, 7])
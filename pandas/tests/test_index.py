@@ -13,12 +13,14 @@ from numpy.testing import assert_array_equal
 
 from pandas import period_range, date_range
 
-from pandas.core.index import (Index, Float64Index, Int64Index, MultiIndex,
-                               InvalidIndexError, NumericIndex)
+from pandas.core.index import (Index, Float64Index, Int64Index, RangeIndex,
+                               CategoricalIndex, MultiIndex, InvalidIndexError,
+                               NumericIndex)
 from pandas.tseries.index import DatetimeIndex
 from pandas.tseries.tdi import TimedeltaIndex
 from pandas.tseries.period import PeriodIndex
 from pandas.core.series import Series
+from pandas.core.categorical import Categorical
 from pandas.util.testing import (assert_almost_equal, assertRaisesRegexp,
                                  assert_copy)
 from pandas import compat
@@ -26,12 +28,15 @@ from pandas.compat import long
 
 import pandas.util.testing as tm
 import pandas.core.config as cf
+import pandas.core.common as com
 
 from pandas.tseries.index import _to_m8
 import pandas.tseries.offsets as offsets
 
 import pandas as pd
 from pandas.lib import Timestamp
+import pandas.index as _index
+import pandas.hashtable as _hash
 
 
 class Base(object):
@@ -710,6 +715,47 @@ class TestIndex(Base, tm.TestCase):
         with tm.assertRaises(TypeError):
             idx1 - 1
 
+    def test_setops_monotonic(self):
+        # merged in one pass, check against the results of sets
+        indexes = [(Index(np.arange(0, 20, 2)), Index(np.arange(5, 15))),
+                   (Float64Index(np.arange(0, 10, 0.5)),
+                    Float64Index(np.arange(3, 12, 1.))),
+                   (Index(list('acegikmo')), Index(list('abcdef'))),
+                   (date_range('20130101', periods=10, tz='US/Eastern'),
+                    date_range('20130105', periods=10, tz='US/Eastern')),
+                   (period_range('2000-01', periods=10, freq='M'),
+                    period_range('2000-06', periods=10, freq='M'))]
+
+        for first, second in indexes:
+            self.assertTrue(first._can_merge_setop(second))
+            expected = sorted(set(first) | set(second))
+            self.assert_numpy_array_equal(list(first.union(second)), expected)
+            expected = sorted(set(first) & set(second))
+            self.assert_numpy_array_equal(list(first.intersection(second)),
+                                          expected)
+            expected = sorted(set(first) - set(second))
+            result = first.difference(second)
+            self.assertIsInstance(result, type(first))
+            self.assert_numpy_array_equal(list(result), expected)
+            expected = sorted(set(first) ^ set(second))
+            result = first.sym_diff(second)
+            self.assertIsInstance(result, type(first))
+            self.assert_numpy_array_equal(list(result), expected)
+
+        # preserves the timezone
+        first, second = indexes[3]
+        self.assertEqual(first.difference(second).tz, first.tz)
+        self.assertEqual(first.sym_diff(second).tz, first.tz)
+
+        # not comparable as sorted values
+        idx = date_range('20130101', periods=10)
+        self.assertFalse(idx._can_merge_setop(idx.tz_localize('UTC')))
+        idx = period_range('2000-01', periods=10, freq='M')
+        self.assertFalse(idx._can_merge_setop(
+            period_range('2000-01', periods=10, freq='D')))
+        idx = Float64Index([1., 2., np.nan])
+        self.assertFalse(idx._can_merge_setop(Float64Index([1., 2.])))
+
     def test_pickle(self):
 
         self.verify_pickle(self.strIndex)
@@ -891,6 +937,151 @@ class TestIndex(Base, tm.TestCase):
         index = Index([5, datetime.now(), 7])
         self.assertFalse(index.is_monotonic)
 
+    def test_monotonic_lookups_no_hashtable(self):
+        # lookups in monotonic indexes are binary searches
+        indexes = [Index(lrange(5), dtype=object),
+                   Int64Index([1, 3, 5, 7, 9]),
+                   Float64Index([0.5, 1.5, 2.5]),
+                   date_range('20130101', periods=5)]
+        for index in indexes:
+            self.assertTrue(index.is_unique)
+            self.assertEqual(index.get_loc(index[1]), 1)
+            self.assertIn(index[-1], index)
+            target = index[[4, 0, 2]] if len(index) > 4 else index[[2, 0]]
+            assert_almost_equal(index.get_indexer(target),
+                                [index.get_loc(x) for x in target])
+            self.assertIsNone(index._engine.mapping)
+
+        index = Int64Index([1, 3, 5, 7, 9])
+        assert_almost_equal(index.get_indexer(Int64Index([0, 3, 4, 9, 10])),
+                            [-1, 1, -1, 4, -1])
+        self.assertRaises(KeyError, index.get_loc, 4)
+        self.assertRaises(KeyError, index.get_loc, 3.0)
+        self.assertNotIn(10, index)
+        self.assertNotIn('a', index)
+
+        index = Index(list('abcd'))
+        self.assertEqual(index.get_loc('b'), 1)
+        self.assertRaises(KeyError, index.get_loc, 'e')
+        self.assertRaises(KeyError, index.get_loc, 1)
+        self.assertNotIn(1, index)
+        self.assertIsNone(index._engine.mapping)
+
+        # monotonic with duplicates
+        index = Int64Index([1, 2, 2, 3])
+        self.assertFalse(index.is_unique)
+        self.assertEqual(index.get_loc(2), slice(1, 3))
+        self.assertIsNone(index._engine.mapping)
+
+        # NaNs are not ordered
+        index = Float64Index([1.0, np.nan, 2.0])
+        self.assertEqual(index.get_loc(2.0), 2)
+        self.assertIsNotNone(index._engine.mapping)
+
+        index = Int64Index([3, 1, 2])
+        self.assertEqual(index.get_loc(1), 1)
+        self.assertIsNotNone(index._engine.mapping)
+
+        # duplicated NaNs compare unequal but are not unique
+        index = Index(['a', 'b', np.nan, np.nan])
+        self.assertFalse(index.is_unique)
+        index = Float64Index([1.0, np.nan, np.nan])
+        self.assertFalse(index.is_unique)
+
+        # tuples are not keys of numeric indexes
+        for index in [Int64Index([1, 2, 3]), Float64Index([1., 2., 3.]),
+                      date_range('20130101', periods=3)]:
+            self.assertNotIn((1, 2), index)
+            self.assertNotIn((1,), index)
+            self.assertRaises(KeyError, index._engine.get_loc, (1, 2))
+
+    def test_string_engine(self):
+        index = Index(['b', 'a', 'c'])
+        self.assertIsInstance(index._engine, _index.StringEngine)
+        self.assertEqual(index.get_loc('a'), 1)
+        self.assertRaises(KeyError, index.get_loc, 'd')
+        self.assertRaises(KeyError, index.get_loc, 1)
+        self.assertIn('c', index)
+        self.assertNotIn('d', index)
+        self.assertNotIn(1, index)
+        self.assertIsInstance(index._engine.mapping, _hash.StringHashTable)
+
+        assert_almost_equal(index.get_indexer(Index(['c', 'x', 'b'])),
+                            [2, -1, 0])
+        assert_almost_equal(index.get_indexer(Index(['c', 1, np.nan])),
+                            [2, -1, -1])
+        result = Series([1, 2, 3], index=index).reindex(['c', 'd', 'a'])
+        assert_almost_equal(result.values, [3, np.nan, 2])
+
+        # sorted values, the targets are looked up in the table
+        index = Index(list('abcd'))
+        assert_almost_equal(index.get_indexer(Index(['d', 'x', 'a'])),
+                            [3, -1, 0])
+        self.assertIsInstance(index._engine.mapping, _hash.StringHashTable)
+
+        # NUL characters can't be keys
+        index = Index(['a\x00b', 'a\x00c', 'a'])
+        self.assertIsInstance(index._engine, _index.StringEngine)
+        self.assertEqual(index.get_loc('a\x00c'), 1)
+        self.assertRaises(KeyError, index.get_loc, 'a\x00')
+        self.assertIsInstance(index._engine.mapping, _hash.PyObjectHashTable)
+
+        index = Index(['a', 1])
+        self.assertNotIsInstance(index._engine, _index.StringEngine)
+
+    def test_shared_engine(self):
+        index = Index(list('cab'), name='a')
+        self.assertEqual(index.get_loc('a'), 1)
+        self.assertIsNotNone(index._engine.mapping)
+
+        # same values
+        for other in [index.copy(), index.rename('b'), index.view(),
+                      index[:], pd.DataFrame(index=index).copy().index]:
+            self.assertIs(other._engine, index._engine)
+
+        # new values
+        self.assertIsNot(index.copy(deep=True)._engine, index._engine)
+        self.assertIsNot(index[1:]._engine, index._engine)
+
+        # the engine is shared whichever index builds it first
+        index = Index(list('cab'))
+        other = index.rename('b')
+        self.assertEqual(other.get_loc('b'), 2)
+        self.assertIs(index._engine, other._engine)
+
+        # an index built on the same array does not share it, as the array
+        # may have been modified since
+        arr = np.arange(5)
+        index = Index(arr)
+        self.assertEqual(index.get_loc(0), 0)
+        arr[0] = 100
+        other = Index(arr)
+        self.assertIsNot(other._engine, index._engine)
+        self.assertEqual(other.get_loc(100), 0)
+        self.assertRaises(KeyError, other.get_loc, 0)
+        self.assertFalse(other.is_monotonic)
+
+    def test_hashtable_limit(self):
+        a = Int64Index(np.arange(1000)[::-1])
+        b = Int64Index(np.arange(2000)[::-1])
+
+        with pd.option_context('compute.hashtable_limit', 0):
+            # the most recently used table is kept
+            self.assertEqual(a.get_loc(0), 999)
+            self.assertIsNotNone(a._engine.mapping)
+
+            self.assertEqual(b.get_loc(0), 1999)
+            self.assertIsNone(a._engine.mapping)
+            self.assertIsNotNone(b._engine.mapping)
+
+            # and rebuilt when needed
+            self.assertEqual(a.get_loc(1), 998)
+            self.assertIsNotNone(a._engine.mapping)
+            self.assertIsNone(b._engine.mapping)
+
+        self.assertTrue(_index.get_hashtable_nbytes() >=
+                        a._engine.sizeof())
+
     def test_get_set_value(self):
         values = np.random.randn(100)
         date = self.dateIndex[67]
@@ -1634,6 +1825,184 @@ class TestInt64Index(Numeric, tm.TestCase):
         idx = Int64Index([1, 2], name='asdf')
         self.assertEqual(idx.name, idx[1:].name)
 
+
+class TestRangeIndex(tm.TestCase):
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        self.index = RangeIndex(0, 20, 2, name='foo')
+
+    def test_constructor(self):
+        index = RangeIndex(5)
+        self.assert_numpy_array_equal(index, np.arange(5))
+        self.assertEqual(index.dtype, np.int64)
+
+        index = RangeIndex(1, 10, 3)
+        self.assert_numpy_array_equal(index, np.arange(1, 10, 3))
+        self.assertEqual(len(index), 3)
+
+        index = RangeIndex(10, 0, -3)
+        self.assert_numpy_array_equal(index, np.arange(10, 0, -3))
+        self.assertEqual(len(index), 4)
+
+        for index in [RangeIndex(), RangeIndex(5, 0), RangeIndex(0, 5, -1)]:
+            self.assertEqual(len(index), 0)
+            self.assert_numpy_array_equal(index, np.array([], dtype='int64'))
+
+        index = RangeIndex(self.index)
+        self.assertTrue(index.equals(self.index))
+        self.assertEqual(index.name, 'foo')
+
+        self.assertRaises(TypeError, RangeIndex, 0, 1.5)
+        self.assertRaises(TypeError, RangeIndex, 'a', 'b')
+        self.assertRaises(ValueError, RangeIndex, 0, 10, 0)
+
+        # values which are not a range
+        index = RangeIndex([1, 5, 2])
+        tm.assert_isinstance(index, Int64Index)
+        self.assertNotIsInstance(index, RangeIndex)
+
+    def test_lazy_values(self):
+        index = RangeIndex(10 ** 9)
+        self.assertEqual(len(index), 10 ** 9)
+        self.assertEqual(index.memory_usage(), 0)
+        self.assertEqual(index[-1], 10 ** 9 - 1)
+        self.assertEqual(index.get_loc(12345), 12345)
+        self.assertTrue(index.is_unique)
+        self.assertTrue(index.is_monotonic)
+        self.assertNotIn('_data', getattr(index, '_cache', {}))
+
+    def test_get_loc(self):
+        index = self.index
+        self.assertEqual(index.get_loc(0), 0)
+        self.assertEqual(index.get_loc(18), 9)
+        self.assertRaises(KeyError, index.get_loc, 3)
+        self.assertRaises(KeyError, index.get_loc, 20)
+        self.assertRaises(KeyError, index.get_loc, -2)
+        self.assertIn(4, index)
+        self.assertNotIn(5, index)
+        self.assertNotIn(20, index)
+
+        index = RangeIndex(10, 0, -3)
+        self.assertEqual(index.get_loc(4), 2)
+        self.assertRaises(KeyError, index.get_loc, 0)
+        self.assertFalse(index.is_monotonic)
+
+    def test_get_indexer(self):
+        target = np.array([-2, 0, 3, 4, 18, 20])
+        result = self.index.get_indexer(target)
+        self.assert_numpy_array_equal(result, np.array([-1, 0, -1, 2, 9, -1]))
+
+        expected = Int64Index(self.index.values).get_indexer(target,
+                                                             method='pad')
+        result = self.index.get_indexer(target, method='pad')
+        self.assert_numpy_array_equal(result, expected)
+
+    def test_getitem(self):
+        index = self.index
+        self.assertEqual(index[1], 2)
+        self.assertEqual(index[-1], 18)
+        self.assertRaises(IndexError, index.__getitem__, 10)
+
+        for key in [slice(2, 8), slice(None, None, 3), slice(None, None, -1),
+                    slice(8, 2, -2), slice(5, 5)]:
+            result = index[key]
+            tm.assert_isinstance(result, RangeIndex)
+            self.assert_numpy_array_equal(result, index.values[key])
+            self.assertEqual(result.name, 'foo')
+
+        result = index[[1, 3, 5]]
+        self.assert_numpy_array_equal(result, np.array([2, 6, 10]))
+
+    def test_take(self):
+        result = self.index.take([1, -1, 0])
+        self.assert_numpy_array_equal(result, np.array([2, 18, 0]))
+        self.assertEqual(result.name, 'foo')
+        self.assertRaises(IndexError, self.index.take, [10])
+
+    def test_equals(self):
+        self.assertTrue(self.index.equals(RangeIndex(0, 19, 2)))
+        self.assertTrue(self.index.equals(Int64Index(np.arange(0, 20, 2))))
+        self.assertTrue(RangeIndex(0).equals(RangeIndex(5, 0)))
+        self.assertFalse(self.index.equals(RangeIndex(0, 20)))
+
+    def test_copy(self):
+        for deep in [False, True]:
+            result = self.index.copy(deep=deep)
+            tm.assert_isinstance(result, RangeIndex)
+            self.assertTrue(result.equals(self.index))
+            self.assertEqual(result.name, 'foo')
+            self.assertEqual(self.index.copy(name='bar', deep=deep).name,
+                             'bar')
+
+        index = RangeIndex(5, name=['a'])
+        self.assertIsNot(index.copy(deep=True).name, index.name)
+        self.assertIs(index.copy().name, index.name)
+        self.assertEqual(index.copy(names=['b']).name, 'b')
+
+    def test_contains(self):
+        index = RangeIndex(0, 10, 2)
+        self.assertIn(4, index)
+        self.assertIn(4.0, index)
+        self.assertNotIn(3, index)
+        self.assertNotIn(4.5, index)
+        self.assertNotIn(np.nan, index)
+        self.assertNotIn(np.inf, index)
+        self.assertNotIn('a', index)
+
+    def test_union(self):
+        result = RangeIndex(0, 10).union(RangeIndex(5, 15))
+        tm.assert_isinstance(result, RangeIndex)
+        self.assertTrue(result.equals(RangeIndex(0, 15)))
+
+        result = RangeIndex(10, 20, 2).union(RangeIndex(0, 10, 2))
+        tm.assert_isinstance(result, RangeIndex)
+        self.assertTrue(result.equals(RangeIndex(0, 20, 2)))
+
+        # not a range
+        result = RangeIndex(0, 5).union(RangeIndex(10, 15))
+        self.assert_numpy_array_equal(result, np.r_[0:5, 10:15])
+
+        result = self.index.union(RangeIndex(0, 20, 3))
+        expected = Int64Index(self.index.values).union(
+            Int64Index(np.arange(0, 20, 3)))
+        self.assertTrue(result.equals(expected))
+
+    def test_append(self):
+        result = RangeIndex(0, 5).append([RangeIndex(5, 10), RangeIndex(0)])
+        tm.assert_isinstance(result, RangeIndex)
+        self.assertTrue(result.equals(RangeIndex(0, 10)))
+
+        result = RangeIndex(0, 1).append(RangeIndex(2, 6, 2))
+        tm.assert_isinstance(result, RangeIndex)
+        self.assertTrue(result.equals(RangeIndex(0, 6, 2)))
+
+        result = RangeIndex(0, 5).append(RangeIndex(0, 5))
+        self.assert_numpy_array_equal(result, np.r_[0:5, 0:5])
+
+        result = RangeIndex(0, 5).append(Index(['a']))
+        self.assertEqual(list(result), [0, 1, 2, 3, 4, 'a'])
+
+    def test_pickle(self):
+        result = self.round_trip_pickle(self.index)
+        tm.assert_isinstance(result, RangeIndex)
+        self.assertTrue(result.equals(self.index))
+        self.assertEqual(result.name, 'foo')
+
+    def test_default_index(self):
+        df = pd.DataFrame({'A': [1, 2, 3]})
+        tm.assert_isinstance(df.index, RangeIndex)
+        tm.assert_isinstance(Series([1, 2, 3]).index, RangeIndex)
+
+        df = pd.DataFrame({'A': [1, 2, 3]}, index=list('abc'))
+        tm.assert_isinstance(df.reset_index().index, RangeIndex)
+        tm.assert_isinstance(df['A'].reset_index(drop=True).index,
+                             RangeIndex)
+
+        result = pd.concat([df, df], ignore_index=True)
+        tm.assert_isinstance(result.index, RangeIndex)
+        self.assertEqual(len(result.index), 6)
+
 class TestDatetimeIndex(Base, tm.TestCase):
     _holder = DatetimeIndex
     _multiprocess_can_split_ = True
@@ -1716,6 +2085,171 @@ class TestTimedeltaIndex(Base, tm.TestCase):
     def test_pickle_compat_construction(self):
         pass
 
+class TestCategoricalIndex(Base, tm.TestCase):
+    _holder = CategoricalIndex
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        self.index = CategoricalIndex(list('aabbca'), categories=list('cab'),
+                                      name='foo')
+
+    def create_index(self):
+        return CategoricalIndex(list('aabbca'))
+
+    def test_construction(self):
+        idx = self.index
+        self.assert_numpy_array_equal(idx.codes, [1, 1, 2, 2, 0, 1])
+        self.assert_numpy_array_equal(idx.categories, ['c', 'a', 'b'])
+        self.assert_numpy_array_equal(idx.values, list('aabbca'))
+        self.assertTrue(com.is_categorical_dtype(idx))
+        self.assertEqual(idx.name, 'foo')
+
+        # dispatch from Index
+        cat = pd.Categorical(list('aabbca'), categories=list('cab'))
+        for result in [Index(cat), Index(list('aabbca'), dtype='category'),
+                       Index(Series(cat))]:
+            self.assertIsInstance(result, CategoricalIndex)
+            self.assert_numpy_array_equal(result.values, idx.values)
+
+        result = CategoricalIndex(idx)
+        self.assertTrue(result.equals(idx))
+        self.assertEqual(result.name, 'foo')
+
+        result = CategoricalIndex(idx, categories=list('abcd'))
+        self.assert_numpy_array_equal(result.codes, [0, 0, 1, 1, 2, 0])
+
+    def test_get_loc(self):
+        # unique
+        idx = CategoricalIndex(list('bac'), categories=list('abc'))
+        self.assertEqual(idx.get_loc('a'), 1)
+        self.assertRaises(KeyError, idx.get_loc, 'd')
+
+        # monotonic
+        idx = CategoricalIndex(list('aabbc'))
+        self.assertEqual(idx.get_loc('b'), slice(2, 4))
+
+        # non-monotonic
+        result = self.index.get_loc('a')
+        self.assert_numpy_array_equal(result, [True, True, False, False,
+                                               False, True])
+        self.assertRaises(KeyError, self.index.get_loc, 'd')
+
+        # null labels
+        idx = CategoricalIndex(['a', np.nan, 'b'])
+        self.assertEqual(idx.get_loc(np.nan), 1)
+
+    def test_contains(self):
+        self.assertIn('a', self.index)
+        self.assertNotIn('d', self.index)
+        self.assertNotIn(np.nan, self.index)
+
+        # unused category
+        idx = CategoricalIndex(list('ab'), categories=list('abc'))
+        self.assertNotIn('c', idx)
+
+    def test_series_indexing(self):
+        s = Series(np.arange(6), index=self.index)
+        tm.assert_series_equal(s['a'], Series([0, 1, 5], index=list('aaa')))
+        tm.assert_series_equal(s.loc['b'], Series([2, 3], index=list('bb')))
+        self.assertEqual(s['c'], 4)
+        self.assertEqual(s[2], 2)
+
+    def test_get_indexer(self):
+        idx = CategoricalIndex(list('bac'), categories=list('abc'))
+
+        target = Index(['a', 'c', 'd', np.nan])
+        self.assert_numpy_array_equal(idx.get_indexer(target),
+                                      [1, 2, -1, -1])
+
+        target = CategoricalIndex(['a', 'c', 'd'], categories=list('dca'))
+        self.assert_numpy_array_equal(idx.get_indexer(target), [1, 2, -1])
+
+        # a categorical target of another index is looked up by its labels
+        self.assert_numpy_array_equal(Index(list('abc')).get_indexer(target),
+                                      [0, 2, -1])
+        self.assert_numpy_array_equal(
+            Int64Index([1, 2, 3]).get_indexer(Categorical([3, 1, 5])),
+            [2, 0, -1])
+
+        self.assertRaises(InvalidIndexError, self.index.get_indexer,
+                          Index(['a']))
+
+        indexer, missing = self.index.get_indexer_non_unique(
+            Index(['b', 'd']))
+        self.assert_numpy_array_equal(indexer, [2, 3, -1])
+        self.assert_numpy_array_equal(missing, [1])
+
+    def test_reindex(self):
+        s = Series([1, 2, 3], index=CategoricalIndex(list('bac')))
+        result = s.reindex(['a', 'c', 'd'])
+        expected = Series([2, 3, np.nan], index=['a', 'c', 'd'])
+        tm.assert_series_equal(result, expected)
+
+    def test_take_delete_insert(self):
+        idx = self.index
+        result = idx.take([0, 2, 4])
+        self.assertIsInstance(result, CategoricalIndex)
+        self.assert_numpy_array_equal(result.values, ['a', 'b', 'c'])
+        self.assertTrue(result.categories.equals(idx.categories))
+
+        result = idx.delete(0)
+        self.assert_numpy_array_equal(result.values, list('abbca'))
+
+        result = idx.insert(1, 'c')
+        self.assert_numpy_array_equal(result.values, list('acabbca'))
+        self.assertTrue(result.categories.equals(idx.categories))
+        self.assertRaises(TypeError, idx.insert, 1, 'd')
+
+        result = idx[1:3].append(idx[4:])
+        self.assertIsInstance(result, CategoricalIndex)
+        self.assert_numpy_array_equal(result.values, list('abca'))
+
+    def test_equals(self):
+        idx = self.index
+        self.assertTrue(idx.equals(idx.copy()))
+        self.assertTrue(idx.equals(CategoricalIndex(list('aabbca'))))
+        self.assertTrue(idx.equals(Index(list('aabbca'))))
+        self.assertTrue(Index(list('aabbca')).equals(idx))
+        self.assertFalse(idx.equals(CategoricalIndex(list('aabbcb'))))
+        self.assertFalse(idx.equals(list('aabbca')))
+
+    def test_comparison(self):
+        self.assert_numpy_array_equal(self.index == 'a',
+                                      [True, True, False, False, False, True])
+        self.assert_numpy_array_equal(self.index != 'd', [True] * 6)
+        self.assert_numpy_array_equal(self.index == Index(list('abbbca')),
+                                      [True, False, True, True, True, True])
+
+    def test_isin(self):
+        idx = CategoricalIndex(['a', 'b', np.nan, 'c'])
+        self.assert_numpy_array_equal(idx.isin(['a', 'c']),
+                                      [True, False, False, True])
+        self.assert_numpy_array_equal(idx.isin([np.nan]),
+                                      [False, False, True, False])
+
+    def test_is_monotonic(self):
+        self.assertTrue(CategoricalIndex(list('aabc')).is_monotonic)
+        self.assertFalse(self.index.is_monotonic)
+        self.assertFalse(CategoricalIndex(list('aabc'),
+                                          categories=list('cba')).is_monotonic)
+
+    def test_memory_usage(self):
+        values = np.array(['label_%d' % i for i in range(10)],
+                          dtype=object).repeat(100)
+        idx = CategoricalIndex(values)
+        self.assertLess(idx.memory_usage(deep=True),
+                        Index(values).memory_usage(deep=True))
+
+    def test_pickle(self):
+        self.verify_pickle(self.index)
+        result = self.round_trip_pickle(self.index)
+        self.assertIsInstance(result, CategoricalIndex)
+        self.assertTrue(result.categories.equals(self.index.categories))
+
+    def test_repr_roundtrip(self):
+        tm.assert_index_equal(eval(repr(self.index)), self.index)
+
+
 class TestMultiIndex(Base, tm.TestCase):
     _holder = MultiIndex
     _multiprocess_can_split_ = True
@@ -2641,6 +3175,41 @@ class TestMultiIndex(Base, tm.TestCase):
                            " uniquely valued Index objects",
                            idx1.get_indexer, idx2)
 
+    def test_packed_engine(self):
+        # lookups do not build the tuples of the values
+        index = MultiIndex(levels=[['b', 'a'], [1, 2, 3]],
+                           labels=[[0, 0, 1, 1, -1], [0, 2, 1, -1, 0]])
+        self.assertIsInstance(index._engine, _index.MultiIndexEngine)
+
+        self.assertEqual(index.get_loc(('b', 3)), 1)
+        self.assertEqual(index.get_loc(('a', np.nan)), 3)
+        self.assertEqual(index.get_loc((np.nan, 1)), 4)
+        self.assertRaises(KeyError, index.get_loc, ('a', 3))
+        self.assertRaises(KeyError, index.get_loc, ('c', 1))
+        self.assertTrue(('a', 2) in index._engine)
+        self.assertFalse(('a', 3) in index._engine)
+        self.assertFalse('a' in index._engine)
+
+        target = MultiIndex.from_arrays([['a', 'b', 'c', 'a'], [2, 3, 1, 1]])
+        assert_almost_equal(index.get_indexer(target), [2, 1, -1, -1])
+        self.assertIsNone(index._tuples)
+        self.assertIsNone(target._tuples)
+
+        # the levels are not sorted
+        self.assertFalse(index.is_monotonic)
+        self.assertTrue(index.is_unique)
+
+        s = Series(np.arange(5), index=index)
+        self.assertEqual(s[('a', 2)], 2)
+        self.assertEqual(s.loc[('b', 3)], 1)
+
+        # too many bits to pack the labels
+        n = 2 ** 16
+        index = MultiIndex(levels=[lrange(n)] * 4,
+                           labels=[[0, n - 1]] * 4)
+        self.assertIsInstance(index._engine, _index.ObjectEngine)
+        self.assertEqual(index.get_loc((n - 1,) * 4), 1)
+
     def test_format(self):
         self.index.format()
         self.index[:0].format()
@@ -2856,6 +3425,37 @@ class TestMultiIndex(Base, tm.TestCase):
         # result = self.index & tuples
         # self.assertTrue(result.equals(tuples))
 
+    def test_setops_packed_labels(self):
+        # sorted levels and values: merged through the packed labels
+        index = MultiIndex.from_product([['a', 'b', 'c'], np.arange(5)],
+                                        names=['first', 'second'])
+        first = index[:10]
+        second = index[5:][::2]
+        self.assertTrue(first._can_merge_labels(second))
+        self.assertFalse(first._can_merge_labels(second[::-1]))
+        self.assertFalse(self.index._can_merge_labels(self.index[:3]))
+
+        for f, s in [(first, second), (second, first)]:
+            tm.assert_index_equal(
+                f.union(s), MultiIndex.from_tuples(
+                    sorted(set(f.values) | set(s.values)), names=f.names))
+            tm.assert_index_equal(
+                f.intersection(s), MultiIndex.from_tuples(
+                    sorted(set(f.values) & set(s.values)), names=f.names))
+            tm.assert_index_equal(
+                f.difference(s), MultiIndex.from_tuples(
+                    sorted(set(f.values) - set(s.values)), names=f.names))
+
+        # the labels unpacked from the keys
+        engine = index._engine
+        keys = engine.pack_labels(index.labels)
+        for lab, unpacked in zip(index.labels, engine.unpack_labels(keys)):
+            self.assert_numpy_array_equal(lab, unpacked)
+
+        # empty results
+        self.assertEqual(len(first[:5].intersection(first[5:])), 0)
+        self.assertEqual(len(first[:5].difference(first)), 0)
+
     def test_difference(self):
 
         first = self.index
@@ -349,6 +349,48 @@ class TestIndexing(tm.TestCase):
             result = r()
             self.assertEqual(result, expected)
 
+    def test_loc_scalar_fast_path(self):
+        df = DataFrame({'A': [1., 2., 3.], 'B': [1, 2, 3],
+                        'C': date_range('20140101', periods=3),
+                        'D': list('abc')}, index=list('xyz'))
+
+        for col in df.columns:
+            for i, row in enumerate(df.index):
+                self.assertEqual(df.loc[row, col], df[col].iloc[i])
+        self.assertIsInstance(df.loc['y', 'C'], Timestamp)
+
+        # missing labels still raise
+        self.assertRaises(KeyError, lambda: df.loc['w', 'A'])
+        self.assertRaises(KeyError, lambda: df.loc['x', 'E'])
+        self.assertRaises(KeyError, lambda: df.loc[0, 'A'])
+
+        # written in-place, seen by the cached columns
+        col = df['A']
+        df.loc['y', 'A'] = 10.
+        self.assertEqual(col['y'], 10.)
+        self.assertEqual(df.loc['y', 'A'], 10.)
+        df.loc['z', 'D'] = 'q'
+        self.assertEqual(df['D']['z'], 'q')
+
+        # values the block cannot hold go through the general path
+        df.loc['x', 'B'] = 1.5
+        self.assertEqual(df['B'].dtype, np.float64)
+        self.assertEqual(df.loc['x', 'B'], 1.5)
+
+        # as do new labels
+        df.loc['w', 'A'] = 5.
+        self.assertEqual(df.loc['w', 'A'], 5.)
+        self.assertTrue(isnull(df.loc['w', 'B']))
+
+        # duplicated labels and partial dates are not scalar keys
+        df = DataFrame([[1, 2], [3, 4]], index=['a', 'a'], columns=['A', 'B'])
+        assert_series_equal(df.loc['a', 'A'], df['A'])
+
+        dates = date_range('20140101', periods=48, freq='H')
+        df = DataFrame({'A': np.arange(48)}, index=dates)
+        self.assertEqual(len(df.loc['2014-01-02', 'A']), 24)
+        self.assertEqual(df.loc[dates[30], 'A'], 30)
+
     def test_iat_invalid_args(self):
         pass
 
@@ -3508,6 +3550,25 @@ class TestIndexing(tm.TestCase):
             with tm.assert_produces_warning(expected_warning=com.SettingWithCopyWarning):
                 df.loc[0]['A'] = 111
 
+    def test_detect_chained_assignment_parent_released(self):
+
+        # the copy is not flagged once the frame it was taken from is not
+        # referenced anymore (using an indexer must not keep it alive)
+        with option_context('chained_assignment','raise'):
+            df = DataFrame({'A': np.arange(5), 'B': list('abcde')})
+            df.loc[0, 'A'] = 10
+            df = df.loc[df.A > 1]
+            self.assertIsNotNone(df.is_copy)
+            self.assertIsNone(df.is_copy())
+            df['C'] = 1
+            self.assertIsNone(df.is_copy)
+
+            df = DataFrame({'A': np.arange(5), 'B': list('abcde')})
+            sub = df.loc[df.A > 1]
+            def f():
+                sub['C'] = 1
+            self.assertRaises(com.SettingWithCopyError, f)
+
     def test_float64index_slicing_bug(self):
         # GH 5557, related to slicing a float index
         ser = {256: 2321.0, 1: 78.0, 2: 2716.0, 3: 0.0, 4: 369.0, 5: 0.0, 6: 269.0, 7: 0.0, 8: 0.0, 9: 0.0, 10: 3536.0, 11: 0.0, 12: 24.0, 13: 0.0, 14: 931.0, 15: 0.0, 16: 101.0, 17: 78.0, 18: 9643.0, 19: 0.0, 20: 0.0, 21: 0.0, 22: 63761.0, 23: 0.0, 24: 446.0, 25: 0.0, 26: 34773.0, 27: 0.0, 28: 729.0, 29: 78.0, 30: 0.0, 31: 0.0, 32: 3374.0, 33: 0.0, 34: 1391.0, 35: 0.0, 36: 361.0, 37: 0.0, 38: 61808.0, 39: 0.0, 40: 0.0, 41: 0.0, 42: 6677.0, 43: 0.0, 44: 802.0, 45: 0.0, 46: 2691.0, 47: 0.0, 48: 3582.0, 49: 0.0, 50: 734.0, 51: 0.0, 52: 627.0, 53: 70.0, 54: 2584.0, 55: 0.0, 56: 324.0, 57: 0.0, 58: 605.0, 59: 0.0, 60: 0.0, 61: 0.0, 62: 3989.0, 63: 10.0, 64: 42.0, 65: 0.0, 66: 904.0, 67: 0.0, 68: 88.0, 69: 70.0, 70: 8172.0, 71: 0.0, 72: 0.0, 73: 0.0, 74: 64902.0, 75: 0.0, 76: 347.0, 77: 0.0, 78: 36605.0, 79: 0.0, 80: 379.0, 81: 70.0, 82: 0.0, 83: 0.0, 84: 3001.0, 85: 0.0, 86: 1630.0, 87: 7.0, 88: 364.0, 89: 0.0, 90: 67404.0, 91: 9.0, 92: 0.0, 93: 0.0, 94: 7685.0, 95: 0.0, 96: 1017.0, 97: 0.0, 98: 2831.0, 99: 0.0, 100: 2963.0, 101: 0.0, 102: 854.0, 103: 0.0, 104: 0.0, 105: 0.0, 106: 0.0, 107: 0.0, 108: 0.0, 109: 0.0, 110: 0.0, 111: 0.0, 112: 0.0, 113: 0.0, 114: 0.0, 115: 0.0, 116: 0.0, 117: 0.0, 118: 0.0, 119: 0.0, 120: 0.0, 121: 0.0, 122: 0.0, 123: 0.0, 124: 0.0, 125: 0.0, 126: 67744.0, 127: 22.0, 128: 264.0, 129: 0.0, 260: 197.0, 268: 0.0, 265: 0.0, 269: 0.0, 261: 0.0, 266: 1198.0, 267: 0.0, 262: 2629.0, 258: 775.0, 257: 0.0, 263: 0.0, 259: 0.0, 264: 163.0, 250: 10326.0, 251: 0.0, 252: 1228.0, 253: 0.0, 254: 2769.0, 255: 0.0}
@@ -249,6 +249,34 @@ class TestBlock(tm.TestCase):
         newb = self.fblock.copy()
         self.assertRaises(Exception, newb.delete, 3)
 
+    def test_append_items(self):
+        block = self.fblock.copy()
+        values = block.values.copy()
+        newb = block.append_items(create_block('float', [5]))
+        assert_almost_equal(newb.mgr_locs, [0, 2, 4, 5])
+        self.assertEqual(len(newb), 4)
+        assert_almost_equal(newb.values[:3], values)
+
+        # the block appended to is left untouched
+        assert_almost_equal(block.mgr_locs, [0, 2, 4])
+        assert_almost_equal(block.values, values)
+
+        # the following items are stored in the spare capacity
+        buf = newb.values.base
+        newb2 = newb.append_items(create_block('float', [6]))
+        self.assertIs(newb2.values.base, buf)
+        assert_almost_equal(newb2.mgr_locs, [0, 2, 4, 5, 6])
+        self.assertEqual(len(newb), 4)
+
+        # which is not used again to append to an older block
+        newb3 = newb.append_items(create_block('float', [7], num_offset=10))
+        self.assertIsNot(newb3.values.base, buf)
+        assert_almost_equal(newb2.values[4],
+                            create_block('float', [6]).values[0])
+
+        self.assertIsNone(newb2.append_items(self.int_block))
+        self.assertIsNone(newb2.append_items(create_block('f4', [7])))
+
     def test_split_block_at(self):
 
         # with dup column support this method was taken out
@@ -372,6 +400,55 @@ class TestBlockManager(tm.TestCase):
                 exp = self.mgr.get(item).values[i]
                 assert_almost_equal(res, exp)
 
+    def test_iget_scalar(self):
+        for i, item in enumerate(self.mgr.items):
+            for j, index in enumerate(self.mgr.axes[1]):
+                res = self.mgr.iget_scalar(i, j)
+                exp = self.mgr.get_scalar((item, index))
+                assert_almost_equal(res, exp)
+
+        mgr = create_mgr('a: category')
+        self.assertEqual(mgr.iget_scalar(0, 2), 2)
+
+    def test_iset_scalar(self):
+        mgr = create_mgr('a: f8; b: i8; c: object; d: category; e: M8[ns]')
+        self.assertTrue(mgr.iset_scalar(0, 1, 1.5))
+        self.assertEqual(mgr.iget_scalar(0, 1), 1.5)
+        self.assertTrue(mgr.iset_scalar(1, -1, 3))
+        self.assertEqual(mgr.iget_scalar(1, 9), 3)
+        self.assertTrue(mgr.iset_scalar(2, 0, 'foo'))
+        self.assertEqual(mgr.iget_scalar(2, 0), 'foo')
+        self.assertTrue(mgr.iset_scalar(4, 0, Timestamp('20130101')))
+        self.assertEqual(mgr.iget_scalar(4, 0),
+                         Timestamp('20130101').to_datetime64())
+
+        # the blocks can't hold the values
+        self.assertFalse(mgr.iset_scalar(1, 1, 1.5))
+        self.assertFalse(mgr.iset_scalar(2, 1, [1, 2]))
+        self.assertFalse(mgr.iset_scalar(3, 1, 'foo'))
+        self.assertEqual(mgr.iget_scalar(1, 1), 0)
+
+    def test_take_pairs(self):
+        items = np.tile(np.arange(len(self.mgr.items)), 3)
+        locs = np.random.randint(0, self.mgr.shape[1], size=len(items))
+        result = self.mgr.take_pairs(items, locs)
+        self.assertEqual(result.dtype, np.object_)
+        for i, (item, loc) in enumerate(zip(items, locs)):
+            assert_almost_equal(result[i], self.mgr.iget_scalar(item, loc))
+
+        # dtype of the blocks holding the pairs only
+        result = self.mgr.take_pairs([0, 4, 2, 6], [1, 2, 3, 4])
+        self.assertEqual(result.dtype, np.float64)
+        self.assertEqual(result[3], self.mgr.iget_scalar(6, 4))
+
+        mgr = create_mgr('a: f8; b: M8[ns]; c: category')
+        result = mgr.take_pairs([1, 1], [2, 0])
+        self.assertEqual(result.dtype, 'M8[ns]')
+        result = mgr.take_pairs([1, 2, 0], [2, 3, 4])
+        self.assertEqual(result[0], Timestamp(mgr.iget_scalar(1, 2)))
+        self.assertEqual(result[1], mgr.iget_scalar(2, 3))
+        self.assertEqual(result[2], mgr.iget_scalar(0, 4))
+
     def test_get(self):
         cols = Index(list('abc'))
         values = np.random.rand(3, 3)
@@ -735,6 +812,185 @@ class TestBlockManager(tm.TestCase):
         self.assertEqual(mgr.as_matrix().tolist(), [0., 1., 2., 3., 4.])
 
 
+class TestCopyOnWrite(tm.TestCase):
+
+    def setUp(self):
+        self.df = DataFrame({'A': np.arange(5.), 'B': np.arange(5.),
+                             'C': list('abcde')})
+
+    def test_copy_is_lazy(self):
+        with pd.option_context('mode.copy_on_write', True):
+            df = self.df
+            df2 = df.copy()
+            for blk, blk2 in zip(df._data.blocks, df2._data.blocks):
+                self.assertIs(blk.values, blk2.values)
+
+            df2.loc[0, 'A'] = 10.
+            self.assertEqual(df2.loc[0, 'A'], 10.)
+            self.assertEqual(df.loc[0, 'A'], 0.)
+
+            # the original is now the only owner of its values
+            df.loc[1, 'A'] = -1.
+            self.assertEqual(df2.loc[1, 'A'], 1.)
+
+            # only the modified block was copied
+            self.assertIs(df._data.blocks[1].values,
+                          df2._data.blocks[1].values)
+
+    def test_copy_on_write_paths(self):
+        with pd.option_context('mode.copy_on_write', True):
+            expected = self.df.copy()
+            expected = DataFrame(dict((k, expected[k].values.copy())
+                                      for k in expected.columns))
+
+            df2 = self.df.copy()
+            df2['A'] = 1.
+            df2.set_value(2, 'B', 100.)
+            df2.iloc[3] = [1., 2., 'x']
+            df2.replace('a', 'z', inplace=True)
+            df2.fillna(0, inplace=True)
+            assert_frame_equal(self.df, expected)
+
+            s = self.df['A'].copy()
+            s[0] = 5.
+            s.set_value(1, 6.)
+            assert_frame_equal(self.df, expected)
+
+            s = self.df['B'].astype('f8')
+            s[:] = 0.
+            assert_frame_equal(self.df, expected)
+
+    def test_views(self):
+        # the columns are written to on purpose
+        with pd.option_context('mode.copy_on_write', True,
+                               'mode.chained_assignment', None):
+            df = self.df
+            col = df['A']
+            df2 = df.copy()
+
+            # a view taken before the copy does not modify the copy, but
+            # still modifies the object it was taken from
+            col[0] = 100.
+            self.assertEqual(df2.loc[0, 'A'], 0.)
+            self.assertEqual(df['A'][0], 100.)
+            self.assertEqual(df.values[0, 0], 100.)
+            self.assertEqual(df.loc[0, 'A'], 100.)
+
+            # the copy keeps its own views
+            col2 = df2['A']
+            df2.loc[2, 'A'] = -2.
+            self.assertEqual(col2[2], -2.)
+            self.assertEqual(df.loc[2, 'A'], 2.)
+            self.assertEqual(col[2], 2.)
+
+            # views of an object that does not share its values see its
+            # modifications
+            df2.loc[0, 'B'] = 7.
+            col2 = df2['B']
+            df2.loc[1, 'B'] = 50.
+            self.assertEqual(col2[1], 50.)
+            self.assertEqual(df.loc[1, 'B'], 1.)
+
+    def test_copies_keep_their_views(self):
+        # the columns are written to on purpose
+        with pd.option_context('mode.copy_on_write', True,
+                               'mode.chained_assignment', None):
+            df = self.df
+            df2 = df.copy()
+            col2 = df2['C']
+            col = df['C']
+
+            # writing to the original detaches the copy together with the
+            # views taken from it
+            df.loc[0, 'C'] = 'z'
+            self.assertEqual(df2.loc[0, 'C'], 'a')
+            self.assertEqual(col2[0], 'a')
+            self.assertEqual(col[0], 'z')
+
+            col2[1] = 'y'
+            self.assertEqual(df2.loc[1, 'C'], 'y')
+            self.assertEqual(df2.values[1, 2], 'y')
+            self.assertEqual(df.loc[1, 'C'], 'b')
+
+    def test_detach_copies_only_the_values(self):
+        with pd.option_context('mode.copy_on_write', True):
+            df = DataFrame(np.random.randn(1000, 4)).iloc[:10].copy()
+            df2 = df.copy()
+            col2 = df2[0]
+            df.iloc[0, 0] = 1.
+
+            # the copy does not keep the values of the large frame alive
+            values = df2._data.blocks[0].values
+            self.assertEqual(values.shape, (4, 10))
+            self.assertIsNone(values.base)
+            self.assertTrue(np.may_share_memory(col2.values, values))
+            self.assertNotEqual(df2.iloc[0, 0], 1.)
+
+    def test_set_value_copies_written_block(self):
+        with pd.option_context('mode.copy_on_write', True):
+            df = self.df
+            df2 = df.copy()
+            df2.set_value(0, 'A', 10.)
+            self.assertEqual(df.loc[0, 'A'], 0.)
+            self.assertEqual(df2.loc[0, 'A'], 10.)
+
+            # the object block is still shared
+            obj = [b for b in df._data.blocks if b.dtype == np.object_][0]
+            obj2 = [b for b in df2._data.blocks if b.dtype == np.object_][0]
+            self.assertIs(obj.values, obj2.values)
+
+    def test_disabled(self):
+        df2 = self.df.copy()
+        for blk, blk2 in zip(self.df._data.blocks, df2._data.blocks):
+            self.assertIsNot(blk.values, blk2.values)
+            self.assertIsNone(blk2._refs)
+
+
+class TestThreadedApply(tm.TestCase):
+
+    def setUp(self):
+        self.df = DataFrame({'A': np.arange(10.), 'B': np.arange(10),
+                             'C': list('abcdefghij'),
+                             'D': np.arange(10.) * 2})
+        self.df.iloc[::3, [0, 3]] = np.nan
+
+    def check(self, f):
+        expected = f(self.df)
+        with pd.option_context('compute.nthreads', 4):
+            result = f(self.df)
+        assert_frame_equal(result, expected)
+
+    def test_apply(self):
+        self.check(lambda df: df.fillna(0))
+        self.check(lambda df: df.astype(object))
+        self.check(lambda df: df.shift(2))
+        # diff and interpolate do not handle the object column
+        self.check(lambda df: df.drop('C', axis=1).diff())
+        self.check(lambda df: df.drop('C', axis=1).interpolate())
+        self.check(lambda df: df.fillna(method='pad'))
+
+    def test_apply_inplace(self):
+        def f(df):
+            df = df.copy()
+            df.fillna(0, inplace=True)
+            return df
+        self.check(f)
+
+    def test_split_blocks(self):
+        df = DataFrame(np.random.randn(100, 10))
+        df.iloc[::2] = np.nan
+
+        orig = internals._apply_split_size
+        internals._apply_split_size = 100
+        try:
+            with pd.option_context('compute.nthreads', 4):
+                result = df.fillna(0)
+                self.assertEqual(result._data.nblocks, 1)
+                assert_frame_equal(result, df.fillna(0))
+        finally:
+            internals._apply_split_size = orig
+
+
 class TestIndexing(object):
     # Nosetests-style data-driven tests.
     #
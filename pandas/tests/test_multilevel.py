@@ -19,8 +19,6 @@ from pandas.compat import (range, lrange, StringIO, lzip, u,
                                 product as cart_product, zip)
 import pandas as pd
 
-import pandas.index as _index
-
 
 class TestMultiLevel(tm.TestCase):
 
@@ -1992,12 +1990,9 @@ Thur,Lunch,Yes,51.51,17"""
 
         self.assertTrue((df.xs((1, 1))['C'] == '_').all())
 
-    def test_indexing_over_hashtable_size_cutoff(self):
+    def test_indexing_monotonic(self):
         n = 10000
 
-        old_cutoff = _index._SIZE_CUTOFF
-        _index._SIZE_CUTOFF = 20000
-
         s = Series(np.arange(n),
                    MultiIndex.from_arrays((["a"] * n, np.arange(n))))
 
@@ -2006,8 +2001,6 @@ Thur,Lunch,Yes,51.51,17"""
         self.assertEqual(s[("a", 6)], 6)
         self.assertEqual(s[("a", 7)], 7)
 
-        _index._SIZE_CUTOFF = old_cutoff
-
     def test_multiindex_na_repr(self):
         # only an issue with long columns
 
@@ -945,7 +945,13 @@ class TestPanel(tm.TestCase, PanelTests, CheckIndexing,
     def test_consolidate(self):
         self.assertTrue(self.panel._data.is_consolidated())
 
+        # stored in the existing float block
         self.panel['foo'] = 1.
+        self.assertTrue(self.panel._data.is_consolidated())
+        self.assertEqual(self.panel._data.nblocks, 1)
+
+        self.panel['bar'] = 'a'
+        self.panel['foo'] = 'b'
         self.assertFalse(self.panel._data.is_consolidated())
 
         panel = self.panel.consolidate()
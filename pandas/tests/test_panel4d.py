@@ -617,7 +617,13 @@ class TestPanel4d(tm.TestCase, CheckIndexing, SafeForSparse,
     def test_consolidate(self):
         self.assertTrue(self.panel4d._data.is_consolidated())
 
+        # stored in the existing float block
         self.panel4d['foo'] = 1.
+        self.assertTrue(self.panel4d._data.is_consolidated())
+        self.assertEqual(self.panel4d._data.nblocks, 1)
+
+        self.panel4d['bar'] = 'a'
+        self.panel4d['foo'] = 'b'
         self.assertFalse(self.panel4d._data.is_consolidated())
 
         panel4d = self.panel4d.consolidate()
@@ -963,9 +963,7 @@ class _Concatenator(object):
             indexes = [x._data.axes[self.axis] for x in self.objs]
 
         if self.ignore_index:
-            idx = Index(np.arange(sum(len(i) for i in indexes)))
-            idx.is_unique = True
-            return idx
+            return com._default_index(sum(len(i) for i in indexes))
 
         if self.keys is None:
             concat_axis = _concat_indexes(indexes)
@@ -105,6 +105,8 @@ def _ensure_datetime64(other):
 
 _midnight = time(0, 0)
 
+_DAY_NANOS = 86400 * 1000000000
+
 def _new_DatetimeIndex(cls, d):
     """ This is called upon unpickling, rather than the default which doesn't have arguments
         and breaks __new__ """
@@ -709,7 +711,42 @@ class DatetimeIndex(DatetimeIndexOpsMixin, Int64Index):
         values = self.asi8
         if self.tz is not None and self.tz is not utc:
             values = self._local_timestamps()
-        return tslib.get_time_micros(values)
+        # the time of day is the remainder of the stamps by a day
+        return (values % _DAY_NANOS) // 1000
+
+    def _time_window_indexer(self, lo, hi):
+        """
+        Positions of the values whose time of day, in nanoseconds, is in
+        [lo, hi) (or, if hi <= lo, is not in [hi, lo)), by searching the
+        sorted stamps for the window of every day. None if the stamps are not
+        sorted (or not sorted in local time).
+        """
+        if not self.is_monotonic or (self.tz is not None and
+                                     self.tz is not _utc()):
+            return None
+
+        stamps = self.asi8
+        if not len(stamps):
+            return np.array([], dtype=np.int64)
+        if stamps[0] == tslib.iNaT:
+            return None
+
+        first = stamps[0] - stamps[0] % _DAY_NANOS
+        if hi <= lo:
+            # the windows run into the next day, starting with the one of the
+            # day before the first stamp
+            hi += _DAY_NANOS
+            first -= _DAY_NANOS
+
+        days = np.arange(first, stamps[-1] + 1, _DAY_NANOS, dtype=np.int64)
+        left = stamps.searchsorted(days + lo, side='left')
+        right = stamps.searchsorted(days + hi, side='left')
+
+        # concatenate the ranges left[i]:right[i]
+        lengths = np.maximum(right - left, 0)
+        ends = lengths.cumsum()
+        return (np.arange(ends[-1] if len(ends) else 0, dtype=np.int64) +
+                np.repeat(left - (ends - lengths), lengths))
 
     def to_series(self, keep_tz=False):
         """
@@ -1029,6 +1066,11 @@ class DatetimeIndex(DatetimeIndexOpsMixin, Int64Index):
             for v in converted:
                 yield v
 
+    def _can_merge_setop(self, other):
+        # the i8 values of different timezones are not comparable
+        return (getattr(other, 'tz', None) == self.tz and
+                super(DatetimeIndex, self)._can_merge_setop(other))
+
     def _wrap_union_result(self, other, result):
         name = self.name if self.name == other.name else None
         if self.tz != other.tz:
@@ -1281,7 +1323,11 @@ class DatetimeIndex(DatetimeIndexOpsMixin, Int64Index):
             if result.ndim > 1:
                 return result
 
-            return self._simple_new(result, self.name, new_offset, self.tz)
+            result = self._simple_new(result, self.name, new_offset, self.tz)
+            if isinstance(key, slice) and (key.step is None or key.step > 0):
+                # a slice of sorted stamps is sorted, no need to check again
+                result._engine.set_monotonic_from(self._engine)
+            return result
 
     # alias to offset
     def _get_freq(self):
@@ -1384,6 +1430,12 @@ class DatetimeIndex(DatetimeIndexOpsMixin, Int64Index):
 
     @cache_readonly
     def _resolution(self):
+        offset = self.offset
+        if (isinstance(offset, Tick) and offset.nanos % 1000 == 0 and
+                (self.tz is None or self.tz is _utc())):
+            # the stamps of a regular range are the first plus multiples of
+            # the offset, they have the resolution of the first two stamps
+            return tslib.resolution(self.asi8[:2], self.tz)
         return tslib.resolution(self.asi8, self.tz)
 
     def equals(self, other):
@@ -1579,8 +1631,13 @@ class DatetimeIndex(DatetimeIndexOpsMixin, Int64Index):
             # TODO
             raise NotImplementedError
 
-        time_micros = self._get_time_micros()
         micros = _time_to_micros(time)
+        indexer = self._time_window_indexer(micros * 1000,
+                                            (micros + 1) * 1000)
+        if indexer is not None:
+            return indexer
+
+        time_micros = self._get_time_micros()
         return (micros == time_micros).nonzero()[0]
 
     def indexer_between_time(self, start_time, end_time, include_start=True,
@@ -1611,10 +1668,21 @@ class DatetimeIndex(DatetimeIndexOpsMixin, Int64Index):
         if start_time.tzinfo or end_time.tzinfo:
             raise NotImplementedError
 
-        time_micros = self._get_time_micros()
         start_micros = _time_to_micros(start_time)
         end_micros = _time_to_micros(end_time)
 
+        # the times of day in [lo, hi) in nanoseconds (or not in [hi, lo),
+        # wrapping around midnight)
+        lo = 1000 * (start_micros if include_start else start_micros + 1)
+        hi = 1000 * (end_micros + 1 if include_end else end_micros)
+        if start_time <= end_time and lo >= hi:
+            return np.array([], dtype=np.int64)
+        indexer = self._time_window_indexer(lo, hi)
+        if indexer is not None:
+            return indexer
+
+        time_micros = self._get_time_micros()
+
         if include_start and include_end:
             lop = rop = operator.le
         elif include_start:
@@ -1089,6 +1089,11 @@ class PeriodIndex(DatetimeIndexOpsMixin, Int64Index):
             raise ValueError('Only like-indexed PeriodIndexes compatible '
                              'for join (for now)')
 
+    def _can_merge_setop(self, other):
+        # ordinals are only comparable with the same freq
+        return (isinstance(other, PeriodIndex) and self.freq == other.freq and
+                super(PeriodIndex, self)._can_merge_setop(other))
+
     def _wrap_union_result(self, other, result):
         name = self.name if self.name == other.name else None
         result = self._apply_meta(result)
@@ -141,6 +141,20 @@ class TestResample(tm.TestCase):
                 exc.args += ('how=%s' % arg,)
                 raise
 
+    def test_resample_quantile(self):
+        rng = date_range('1/1/2000', periods=60, freq='min')
+        s = Series(np.random.randn(60), index=rng)
+        s[10:20] = np.nan
+
+        result = s.resample('5min', how='quantile')
+        expected = s.resample('5min', how='median')
+        assert_series_equal(result, expected)
+
+        df = DataFrame({'A': s, 'B': np.arange(60)})
+        result = df.resample('5min', how='quantile')
+        expected = df.resample('5min', how='median')
+        assert_frame_equal(result, expected)
+
     def test_resample_how_callables(self):
         # GH 7929
         data = np.arange(5, dtype=np.int64)
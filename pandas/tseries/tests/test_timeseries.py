@@ -25,7 +25,6 @@ from pandas.tslib import NaT, iNaT
 import pandas.lib as lib
 import pandas.tslib as tslib
 
-import pandas.index as _index
 
 from pandas.compat import range, long, StringIO, lrange, lmap, zip, product, PY3_2
 from numpy.random import rand
@@ -156,45 +155,39 @@ class TestTimeSeriesDuplicates(tm.TestCase):
         expected = self.dups.groupby(self.dups.index).mean()
         assert_series_equal(result, expected)
 
-    def test_indexing_over_size_cutoff(self):
+    def test_indexing_monotonic_duplicates(self):
         import datetime
         # #1821
 
-        old_cutoff = _index._SIZE_CUTOFF
-        try:
-            _index._SIZE_CUTOFF = 1000
-
-            # create large list of non periodic datetime
-            dates = []
-            sec = datetime.timedelta(seconds=1)
-            half_sec = datetime.timedelta(microseconds=500000)
-            d = datetime.datetime(2011, 12, 5, 20, 30)
-            n = 1100
-            for i in range(n):
-                dates.append(d)
-                dates.append(d + sec)
-                dates.append(d + sec + half_sec)
-                dates.append(d + sec + sec + half_sec)
-                d += 3 * sec
-
-            # duplicate some values in the list
-            duplicate_positions = np.random.randint(0, len(dates) - 1, 20)
-            for p in duplicate_positions:
-                dates[p + 1] = dates[p]
-
-            df = DataFrame(np.random.randn(len(dates), 4),
-                           index=dates,
-                           columns=list('ABCD'))
-
-            pos = n * 3
-            timestamp = df.index[pos]
-            self.assertIn(timestamp, df.index)
-
-            # it works!
-            df.ix[timestamp]
-            self.assertTrue(len(df.ix[[timestamp]]) > 0)
-        finally:
-            _index._SIZE_CUTOFF = old_cutoff
+        # create large list of non periodic datetime
+        dates = []
+        sec = datetime.timedelta(seconds=1)
+        half_sec = datetime.timedelta(microseconds=500000)
+        d = datetime.datetime(2011, 12, 5, 20, 30)
+        n = 1100
+        for i in range(n):
+            dates.append(d)
+            dates.append(d + sec)
+            dates.append(d + sec + half_sec)
+            dates.append(d + sec + sec + half_sec)
+            d += 3 * sec
+
+        # duplicate some values in the list
+        duplicate_positions = np.random.randint(0, len(dates) - 1, 20)
+        for p in duplicate_positions:
+            dates[p + 1] = dates[p]
+
+        df = DataFrame(np.random.randn(len(dates), 4),
+                       index=dates,
+                       columns=list('ABCD'))
+
+        pos = n * 3
+        timestamp = df.index[pos]
+        self.assertIn(timestamp, df.index)
+
+        # it works!
+        df.ix[timestamp]
+        self.assertTrue(len(df.ix[[timestamp]]) > 0)
 
     def test_indexing_unordered(self):
 
@@ -1362,6 +1355,34 @@ class TestTimeSeries(tm.TestCase):
                 else:
                     self.assertTrue((t < etime) or (t >= stime))
 
+    def test_between_time_unsorted(self):
+        # the windows searched in sorted stamps match the times of day of the
+        # unsorted stamps
+        start = Timestamp('2000-01-01').value
+        stamps = start + (rand(1000) * 10 * 86400 * 1e9).astype(np.int64)
+        stamps[::10] -= stamps[::10] % (60 * 10 ** 9)
+        rng = DatetimeIndex(np.sort(stamps))
+        ts = Series(np.arange(len(rng)), index=rng)
+        unsorted = ts.take(np.random.permutation(len(ts)))
+        self.assertFalse(unsorted.index.is_monotonic)
+
+        close_open = list(product([True, False], [True, False]))
+        times = [(time(9, 30), time(16, 0)), (time(22, 0), time(2, 0)),
+                 (time(12, 0), time(12, 0)), (time(0, 0), time(23, 59)),
+                 (time(12, 0, 0, 1), time(12, 0))]
+        for (stime, etime), (inc_start, inc_end) in product(times,
+                                                            close_open):
+            result = ts.between_time(stime, etime, inc_start, inc_end)
+            expected = unsorted.between_time(stime, etime, inc_start,
+                                             inc_end).order()
+            assert_series_equal(result, expected)
+
+        for t in [time(9, 30), time(0, 0), stamps[10]]:
+            if not isinstance(t, time):
+                t = Timestamp(t).time()
+            assert_series_equal(ts.at_time(t),
+                                unsorted.at_time(t).order())
+
     def test_between_time_frame(self):
         rng = date_range('1/1/2000', '1/5/2000', freq='5min')
         ts = DataFrame(np.random.randn(len(rng), 2), index=rng)
@@ -2075,6 +2096,30 @@ class TestDatetimeIndex(tm.TestCase):
         df=DataFrame(lrange(10),index=idx)
         df["2013-01-14 23:44:34.437768-05:00":] # no exception here
 
+    def test_resolution_regular(self):
+        # found from the first two stamps of regular ranges
+        for start, freq in [('2000-01-01 09:30', 'T'), ('2000-01-01', '90s'),
+                            ('2000-01-01 00:00:00.5', 'H'),
+                            ('2000-01-01', 'D'), ('2000-01-01', '250L'),
+                            ('2000-01-01 12:00', 'D')]:
+            for periods in [1, 2, 100]:
+                rng = date_range(start, periods=periods, freq=freq)
+                self.assertEqual(rng._resolution,
+                                 tslib.resolution(rng.asi8, None))
+
+    def test_slice_keeps_monotonic(self):
+        rng = date_range('2000-01-01', periods=100, freq='T')
+        self.assertTrue(rng.is_monotonic)
+        self.assertTrue(rng[10:50].is_monotonic)
+        self.assertTrue(rng[10:50].is_unique)
+        self.assertTrue(rng[::3].is_monotonic)
+        self.assertFalse(rng[::-1].is_monotonic)
+        self.assertFalse(rng[50:10:-1].is_monotonic)
+
+        rng = DatetimeIndex(['2000-01-02', '2000-01-01', '2000-01-03'])
+        self.assertFalse(rng.is_monotonic)
+        self.assertTrue(rng[1:].is_monotonic)
+
     def test_append_join_nondatetimeindex(self):
         rng = date_range('1/1/2000', periods=10)
         idx = Index(['a', 'b', 'c', 'd'])
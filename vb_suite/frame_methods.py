@@ -24,6 +24,24 @@ frame_fancy_lookup_all = Benchmark('df.lookup(row_labels_all, col_labels_all)',
                                    setup,
                                    start_date=datetime(2012, 1, 12))
 
+setup = common_setup + """
+N = 100000
+df = DataFrame({'a': np.random.randn(N), 'b': np.arange(N),
+                'c': np.random.randn(N).astype('float32'),
+                'd': 'foo', 'e': date_range('20000101', periods=N, freq='s')})
+row_labels = np.random.randint(0, N, size=1000000)
+col_labels = np.array(list('abcde'), dtype=object).take(
+    np.random.randint(0, 5, size=1000000))
+numeric_col_labels = np.array(list('abc'), dtype=object).take(
+    np.random.randint(0, 3, size=1000000))
+"""
+
+frame_fancy_lookup_mixed = Benchmark('df.lookup(row_labels, col_labels)',
+                                     setup, start_date=datetime(2014, 10, 1))
+frame_fancy_lookup_mixed_numeric = Benchmark(
+    'df.lookup(row_labels, numeric_col_labels)', setup,
+    start_date=datetime(2014, 10, 1))
+
 #----------------------------------------------------------------------
 # fillna in place
 
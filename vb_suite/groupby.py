@@ -78,6 +78,14 @@ groupby_frame_singlekey_integer = \
     Benchmark('df.groupby(labels).sum()', setup,
               start_date=datetime(2011, 8, 1), logy=True)
 
+groupby_frame_singlekey_cumsum = \
+    Benchmark('df.groupby(labels).cumsum()', setup,
+              start_date=datetime(2014, 10, 1))
+
+groupby_frame_singlekey_shift = \
+    Benchmark('df.groupby(labels).shift()', setup,
+              start_date=datetime(2014, 10, 1))
+
 #----------------------------------------------------------------------
 # group with different functions per column
 
@@ -291,6 +299,26 @@ groupby_nth_object_none = Benchmark('df.groupby("b").nth(0)', setup,
 groupby_nth_object_any = Benchmark('df.groupby("b").nth(0,dropna="any")', setup,
                                    start_date=datetime(2013, 5, 1))
 
+#----------------------------------------------------------------------
+# distinct values per group
+
+setup = common_setup + """
+n = 100000
+users = np.array(['user_%d' % i for i in range(5000)], dtype=object)
+df = DataFrame({'account': np.random.randint(0, 1000, size=n),
+                'user': users.take(np.random.randint(0, 5000, size=n))})
+"""
+
+groupby_series_nunique_object = \
+    Benchmark("df.groupby('account')['user'].nunique()", setup,
+              start_date=datetime(2014, 10, 1))
+groupby_series_value_counts_object = \
+    Benchmark("df.groupby('account')['user'].value_counts()", setup,
+              start_date=datetime(2014, 10, 1))
+groupby_series_unique_object = \
+    Benchmark("df.groupby('account')['user'].unique()", setup,
+              start_date=datetime(2014, 10, 1))
+
 #----------------------------------------------------------------------
 # groupby_indices replacement, chop up Series
 
@@ -455,6 +483,22 @@ df=DataFrame( { 'id' : np.arange( 100000 ) / 3,
 
 groupby_transform_series2 = Benchmark("df.groupby('id')['val'].transform(np.mean)", setup)
 
+setup = common_setup + """
+np.random.seed(0)
+
+n = 100000
+df = DataFrame({'key': np.random.randint(0, 1000, n),
+                'ival': np.random.randint(0, 100, n),
+                'fval': np.random.randn(n),
+                'fval2': np.random.randn(n)})
+"""
+
+groupby_transform_frame_mean = Benchmark("df.groupby('key').transform('mean')",
+                                         setup, start_date=datetime(2014, 10, 1))
+groupby_transform_frame_demean = \
+    Benchmark("df - df.groupby('key').transform(np.mean)", setup,
+              start_date=datetime(2014, 10, 1))
+
 setup = common_setup + '''
 np.random.seed(2718281)
 n = 20000
@@ -512,8 +556,10 @@ no_arg_func_list = [
     'nunique',
     'pct_change',
     'prod',
+    'quantile',
     'rank',
     'sem',
+    'shift',
     'size',
     'skew',
     'std',
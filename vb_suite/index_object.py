@@ -47,6 +47,38 @@ index_int64_union = Benchmark('left.union(right)', setup,
 index_int64_intersection = Benchmark('left.intersection(right)', setup,
                                      start_date=datetime(2011, 1, 1))
 
+# sorted integers, floats and MultiIndex
+setup = common_setup + """
+N = 1000000
+options = np.arange(N)
+
+left = Index(np.sort(options.take(np.random.permutation(N)[:N // 2])))
+right = Index(np.sort(options.take(np.random.permutation(N)[:N // 2])))
+fleft = left.astype(float)
+fright = right.astype(float)
+
+mi = MultiIndex.from_product([np.arange(1000), np.arange(1000)])
+mleft = mi[:N // 2]
+mright = mi[N // 4:]
+"""
+
+index_int64_sorted_union = Benchmark('left.union(right)', setup,
+                                     start_date=datetime(2014, 9, 1))
+
+index_int64_sorted_difference = Benchmark('left.difference(right)', setup,
+                                          start_date=datetime(2014, 9, 1))
+
+index_float64_sorted_intersection = Benchmark('fleft.intersection(fright)',
+                                              setup,
+                                              start_date=datetime(2014, 9, 1))
+
+multiindex_sorted_union = Benchmark('mleft.union(mright)', setup,
+                                    start_date=datetime(2014, 9, 1))
+
+multiindex_sorted_intersection = Benchmark('mleft.intersection(mright)',
+                                           setup,
+                                           start_date=datetime(2014, 9, 1))
+
 #----------------------------------------------------------------------
 # string index slicing
 setup = common_setup + """
@@ -117,3 +149,29 @@ iterables = [tm.makeStringIndex(10000), xrange(20)]
 multiindex_from_product = Benchmark('MultiIndex.from_product(iterables)',
                                     setup, name='multiindex_from_product',
                                     start_date=datetime(2014, 6, 30))
+
+#----------------------------------------------------------------------
+# CategoricalIndex
+
+setup = common_setup + """
+N = 1000000
+labels = np.array(['label_%d' % i for i in range(100)], dtype=object)
+values = labels.take(np.random.randint(0, 100, size=N))
+idx = Index(values)
+cat_idx = CategoricalIndex(values)
+sorted_cat_idx = CategoricalIndex(np.sort(values))
+target = labels[:50]
+"""
+
+index_categorical_get_loc = Benchmark("cat_idx.get_loc('label_5')", setup,
+                                      start_date=datetime(2014, 10, 1))
+index_categorical_get_loc_sorted = Benchmark(
+    "sorted_cat_idx.get_loc('label_5')", setup,
+    start_date=datetime(2014, 10, 1))
+index_object_get_loc_non_unique = Benchmark("idx.get_loc('label_5')", setup,
+                                            start_date=datetime(2014, 10, 1))
+index_categorical_get_indexer_non_unique = Benchmark(
+    "cat_idx.get_indexer_non_unique(target)", setup,
+    start_date=datetime(2014, 10, 1))
+index_categorical_eq = Benchmark("cat_idx == 'label_5'", setup,
+                                 start_date=datetime(2014, 10, 1))
@@ -100,6 +100,30 @@ indexing_frame_get_value = Benchmark("df.get_value(idx,col)", setup,
                                      name='indexing_frame_get_value',
                                      start_date=datetime(2011, 11, 12))
 
+indexing_frame_at_get = Benchmark("df.at[idx, col]", setup,
+                                  name='indexing_frame_at_get',
+                                  start_date=datetime(2014, 9, 1))
+
+indexing_frame_iat_get = Benchmark("df.iat[100, 10]", setup,
+                                   name='indexing_frame_iat_get',
+                                   start_date=datetime(2014, 9, 1))
+
+indexing_frame_at_set = Benchmark("df.at[idx, col] = 1.5", setup,
+                                  name='indexing_frame_at_set',
+                                  start_date=datetime(2014, 9, 1))
+
+indexing_frame_iat_set = Benchmark("df.iat[100, 10] = 1.5", setup,
+                                   name='indexing_frame_iat_set',
+                                   start_date=datetime(2014, 9, 1))
+
+indexing_frame_loc_get_scalar = Benchmark("df.loc[idx, col]", setup,
+                                          name='indexing_frame_loc_get_scalar',
+                                          start_date=datetime(2014, 9, 1))
+
+indexing_frame_loc_set_scalar = Benchmark("df.loc[idx, col] = 1.5", setup,
+                                          name='indexing_frame_loc_set_scalar',
+                                          start_date=datetime(2014, 9, 1))
+
 setup = common_setup + """
 mi = MultiIndex.from_tuples([(x,y) for x in range(1000) for y in range(1000)])
 s =  Series(np.random.randn(1000000), index=mi)
@@ -211,3 +235,18 @@ df = DataFrame(dict( A = [ 'foo'] * 1000000))
 
 frame_iloc_big = Benchmark('df.iloc[:100,0]', setup,
                             start_date=datetime(2013, 1, 1))
+
+#----------------------------------------------------------------------
+# setting on a copy derived from another frame (SettingWithCopy checks)
+
+setup = common_setup + """
+import warnings
+from pandas.core.common import SettingWithCopyWarning
+warnings.simplefilter('ignore', SettingWithCopyWarning)
+df = DataFrame(np.random.randn(1000, 2), columns=['A', 'B'])
+df['C'] = 'foo'
+sub = df[df.A > 0]
+"""
+
+frame_setitem_on_copy = Benchmark("sub['D'] = 1.", setup,
+                                  start_date=datetime(2014, 10, 1))
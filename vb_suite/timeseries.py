@@ -269,6 +269,10 @@ dataframe_resample_max_string = \
 dataframe_resample_max_numpy = \
     Benchmark("df.resample('1s', how=np.max)", setup)
 
+dataframe_resample_quantile_string = \
+    Benchmark("df.resample('1s', how='quantile')", setup,
+              start_date=datetime(2014, 10, 1))
+
 
 #----------------------------------------------------------------------
 # DatetimeConverter
@@ -358,3 +362,24 @@ timeseries_iter_datetimeindex_preexit = Benchmark('iter_n(idx1, M)', setup)
 
 timeseries_iter_periodindex_preexit = Benchmark('iter_n(idx2, M)', setup)
 
+
+#----------------------------------------------------------------------
+# partial string and time of day selection
+
+setup = common_setup + """
+rng = date_range('1/1/2014', periods=365 * 24 * 3600, freq='s')
+ts = Series(np.random.randn(len(rng)), index=rng)
+"""
+
+timeseries_partial_string_month = Benchmark("ts['2014-03']", setup,
+                                            start_date=datetime(2014, 9, 1))
+
+timeseries_partial_string_range = Benchmark(
+    "ts['2014-03-01 09:30':'2014-03-01 16:00']", setup,
+    start_date=datetime(2014, 9, 1))
+
+timeseries_between_time = Benchmark("ts.between_time('09:30', '16:00')",
+                                    setup, start_date=datetime(2014, 9, 1))
+
+timeseries_at_time = Benchmark("ts.at_time('09:30')", setup,
+                               start_date=datetime(2014, 9, 1))